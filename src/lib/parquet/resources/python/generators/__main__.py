@@ -0,0 +1,246 @@
+"""Generate parquet test data.
+
+Examples:
+    python -m generators
+    python -m generators primitives orders --profile L --compression ZSTD --seed 42
+    python -m generators orders --rows 1000000 --row-group-size 50000 --out-dir /tmp/fixtures
+    python -m generators orders --profile XL --workers 32
+    python -m generators orders --profile XL --workers 32 --shards 64
+    python -m generators orders --profile M --codec-matrix
+    python -m generators primitives orders --profile M --encoding-matrix
+    python -m generators primitives lists --nulls runs:0.1:1000 --column-nulls int32_nullable=bernoulli:0.01
+    python -m generators null_sweep --profile L
+    python -m generators orders --profile M --row-group-size 5000 --layouts --predicate "total_price < 60"
+    python -m generators primitives --page-index --bloom-filter string --predicate "int64 < 1000" --predicate "string == string_42"
+    python -m generators orders --profile M --granularity-sweep --page-sizes 8192 1048576 --row-group-sizes 10000 100000
+    python -m generators orders --profile M --encryption --encrypted-columns customer.email
+    python -m generators orders primitives --profile M --twins csv jsonl xml arrow
+    python -m generators orders --profile L --partition-by date=created_at:date --partition-by address.country --files-per-partition 4
+"""
+import argparse
+import os
+import time
+from functools import partial
+from glob import glob
+
+from generators import cache, checksums, codecs, encodings, encryption, granularity, layouts, partitions, predicates, shards, tables, twins
+from generators.datasets import DATASETS, DEFAULT_SEED, PROFILES, batches, dataset
+from generators.nulls import DEFAULT_NULLS, NullPolicy, Nulls, field_paths, parse_override
+from generators.writer import DEFAULT_ROW_GROUP_SIZE, write_batches
+
+COMPRESSIONS = ['NONE', 'SNAPPY', 'GZIP', 'BROTLI', 'LZ4_RAW', 'ZSTD']
+UNCACHED_ARGUMENTS = ('datasets', 'profile', 'rows', 'row_group_size', 'page_size', 'out_dir', 'workers', 'cache_dir', 'no_cache', 'clear_cache', 'max_cache_size')
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m generators', description='Generate parquet test data.')
+    # every mode writes its own variants of a dataset, so only one of them can be used at a time
+    modes = parser.add_mutually_exclusive_group()
+    parser.add_argument('datasets', nargs='*', metavar='dataset', help=f'datasets to generate, all by default ({", ".join(DATASETS)})')
+    parser.add_argument('--profile', choices=PROFILES, type=str.upper, help='named size profile, explicit options take precedence')
+    parser.add_argument('--rows', type=int, help='number of rows, dataset default when omitted')
+    parser.add_argument('--row-group-size', type=int, help=f'rows per row group (default: {DEFAULT_ROW_GROUP_SIZE})')
+    parser.add_argument('--page-size', type=int, help='data page size in bytes')
+    parser.add_argument('--compression', choices=COMPRESSIONS, type=str.upper, default='SNAPPY', help='compression codec (default: SNAPPY)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'random seed, the same seed always produces the same files (default: {DEFAULT_SEED})')
+    parser.add_argument('--nulls', type=Nulls.parse, default=DEFAULT_NULLS.default, help='null pattern of nullable columns, "alternating", "bernoulli:<ratio>" or "runs:<ratio>:<mean run length>" (default: alternating)')
+    parser.add_argument('--column-nulls', action='append', type=parse_override, metavar='COLUMN=PATTERN', help='null pattern of a single column, nested fields are named by path, can be repeated')
+    parser.add_argument('--out-dir', default='output', help='output directory (default: output)')
+    parser.add_argument('--workers', type=int, default=1, help='number of generating processes (default: 1)')
+    modes.add_argument('--shards', type=int, help='write every dataset as this many <dataset>-<shard>.parquet files instead of a single file')
+    parser.add_argument('--cache-dir', help='directory of cached files (default: <out-dir>/.cache)')
+    parser.add_argument('--no-cache', action='store_true', help='always generate files, even when cached ones are available')
+    parser.add_argument('--clear-cache', action='store_true', help='remove every cached file before generating')
+    parser.add_argument('--max-cache-size', type=int, default=cache.DEFAULT_MAX_SIZE, metavar='BYTES', help=f'least recently used cache entries are removed once the cache grows over this size (default: {cache.DEFAULT_MAX_SIZE})')
+    parser.add_argument('--checksums', action='store_true', help='write <file>.checksums.json sidecar with per row group and column digests next to every parquet file')
+    parser.add_argument('--twins', nargs='+', choices=twins.FORMATS, metavar='FORMAT', help=f'write <file>.<format> twins with the same rows next to every parquet file ({", ".join(twins.FORMATS)}) and <file>.twins.json with their sizes')
+    modes.add_argument('--codec-matrix', action='store_true', help='write every dataset once per compression codec and level into <out-dir>/codecs, with a manifest of sizes and timings')
+    parser.add_argument('--page-index', action='store_true', help='write column and offset indexes')
+    parser.add_argument('--max-rows-per-page', type=int, help='maximum number of rows in a data page (pyarrow default: 20000)')
+    parser.add_argument('--bloom-filter', dest='bloom_filters', action='append', metavar='COLUMN', help='write bloom filters of given column path, can be repeated')
+    parser.add_argument('--bloom-filter-fpp', type=float, default=0.05, help='false positive probability of bloom filters (default: 0.05)')
+    parser.add_argument('--predicate', dest='predicates', action='append', type=predicates.Predicate.parse, help='write <file>.predicates.json with row groups and pages the "<column> <operator> <value>" predicate should skip, can be repeated')
+    modes.add_argument('--layouts', action='store_true', help=f'write every dataset once per row layout ({", ".join(layouts.LAYOUTS)}) into <out-dir>/layouts, with a manifest of row group statistics')
+    parser.add_argument('--sort-key', help='column of the sorted layout (default: first numeric column)')
+    parser.add_argument('--time-key', help='timestamp column of the clustered layout (default: first timestamp column)')
+    parser.add_argument('--bucket-seconds', type=int, default=layouts.DEFAULT_BUCKET_SECONDS, help=f'time bucket of the clustered layout (default: {layouts.DEFAULT_BUCKET_SECONDS})')
+    parser.add_argument('--zorder-keys', nargs=2, metavar='COLUMN', help='columns of the zorder layout (default: sort key and time key)')
+    modes.add_argument('--encoding-matrix', action='store_true', help='write every dataset once per encoding and data page version into <out-dir>/encodings, with a manifest of used encodings, sizes and timings')
+    modes.add_argument('--partition-by', dest='partition_keys', action='append', type=partitions.PartitionKey.parse, metavar='[NAME=]COLUMN[:TRANSFORM]', help=f'write every dataset as a Hive partitioned directory <out-dir>/partitioned/<dataset>, timestamps can be truncated ({", ".join(partitions.TRANSFORMS)}), can be repeated')
+    parser.add_argument('--files-per-partition', type=int, default=1, help='number of files every partition is split into (default: 1)')
+    parser.add_argument('--max-rows-per-file', type=int, help='maximum number of rows of a partitioned file, longer files are split')
+    modes.add_argument('--encryption', action='store_true', help=f'write every dataset unencrypted and once per encryption algorithm ({", ".join(encryption.ALGORITHMS)}) with encrypted and plaintext footer into <out-dir>/encryption, with a manifest of sizes and timings')
+    parser.add_argument('--encrypted-columns', nargs='+', metavar='COLUMN', help='column paths encrypted with their own column key, all columns are encrypted with the footer key when omitted')
+    modes.add_argument('--granularity-sweep', action='store_true', help='write every dataset once per data page size and row group size into <out-dir>/granularity, with a manifest of page counts, footer sizes and timings')
+    parser.add_argument('--page-sizes', type=int, nargs='+', default=granularity.DEFAULT_PAGE_SIZES, help=f'data page sizes in bytes of the granularity sweep (default: {" ".join(map(str, granularity.DEFAULT_PAGE_SIZES))})')
+    parser.add_argument('--row-group-sizes', type=int, nargs='+', default=granularity.DEFAULT_ROW_GROUP_SIZES, help=f'rows per row group of the granularity sweep (default: {" ".join(map(str, granularity.DEFAULT_ROW_GROUP_SIZES))})')
+
+    return parser
+
+
+def generate(args: argparse.Namespace, name: str, n_rows: int, row_group_size: int, page_size: int | None, out_dir: str) -> list[str]:
+    """Write dataset files into out_dir, returns paths of written parquet files."""
+    path = os.path.join(out_dir, f'{name}.parquet')
+    options = {'compression': args.compression, 'data_page_size': page_size, 'write_page_index': args.page_index, 'max_rows_per_page': args.max_rows_per_page}
+    if args.bloom_filters:
+        # every row group holds at most row_group_size distinct values
+        options['bloom_filter_options'] = {column: {'ndv': row_group_size, 'fpp': args.bloom_filter_fpp} for column in args.bloom_filters}
+
+    nulls = NullPolicy(args.nulls, dict(args.column_nulls or []))
+    source = partial(shards.parallel_batches, workers=args.workers, nulls=nulls) if args.workers > 1 else partial(batches, nulls=nulls)
+    # variants share rows generated once into a memory mapped Arrow IPC file
+    parameters = {'dataset': name, 'rows': n_rows, 'row_group_size': row_group_size, 'seed': args.seed, 'nulls': str(nulls)}
+    variant_source = partial(
+        tables.cached_batches,
+        tables.table_path(args.cache_dir or os.path.join(args.out_dir, '.cache'), parameters),
+        dataset(name).schema,
+        partial(source, name, n_rows, row_group_size, seed=args.seed),
+        args.no_cache,
+    )
+
+    if args.codec_matrix:
+        codecs.write_matrix(name, dataset(name).schema, variant_source(), out_dir, **options)
+        paths = sorted(glob(os.path.join(out_dir, 'codecs', f'{name}.*.parquet')))
+    elif args.layouts:
+        layouts.write_layouts(
+            name,
+            dataset(name).schema,
+            variant_source(),
+            out_dir,
+            row_group_size,
+            args.seed,
+            sort_key=args.sort_key,
+            time_key=args.time_key,
+            zorder_keys=args.zorder_keys and tuple(args.zorder_keys),
+            bucket_seconds=args.bucket_seconds,
+            conditions=args.predicates or [],
+            **options,
+        )
+        paths = sorted(glob(os.path.join(out_dir, 'layouts', f'{name}.*.parquet')))
+    elif args.encoding_matrix:
+        encodings.write_matrix(name, dataset(name).schema, variant_source(), out_dir, **options)
+        paths = sorted(glob(os.path.join(out_dir, 'encodings', f'{name}.*.parquet')))
+    elif args.partition_keys:
+        partitions.write_partitioned(
+            name,
+            dataset(name).schema,
+            variant_source(),
+            out_dir,
+            args.partition_keys,
+            row_group_size,
+            files_per_partition=args.files_per_partition,
+            max_rows_per_file=args.max_rows_per_file,
+            **options,
+        )
+        paths = sorted(glob(os.path.join(out_dir, 'partitioned', name, '**', '*.parquet'), recursive=True))
+    elif args.encryption:
+        encryption.write_matrix(name, dataset(name).schema, variant_source(), out_dir, columns=args.encrypted_columns or (), **options)
+        paths = sorted(glob(os.path.join(out_dir, 'encryption', f'{name}.*.parquet')))
+    elif args.granularity_sweep:
+        granularity.write_sweep(
+            name,
+            dataset(name).schema,
+            variant_source(),
+            out_dir,
+            page_sizes=args.page_sizes,
+            row_group_sizes=args.row_group_sizes,
+            **options,
+        )
+        paths = sorted(glob(os.path.join(out_dir, 'granularity', f'{name}.*.parquet')))
+    elif args.shards:
+        paths = shards.write_files(name, out_dir, n_rows, row_group_size, args.shards, args.workers, args.seed, nulls, **options)
+    elif args.workers > 1:
+        shards.write_merged(name, path, n_rows, row_group_size, args.workers, args.seed, nulls, **options)
+        paths = [path]
+    else:
+        write_batches(path, dataset(name).schema, batches(name, n_rows, row_group_size, args.seed, nulls=nulls), **options)
+        paths = [path]
+
+    if args.checksums:
+        for path in paths:
+            checksums.write_sidecar(path)
+
+    if args.predicates:
+        for path in paths:
+            predicates.write_oracle(path, args.predicates)
+
+    if args.twins:
+        for path in paths:
+            twins.write_twins(path, args.twins)
+
+    return paths
+
+
+def main(argv: list[str] | None = None) -> None:
+    cli = parser()
+    args = cli.parse_args(argv)
+
+    for name in args.datasets:
+        if name not in DATASETS:
+            cli.error(f'unknown dataset "{name}", expected one of: {", ".join(DATASETS)}')
+
+    if args.encryption and (args.checksums or args.predicates or args.twins):
+        cli.error('--checksums, --predicate and --twins can not read encrypted files, use them without --encryption')
+
+    for name in args.datasets or DATASETS:
+        try:
+            for predicate in args.predicates or []:
+                predicate.validate(dataset(name).schema)
+            if args.layouts:
+                layouts.keys(dataset(name).schema, args.sort_key, args.time_key, args.zorder_keys)
+            for key in args.partition_keys or []:
+                key.validate(dataset(name).schema)
+            if args.encryption:
+                encryption.validate_columns(dataset(name).schema, args.encrypted_columns or ())
+            leaves = [path for path, _ in encodings.leaves(dataset(name).schema)] if args.bloom_filters else []
+            for column in args.bloom_filters or []:
+                if column not in leaves:
+                    raise ValueError(f'Bloom filter column "{column}" is not a leaf column path, columns: {", ".join(leaves)}')
+        except ValueError as error:
+            cli.error(f'{name}: {error}')
+
+    # one run can override columns of several datasets, every override has to match at least one of them
+    columns = {path for name in args.datasets or DATASETS for path in field_paths(dataset(name).schema)}
+    for column, _ in args.column_nulls or []:
+        if column not in columns:
+            cli.error(f'--column-nulls column "{column}" is not in any of the datasets, nested fields are named by their path')
+
+    profile = PROFILES[args.profile] if args.profile else None
+    cache_dir = args.cache_dir or os.path.join(args.out_dir, '.cache')
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    if args.clear_cache:
+        cache.clear(cache_dir)
+
+    for name in args.datasets or DATASETS:
+        n_rows = args.rows or (profile.rows if profile else dataset(name).n_rows)
+        row_group_size = args.row_group_size or (profile.row_group_size if profile else DEFAULT_ROW_GROUP_SIZE)
+        page_size = args.page_size or (profile.page_size if profile else None)
+        produce = partial(generate, args, name, n_rows, row_group_size, page_size)
+        # cache entries are linked file by file, partitions and shards of a previous run would stay next to them
+        if args.partition_keys:
+            partitions.remove_partitioned(args.out_dir, name)
+        if args.shards:
+            shards.remove_files(name, args.out_dir)
+
+        started = time.perf_counter()
+        if args.no_cache:
+            produce(args.out_dir)
+            outcome = 'generated'
+        else:
+            # output does not depend on the number of workers, everything else goes into the key
+            parameters = {key: value for key, value in vars(args).items() if key not in UNCACHED_ARGUMENTS}
+            parameters.update(dataset=name, rows=n_rows, row_group_size=row_group_size, page_size=page_size)
+
+            hit = cache.fetch(cache_dir, cache.cache_key(parameters), args.out_dir, produce)
+            outcome = 'restored from cache' if hit else 'generated'
+
+        print(f'{name}: {n_rows} rows {outcome} into {args.out_dir} in {time.perf_counter() - started:.2f}s')
+
+    removed = cache.prune(cache_dir, args.max_cache_size) if os.path.isdir(cache_dir) else []
+    if removed:
+        print(f'{len(removed)} least recently used cache entries removed from {cache_dir}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Reference read throughput of parquet files.
+
+Reads every file with pyarrow as a whole table, row group by row group and one
+top level column at a time, both single and multi threaded, and stores rows/s,
+MB/s and peak RSS of every measurement in a baseline JSON file. Every
+measurement runs in a fresh process, so peak RSS is not polluted by previous
+reads.
+
+Examples:
+    python -m generators.benchmark
+    python -m generators.benchmark output/orders.parquet --repeat 5 --output output/orders.baseline.json
+"""
+import argparse
+import multiprocessing
+import os
+import platform
+import resource
+import time
+from glob import glob
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators.manifest import write_manifest
+
+MODES = ('table', 'row_groups', 'columns')
+
+
+def peak_rss() -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return maxrss if platform.system() == 'Darwin' else maxrss * 1024
+
+
+def chunk_bytes(metadata: pq.FileMetaData, column: str | None = None) -> tuple[int, int]:
+    """Compressed and uncompressed bytes of all column chunks, or only chunks of given top level column."""
+    compressed = uncompressed = 0
+    for row_group in range(metadata.num_row_groups):
+        for index in range(metadata.num_columns):
+            chunk = metadata.row_group(row_group).column(index)
+            if column is None or chunk.path_in_schema.split('.')[0] == column:
+                compressed += chunk.total_compressed_size
+                uncompressed += chunk.total_uncompressed_size
+
+    return compressed, uncompressed
+
+
+def read(path: str, mode: str, use_threads: bool, column: str | None) -> int:
+    """Read file in given mode, returns number of rows read."""
+    if mode == 'table':
+        return pq.read_table(path, use_threads=use_threads).num_rows
+
+    if mode == 'columns':
+        return pq.read_table(path, columns=[column], use_threads=use_threads).num_rows
+
+    file = pq.ParquetFile(path)
+
+    return sum(file.read_row_group(index, use_threads=use_threads).num_rows for index in range(file.num_row_groups))
+
+
+def measure(path: str, mode: str, use_threads: bool, column: str | None, repeat: int) -> dict:
+    """Best of repeat reads, executed inside a dedicated process."""
+    baseline_rss = peak_rss()
+
+    seconds = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = read(path, mode, use_threads, column)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    compressed, uncompressed = chunk_bytes(pq.read_metadata(path), column)
+
+    return {
+        'mode': mode,
+        'column': column,
+        'threads': use_threads,
+        'rows': rows,
+        'seconds': round(seconds, 6),
+        'rows_per_second': round(rows / seconds),
+        'compressed_mb_per_second': round(compressed / seconds / 1024 / 1024, 3),
+        'uncompressed_mb_per_second': round(uncompressed / seconds / 1024 / 1024, 3),
+        'peak_rss_bytes': peak_rss(),
+        'baseline_rss_bytes': baseline_rss,
+    }
+
+
+def benchmark(path: str, modes: tuple[str, ...] = MODES, repeat: int = 3) -> dict:
+    metadata = pq.read_metadata(path)
+    schema = metadata.schema.to_arrow_schema()
+    context = multiprocessing.get_context('spawn')
+
+    results = []
+    for mode in modes:
+        for column in (schema.names if mode == 'columns' else [None]):
+            for use_threads in (False, True):
+                with context.Pool(1, maxtasksperchild=1) as pool:
+                    results.append(pool.apply(measure, (path, mode, use_threads, column, repeat)))
+
+    return {
+        'file': os.path.basename(path),
+        'rows': metadata.num_rows,
+        'row_groups': metadata.num_row_groups,
+        'bytes': os.path.getsize(path),
+        'column_types': {field.name: str(field.type) for field in schema},
+        'results': results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.benchmark', description='Measure pyarrow read throughput of parquet files.')
+    parser.add_argument('paths', nargs='*', help='parquet files to read (default: output/*.parquet)')
+    parser.add_argument('--mode', dest='modes', action='append', choices=MODES, help='read modes to measure, can be repeated (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='number of reads per measurement, the fastest one is reported (default: 3)')
+    parser.add_argument('--output', default='output/read_baseline.json', help='baseline file (default: output/read_baseline.json)')
+    args = parser.parse_args(argv)
+
+    files = []
+    for path in args.paths or sorted(glob('output/*.parquet')):
+        files.append(benchmark(path, tuple(args.modes or MODES), args.repeat))
+        print(f'{path}: {len(files[-1]["results"])} measurements')
+
+    write_manifest(args.output, {
+        'pyarrow': pa.__version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'files': files,
+    })
+    print(f'baseline written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
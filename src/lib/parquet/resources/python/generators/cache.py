@@ -0,0 +1,134 @@
+"""Content addressed cache of generated files.
+
+Cache entries are directories named after a hash of the generators source code,
+generation parameters and versions of libraries that affect the written bytes.
+Cached files are hard linked into the output directory, so restoring even huge
+fixtures costs nothing. Output and cache share the same inodes, so no writer may
+modify an existing file in place, every writer removes its destination first
+(writer.unlink_existing) or writes a new file and renames it over the old one.
+
+Entries are never invalidated, a changed source code or option gets a new key,
+so the cache is pruned down to a size limit, least recently used entries first.
+"""
+import hashlib
+import json
+import os
+import shutil
+from glob import glob
+from importlib.metadata import PackageNotFoundError, version
+from typing import Callable
+
+GENERATORS_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARIES = ('pyarrow', 'numpy', 'pandas')
+DEFAULT_MAX_SIZE = 20 * 1024 ** 3
+
+
+def library_versions() -> dict[str, str | None]:
+    versions = {}
+    for library in LIBRARIES:
+        try:
+            versions[library] = version(library)
+        except PackageNotFoundError:
+            versions[library] = None
+
+    return versions
+
+
+def source_digest() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(glob(os.path.join(GENERATORS_DIR, '*.py'))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def cache_key(parameters: dict) -> str:
+    payload = json.dumps(
+        {'source': source_digest(), 'parameters': parameters, 'libraries': library_versions()},
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def link_tree(source: str, target: str) -> None:
+    """Hard link every file from source into target, copying when linking is not possible."""
+    for directory, _, files in os.walk(source):
+        destination = os.path.join(target, os.path.relpath(directory, source))
+        os.makedirs(destination, exist_ok=True)
+
+        for file in files:
+            destination_file = os.path.join(destination, file)
+            if os.path.exists(destination_file):
+                os.remove(destination_file)
+
+            try:
+                os.link(os.path.join(directory, file), destination_file)
+            except OSError:
+                shutil.copy2(os.path.join(directory, file), destination_file)
+
+
+def fetch(cache_dir: str, key: str, out_dir: str, produce: Callable[[str], None]) -> bool:
+    """Restore files of the entry into out_dir, producing the entry first when missing. Returns True on cache hit."""
+    entry = os.path.join(cache_dir, key)
+    hit = os.path.isdir(entry)
+
+    if not hit:
+        staging = f'{entry}.{os.getpid()}.tmp'
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        try:
+            produce(staging)
+            os.replace(staging, entry)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    else:
+        # modification time orders entries for pruning
+        os.utime(entry)
+
+    link_tree(entry, out_dir)
+
+    return hit
+
+
+def size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    return sum(os.path.getsize(os.path.join(directory, file)) for directory, _, files in os.walk(path) for file in files)
+
+
+def entries(cache_dir: str) -> list[str]:
+    """Cached file sets and shared source tables, staging directories of running generations are left out."""
+    paths = glob(os.path.join(cache_dir, '*')) + glob(os.path.join(cache_dir, 'tables', '*.arrow'))
+
+    return [path for path in paths if not path.endswith('.tmp') and path != os.path.join(cache_dir, 'tables')]
+
+
+def prune(cache_dir: str, max_size: int) -> list[str]:
+    """Remove least recently used entries until the cache fits into max_size bytes, returns removed entries."""
+    # files linked into an output directory survive removal of their entry
+    used = sorted(entries(cache_dir), key=os.path.getmtime, reverse=True)
+    sizes = [size(path) for path in used]
+
+    removed = []
+    total = sum(sizes)
+    while used and total > max_size:
+        path = used.pop()
+        total -= sizes.pop()
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            os.remove(path)
+        removed.append(path)
+
+    return removed
+
+
+def clear(cache_dir: str) -> None:
+    shutil.rmtree(cache_dir, ignore_errors=True)
@@ -0,0 +1,163 @@
+"""Per row group checksum sidecars.
+
+For every row group and top level column of a parquet file the sidecar stores
+number of rows, number of nulls and a SHA-256 digest of canonical values, so a
+reader can verify huge files by streaming, without materializing expected data.
+
+Canonical value is a compact JSON document (no whitespace, unicode and slashes
+not escaped, floats in shortest round trip form), every value followed by a new
+line character. Before encoding:
+ - decimals become strings with as many fraction digits as their scale, e.g. "12.50"
+ - dates become "YYYY-MM-DD" strings
+ - timestamps are truncated to microseconds and become "YYYY-MM-DDTHH:MM:SS.ffffff" strings
+ - times are truncated to microseconds and become number of microseconds since midnight
+ - structs become objects with fields in schema order
+ - maps become objects with keys in stored order, empty maps become {}
+
+Integer, boolean, string, decimal and temporal columns are encoded by Arrow
+compute kernels, other columns value by value.
+
+Examples:
+    python -m generators.checksums output/orders.parquet
+"""
+import argparse
+import hashlib
+import json
+import os
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from generators.manifest import write_manifest
+
+ALGORITHM = 'sha256'
+# values encoded at once, bounds memory of encoded text of huge row groups
+CHUNK_SIZE = 100_000
+ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), allow_nan=True)
+
+
+def canonical_type(data_type: pa.DataType) -> pa.DataType:
+    """Type every column is cast to before its values are encoded."""
+    if pa.types.is_timestamp(data_type):
+        return pa.timestamp('us', data_type.tz)
+    if pa.types.is_time(data_type):
+        return pa.time64('us')
+    if pa.types.is_decimal(data_type):
+        return pa.string()
+    if pa.types.is_map(data_type):
+        return pa.map_(canonical_type(data_type.key_type), canonical_type(data_type.item_type))
+    if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+        return pa.list_(canonical_type(data_type.value_type))
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(canonical_type(field.type)) for field in data_type])
+
+    return data_type
+
+
+def canonical_value(value: Any, data_type: pa.DataType) -> Any:
+    """JSON compatible form of a Python value of an array of canonical_type type."""
+    if value is None:
+        return None
+    if pa.types.is_timestamp(data_type):
+        return value.isoformat(timespec='microseconds')
+    if pa.types.is_date(data_type):
+        return value.isoformat()
+    if pa.types.is_time(data_type):
+        return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+    if pa.types.is_struct(data_type):
+        return {field.name: canonical_value(value[field.name], field.type) for field in data_type}
+    if pa.types.is_map(data_type):
+        # maps are converted to lists of (key, value) tuples
+        return {str(key): canonical_value(item, data_type.item_type) for key, item in value}
+    if pa.types.is_list(data_type):
+        return [canonical_value(item, data_type.value_type) for item in value]
+
+    return value
+
+
+def encode(value: Any, data_type: pa.DataType) -> bytes:
+    return (ENCODER.encode(canonical_value(value, data_type)) + '\n').encode()
+
+
+def json_texts(values: pa.Array) -> pa.Array | None:
+    """JSON text of every value of a canonical array computed by Arrow, None when values have to be encoded one by one."""
+    data_type = values.type
+    if pa.types.is_integer(data_type) or pa.types.is_boolean(data_type):
+        texts = pc.cast(values, pa.string())
+    elif pa.types.is_time(data_type):
+        texts = pc.cast(pc.cast(values, pa.int64()), pa.string())
+    elif pa.types.is_date(data_type):
+        texts = pc.binary_join_element_wise('"', pc.cast(values, pa.string()), '"', '')
+    elif pa.types.is_timestamp(data_type) and data_type.tz is None:
+        # %S of microsecond timestamps includes 6 fraction digits, like isoformat(timespec='microseconds')
+        texts = pc.binary_join_element_wise('"', pc.strftime(values, format='%Y-%m-%dT%H:%M:%S'), '"', '')
+    elif pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        if pc.any(pc.match_substring_regex(values, r'[\x00-\x1f]')).as_py():
+            return None
+        escaped = pc.replace_substring(pc.replace_substring(values, '\\', '\\\\'), '"', '\\"')
+        texts = pc.binary_join_element_wise('"', escaped, '"', '')
+    else:
+        return None
+
+    return pc.fill_null(texts, 'null')
+
+
+def digest_column(column: pa.Array | pa.ChunkedArray) -> dict:
+    digest = hashlib.new(ALGORITHM)
+    data_type = canonical_type(column.type)
+    values = column.cast(data_type, safe=False)
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    for start in range(0, len(values), CHUNK_SIZE):
+        chunk = values.slice(start, CHUNK_SIZE)
+        texts = json_texts(chunk)
+        if texts is None:
+            digest.update(b''.join(encode(value, data_type) for value in chunk.to_pylist()))
+            continue
+
+        # every text followed by a new line, hashed straight from the Arrow data buffer
+        lines = pc.binary_join_element_wise(texts, '', '\n').cast(pa.large_string())
+        offsets = np.frombuffer(lines.buffers()[1], dtype=np.int64)[lines.offset:lines.offset + len(lines) + 1]
+        digest.update(memoryview(lines.buffers()[2])[offsets[0]:offsets[-1]])
+
+    return {'digest': digest.hexdigest(), 'nulls': column.null_count}
+
+
+def checksums(path: str) -> dict:
+    """Digests of every row group, read one row group at a time."""
+    file = pq.ParquetFile(path)
+
+    row_groups = []
+    for index in range(file.num_row_groups):
+        table = file.read_row_group(index)
+        row_groups.append({
+            'rows': table.num_rows,
+            'columns': {name: digest_column(table.column(name)) for name in table.column_names},
+        })
+
+    return {'file': os.path.basename(path), 'algorithm': ALGORITHM, 'rows': file.metadata.num_rows, 'row_groups': row_groups}
+
+
+def sidecar_path(path: str) -> str:
+    return f'{os.path.splitext(path)[0]}.checksums.json'
+
+
+def write_sidecar(path: str) -> str:
+    return write_manifest(sidecar_path(path), checksums(path))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.checksums', description='Write per row group checksum sidecars of parquet files.')
+    parser.add_argument('paths', nargs='+', help='parquet files')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        print(f'{path}: checksums written to {write_sidecar(path)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Compression codec matrix.
+
+Writes the same logical table once per codec supported by pyarrow (and several
+levels of codecs that have them) and reports file sizes together with pyarrow
+write and single threaded read times.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators.manifest import write_manifest
+from generators.writer import write_batches
+
+
+@dataclass(frozen=True)
+class Variant:
+    # name from Flow\Parquet\ParquetFile\Compressions
+    codec: str
+    level: int | None = None
+
+    @property
+    def label(self) -> str:
+        return self.codec.lower() if self.level is None else f'{self.codec.lower()}-{self.level}'
+
+    def options(self) -> dict:
+        return {
+            'compression': 'NONE' if self.codec == 'UNCOMPRESSED' else self.codec,
+            'compression_level': self.level,
+        }
+
+
+# LZO is not supported by pyarrow
+VARIANTS = [
+    Variant('UNCOMPRESSED'),
+    Variant('SNAPPY'),
+    Variant('LZ4_RAW'),
+    *[Variant('GZIP', level) for level in (1, 6, 9)],
+    *[Variant('BROTLI', level) for level in (1, 6, 11)],
+    *[Variant('ZSTD', level) for level in (1, 3, 9, 19)],
+]
+
+
+def write_matrix(name: str, schema: pa.Schema, batches: Iterable[pa.RecordBatch | pa.Table], out_dir: str, variants: list[Variant] = VARIANTS, **options) -> str:
+    """Write batches once per variant into <out_dir>/codecs, returns path of the manifest, compression of options is replaced by the variant's."""
+    batches = list(batches)
+    directory = os.path.join(out_dir, 'codecs')
+    os.makedirs(directory, exist_ok=True)
+
+    results = []
+    for variant in variants:
+        path = os.path.join(directory, f'{name}.{variant.label}.parquet')
+
+        started = time.perf_counter()
+        rows = write_batches(path, schema, batches, **{**options, **variant.options()})
+        write_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        pq.read_table(path, use_threads=False)
+        read_seconds = time.perf_counter() - started
+
+        results.append({
+            'codec': variant.codec,
+            'level': variant.level,
+            'file': os.path.basename(path),
+            'rows': rows,
+            'bytes': os.path.getsize(path),
+            'write_seconds': round(write_seconds, 6),
+            'read_seconds': round(read_seconds, 6),
+        })
+
+    return write_manifest(os.path.join(directory, f'{name}.codecs.json'), {'dataset': name, 'variants': results})
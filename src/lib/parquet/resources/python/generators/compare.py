@@ -0,0 +1,184 @@
+"""Efficiency report of files written by the PHP writer.
+
+Rewrites the table of a parquet file with pyarrow using equivalent settings:
+the same row groups, codec, dictionary encoded columns, data page version,
+statistics and page indexes, and compares every column chunk of both files:
+encodings, number of pages per type and encoding, dictionary page size,
+compressed and uncompressed bytes and presence of statistics.
+
+Pages are counted from page headers, so files without encoding stats in the
+footer are compared as well.
+
+Examples:
+    python -m generators.compare orders_flow.parquet
+    python -m generators.compare orders_flow.parquet --page-size 1048576 --out-dir /tmp/compare
+"""
+import argparse
+import os
+from typing import Any
+
+import pyarrow.parquet as pq
+
+from generators import thrift
+from generators.encodings import leaves
+from generators.manifest import write_manifest
+from generators.writer import footer_size, write_batches
+
+# defaults of Flow\Parquet\Options
+DEFAULT_PAGE_SIZE = 8 * 1024
+DEFAULT_DICTIONARY_PAGE_SIZE = 1024 * 1024
+
+
+def column_path(column_chunk: dict[int, Any]) -> str:
+    return '.'.join(part.decode() for part in column_chunk[3][3])
+
+
+def chunk_report(path: str, column_chunk: dict[int, Any]) -> dict:
+    """Encodings, pages, sizes and statistics of a decoded ColumnChunk."""
+    metadata = column_chunk[3]
+    statistics = metadata.get(12, {})
+    pages = {}
+    dictionary_page_bytes = 0
+    for page in thrift.pages(path, column_chunk):
+        key = f'{page["type"]}:{page["encoding"]}'
+        pages[key] = pages.get(key, 0) + 1
+        if page['type'] == 'DICTIONARY_PAGE':
+            dictionary_page_bytes += page['compressed_page_size']
+
+    return {
+        'codec': thrift.CODECS.get(metadata[4], str(metadata[4])),
+        'encodings': [thrift.ENCODINGS.get(encoding, str(encoding)) for encoding in metadata[2]],
+        'pages': pages,
+        'data_pages': sum(count for key, count in pages.items() if key.startswith('DATA_PAGE')),
+        'dictionary_page_bytes': dictionary_page_bytes,
+        'compressed_bytes': metadata[7],
+        'uncompressed_bytes': metadata[6],
+        'statistics': {
+            # deprecated min/max (fields 1, 2) count as well, old writers only set those
+            'min_max': (5 in statistics and 6 in statistics) or (1 in statistics and 2 in statistics),
+            'null_count': 3 in statistics,
+            'distinct_count': 4 in statistics,
+        },
+        'column_index': 6 in column_chunk,
+        'offset_index': 4 in column_chunk,
+        'bloom_filter': 14 in metadata,
+    }
+
+
+def rewrite_paths(file: pq.ParquetFile) -> dict[str, str]:
+    """Leaf column paths of the source mapped to the ones pyarrow writes, for example 2-level lists become <name>.list.element."""
+    source = [file.schema.column(index).path for index in range(len(file.schema))]
+    rewrite = [path for path, _ in leaves(file.schema_arrow)]
+    if len(source) != len(rewrite):
+        raise ValueError(f'{len(source)} leaf columns of the source are written as {len(rewrite)} leaf columns by pyarrow: {", ".join(source)} -> {", ".join(rewrite)}')
+
+    # both schemas list leaves depth first in the same order
+    return dict(zip(source, rewrite))
+
+
+def settings(footer: dict[int, Any], reports: list[dict]) -> dict:
+    """pyarrow writer options equivalent to the ones used for the decoded footer and its column chunk reports, keyed by rewrite column paths."""
+    used = lambda predicate: sorted({report['rewrite_column'] for report in reports if predicate(report['source'])}) or False
+
+    return {
+        'compression': {report['rewrite_column']: 'NONE' if report['source']['codec'] == 'UNCOMPRESSED' else report['source']['codec'] for report in reports if report['row_group'] == 0},
+        'use_dictionary': used(lambda chunk: chunk['dictionary_page_bytes'] > 0),
+        'write_statistics': used(lambda chunk: chunk['statistics']['min_max'] or chunk['statistics']['null_count']),
+        'write_page_index': any(report['source']['column_index'] for report in reports),
+        'data_page_version': '2.0' if any(key.startswith('DATA_PAGE_V2') for report in reports for key in report['source']['pages']) else '1.0',
+        # FileMetaData.version, format versions 2.x are all written as 2
+        'version': '1.0' if footer[1] == 1 else '2.6',
+    }
+
+
+def difference(source: dict, rewrite: dict) -> dict:
+    return {
+        'compressed_bytes': source['compressed_bytes'] - rewrite['compressed_bytes'],
+        'uncompressed_bytes': source['uncompressed_bytes'] - rewrite['uncompressed_bytes'],
+        'data_pages': source['data_pages'] - rewrite['data_pages'],
+        'dictionary_page_bytes': source['dictionary_page_bytes'] - rewrite['dictionary_page_bytes'],
+        'encodings': sorted(set(source['encodings']) ^ set(rewrite['encodings'])),
+        'statistics': sorted(key for key in source['statistics'] if source['statistics'][key] != rewrite['statistics'][key]),
+    }
+
+
+def chunks(path: str) -> tuple[dict[int, Any], list[dict]]:
+    footer = thrift.footer(path)
+
+    return footer, [
+        {'row_group': index, 'column': column_path(chunk), 'source': chunk_report(path, chunk)}
+        for index, row_group in enumerate(footer[4])
+        for chunk in row_group[1]
+    ]
+
+
+def compare(path: str, rewrite_path: str, page_size: int = DEFAULT_PAGE_SIZE, dictionary_page_size: int = DEFAULT_DICTIONARY_PAGE_SIZE) -> dict:
+    """Rewrite the file with pyarrow into rewrite_path and compare every column chunk of both files."""
+    file = pq.ParquetFile(path)
+    paths = rewrite_paths(file)
+    footer, reports = chunks(path)
+    for report in reports:
+        report['rewrite_column'] = paths[report['column']]
+    options = settings(footer, reports)
+
+    write_batches(
+        rewrite_path,
+        file.schema_arrow,
+        (file.read_row_group(index, use_threads=False) for index in range(file.num_row_groups)),
+        data_page_size=page_size,
+        dictionary_pagesize_limit=dictionary_page_size,
+        **options,
+    )
+
+    _, rewritten = chunks(rewrite_path)
+    rewritten = {(rewrite['row_group'], rewrite['column']): rewrite['source'] for rewrite in rewritten}
+    if len(rewritten) != len(reports):
+        raise ValueError(f'{rewrite_path} has {len(rewritten)} column chunks, {path} has {len(reports)}')
+
+    for report in reports:
+        rewrite = rewritten.get((report['row_group'], report['rewrite_column']))
+        if rewrite is None:
+            raise ValueError(f'{rewrite_path} has no column chunk {report["rewrite_column"]} in row group {report["row_group"]}')
+        report['rewrite'] = rewrite
+        report['difference'] = difference(report['source'], rewrite)
+
+    return {
+        'source': {'file': path, 'created_by': footer.get(6, b'').decode(), 'bytes': os.path.getsize(path), 'footer_bytes': footer_size(path)},
+        'rewrite': {'file': rewrite_path, 'created_by': pq.read_metadata(rewrite_path).created_by, 'bytes': os.path.getsize(rewrite_path), 'footer_bytes': footer_size(rewrite_path)},
+        'settings': {**options, 'data_page_size': page_size, 'dictionary_pagesize_limit': dictionary_page_size},
+        'column_chunks': reports,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.compare', description='Compare a parquet file written by the PHP writer with its pyarrow rewrite.')
+    parser.add_argument('file', help='parquet file written by the PHP writer')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE, help=f'data page size of the rewrite in bytes (default: {DEFAULT_PAGE_SIZE}, PAGE_SIZE_BYTES default)')
+    parser.add_argument('--dictionary-page-size', type=int, default=DEFAULT_DICTIONARY_PAGE_SIZE, help=f'dictionary page size limit of the rewrite in bytes (default: {DEFAULT_DICTIONARY_PAGE_SIZE}, DICTIONARY_PAGE_SIZE default)')
+    parser.add_argument('--out-dir', default='output', help='output directory, files are written into its compare subdirectory (default: output)')
+    args = parser.parse_args(argv)
+
+    directory = os.path.join(args.out_dir, 'compare')
+    os.makedirs(directory, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(args.file))[0]
+
+    report = compare(args.file, os.path.join(directory, f'{stem}.pyarrow.parquet'), args.page_size, args.dictionary_page_size)
+    path = write_manifest(os.path.join(directory, f'{stem}.compare.json'), report)
+
+    columns = {}
+    for chunk in report['column_chunks']:
+        column = columns.setdefault(chunk['column'], [0, 0, 0, 0])
+        column[0] += chunk['source']['compressed_bytes']
+        column[1] += chunk['rewrite']['compressed_bytes']
+        column[2] += chunk['source']['data_pages']
+        column[3] += chunk['rewrite']['data_pages']
+
+    print(f'{"column":<40} {"php bytes":>12} {"pyarrow bytes":>14} {"php pages":>10} {"pyarrow pages":>14}')
+    for name, (source_bytes, rewrite_bytes, source_pages, rewrite_pages) in columns.items():
+        print(f'{name:<40} {source_bytes:>12} {rewrite_bytes:>14} {source_pages:>10} {rewrite_pages:>14}')
+    print(f'{"file":<40} {report["source"]["bytes"]:>12} {report["rewrite"]["bytes"]:>14}')
+    print(f'report written to {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Registry of datasets known to the generators.
+
+Every dataset module exposes a pyarrow `schema`, a default `n_rows` and a
+`generate(n_rows, rng, start)` function returning a single batch of rows
+numbered from `start`.
+"""
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Iterator
+
+import numpy as np
+import pyarrow as pa
+
+from generators import lists, maps, null_sweep, orders, primitives, structs
+from generators.nulls import DEFAULT_NULLS, NullPolicy
+from generators.writer import DEFAULT_ROW_GROUP_SIZE, row_groups
+
+DEFAULT_SEED = 0
+
+DATASETS: dict[str, ModuleType] = {
+    'lists': lists,
+    'maps': maps,
+    'null_sweep': null_sweep,
+    'orders': orders,
+    'primitives': primitives,
+    'structs': structs,
+}
+
+
+@dataclass(frozen=True)
+class Profile:
+    rows: int
+    row_group_size: int
+    page_size: int = 1024 * 1024
+
+
+PROFILES: dict[str, Profile] = {
+    # committed test fixtures
+    'S': Profile(rows=100, row_group_size=100),
+    'M': Profile(rows=100_000, row_group_size=100_000),
+    'L': Profile(rows=10_000_000, row_group_size=1_000_000),
+    'XL': Profile(rows=100_000_000, row_group_size=1_000_000),
+}
+
+
+def dataset(name: str) -> ModuleType:
+    if name not in DATASETS:
+        raise ValueError(f'Unknown dataset "{name}", expected one of: {", ".join(DATASETS)}')
+
+    return DATASETS[name]
+
+
+def resolve_seed(seed: int | None) -> int:
+    """Fix random entropy up front, so every process derives the same row group seeds."""
+    return np.random.SeedSequence(seed).entropy
+
+
+def seed_row_group(seed: int, index: int) -> np.random.Generator:
+    """Independent generator of a single row group."""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+
+
+def batches(name: str, n_rows: int, row_group_size: int = DEFAULT_ROW_GROUP_SIZE, seed: int | None = DEFAULT_SEED, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> Iterator[pa.RecordBatch | pa.Table]:
+    """Generate dataset lazily, one row group at a time.
+
+    Every row group is seeded independently from its position, so the same seed
+    gives the same rows no matter how generation is split between processes.
+    """
+    module = dataset(name)
+    seed = resolve_seed(seed)
+
+    for offset, size in row_groups(n_rows, row_group_size):
+        yield module.generate(size, seed_row_group(seed, (start + offset) // row_group_size), start + offset, nulls)
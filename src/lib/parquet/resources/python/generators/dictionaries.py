@@ -0,0 +1,193 @@
+"""Dictionary cardinality sweep.
+
+Writes string, fixed length binary and integer columns with an exact number of
+distinct values, from a handful up to millions, both dictionary encoded (for
+several dictionary page size limits) and PLAIN. Once a dictionary page outgrows
+its limit the writer falls back to PLAIN data pages, the report lists pages of
+every encoding per column, so the fallback shows up next to file sizes and
+write and read times.
+
+Examples:
+    python -m generators.dictionaries
+    python -m generators.dictionaries --cardinalities 2 1000 10000000 --value-lengths 8 64 --distribution zipf
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from generators import columns, thrift
+from generators.datasets import DEFAULT_SEED
+from generators.manifest import write_manifest
+from generators.writer import DEFAULT_ROW_GROUP_SIZE, row_groups, write_batches
+
+DEFAULT_CARDINALITIES = (2, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_VALUE_LENGTHS = (8, 32, 128)
+DEFAULT_FIXED_LENGTHS = (16,)
+DEFAULT_DICTIONARY_PAGE_SIZES = (1024 * 1024,)
+DISTRIBUTIONS = ('uniform', 'zipf')
+
+
+def identifiers(rng: np.random.Generator, n_rows: int, cardinality: int, distribution: str) -> np.ndarray:
+    """Id of the distinct value of every row, every one of cardinality ids is used at least once."""
+    if distribution == 'zipf':
+        # skewed like real categories, low ids are the most frequent ones
+        ids = (rng.zipf(1.2, n_rows) - 1) % cardinality
+    else:
+        ids = rng.integers(0, cardinality, n_rows)
+
+    ids[:cardinality] = np.arange(cardinality)
+    rng.shuffle(ids)
+
+    return ids
+
+
+def strings(ids: np.ndarray, length: int) -> pa.Array:
+    """Id left padded to length characters, longer when the id does not fit."""
+    return pc.utf8_lpad(pc.cast(pa.array(ids), pa.string()), width=length, padding='x')
+
+
+def fixed(ids: np.ndarray, length: int) -> pa.Array:
+    """Big endian id right aligned in length bytes, every id must fit so that distinct ids stay distinct values."""
+    if len(ids) and int(ids.max()) >= 256 ** length:
+        raise ValueError(f'ids up to {int(ids.max())} do not fit into {length} bytes')
+
+    data = np.zeros((len(ids), max(length, 8)), dtype=np.uint8)
+    data[:, -8:] = ids.astype('>u8').view(np.uint8).reshape(-1, 8)
+
+    return pa.FixedSizeBinaryArray.from_buffers(pa.binary(length), len(ids), [None, pa.py_buffer(np.ascontiguousarray(data[:, -length:]))])
+
+
+def sweep_schema(value_lengths: tuple[int, ...], fixed_lengths: tuple[int, ...]) -> pa.Schema:
+    return pa.schema([
+        *[(f'string_{length}', pa.string()) for length in value_lengths],
+        *[(f'fixed_{length}', pa.binary(length)) for length in fixed_lengths],
+        ('int32', pa.int32()),
+        ('int64', pa.int64()),
+    ])
+
+
+def generate(schema: pa.Schema, ids: np.ndarray, value_lengths: tuple[int, ...], fixed_lengths: tuple[int, ...]) -> pa.RecordBatch:
+    return pa.RecordBatch.from_arrays([
+        *[strings(ids, length) for length in value_lengths],
+        *[fixed(ids, length) for length in fixed_lengths],
+        columns.fixed_width(pa.int32(), (ids * 7 + 1).astype(np.int32)),
+        columns.fixed_width(pa.int64(), ids * 7919 + 1_000_000_000_000),
+    ], schema=schema)
+
+
+def column_report(path: str) -> dict[str, dict]:
+    """Pages per encoding and dictionary page bytes of every column, summed over row groups."""
+    report = {}
+    for row_group in thrift.footer(path)[4]:
+        for chunk in row_group[1]:
+            column = report.setdefault('.'.join(part.decode() for part in chunk[3][3]), {'pages': {}, 'dictionary_page_bytes': 0})
+            for page_type, encodings in thrift.encoding_stats(chunk).items():
+                for encoding, count in encodings.items():
+                    key = f'{page_type}:{encoding}'
+                    column['pages'][key] = column['pages'].get(key, 0) + count
+            if 11 in chunk[3]:
+                column['dictionary_page_bytes'] += chunk[3][9] - chunk[3][11]
+
+    for column in report.values():
+        dictionary_pages = any(key.endswith('_DICTIONARY') for key in column['pages'] if key.startswith('DATA_PAGE'))
+        plain_pages = any(key.endswith(':PLAIN') for key in column['pages'] if key.startswith('DATA_PAGE'))
+        column['fallback_to_plain'] = dictionary_pages and plain_pages
+
+    return report
+
+
+def write_sweep(
+    directory: str,
+    cardinality: int,
+    n_rows: int,
+    row_group_size: int,
+    seed: int,
+    distribution: str,
+    value_lengths: tuple[int, ...],
+    fixed_lengths: tuple[int, ...],
+    dictionary_page_sizes: tuple[int, ...],
+    **options,
+) -> list[dict]:
+    """Write rows of given cardinality once per dictionary page size limit and once PLAIN."""
+    n_rows = max(n_rows, cardinality)
+    ids = identifiers(np.random.default_rng(seed), n_rows, cardinality, distribution)
+    schema = sweep_schema(value_lengths, fixed_lengths)
+    variants = [(f'dictionary-{size}', {'use_dictionary': True, 'dictionary_pagesize_limit': size}) for size in dictionary_page_sizes]
+    variants.append(('plain', {'use_dictionary': False}))
+
+    results = []
+    for label, variant in variants:
+        path = os.path.join(directory, f'cardinality-{cardinality}.{label}.parquet')
+        source = (generate(schema, ids[start:start + size], value_lengths, fixed_lengths) for start, size in row_groups(n_rows, row_group_size))
+
+        started = time.perf_counter()
+        write_batches(path, schema, source, **options, **variant)
+        write_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        pq.read_table(path, use_threads=False)
+        read_seconds = time.perf_counter() - started
+
+        results.append({
+            'cardinality': cardinality,
+            'rows': n_rows,
+            'variant': label,
+            'dictionary_page_size_limit': variant.get('dictionary_pagesize_limit'),
+            'file': os.path.basename(path),
+            'bytes': os.path.getsize(path),
+            'write_seconds': round(write_seconds, 6),
+            'read_seconds': round(read_seconds, 6),
+            'columns': column_report(path),
+        })
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.dictionaries', description='Write dictionary cardinality sweep parquet files.')
+    parser.add_argument('--cardinalities', type=int, nargs='+', default=DEFAULT_CARDINALITIES, help='numbers of distinct values (default: 2 to 10M)')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='number of rows, raised to the cardinality when lower (default: 1000000)')
+    parser.add_argument('--row-group-size', type=int, default=DEFAULT_ROW_GROUP_SIZE, help=f'rows per row group (default: {DEFAULT_ROW_GROUP_SIZE})')
+    parser.add_argument('--value-lengths', type=int, nargs='+', default=DEFAULT_VALUE_LENGTHS, help=f'lengths of string columns (default: {" ".join(map(str, DEFAULT_VALUE_LENGTHS))})')
+    parser.add_argument('--fixed-lengths', type=int, nargs='+', default=DEFAULT_FIXED_LENGTHS, help=f'lengths of fixed length binary columns (default: {" ".join(map(str, DEFAULT_FIXED_LENGTHS))})')
+    parser.add_argument('--dictionary-page-sizes', type=int, nargs='+', default=DEFAULT_DICTIONARY_PAGE_SIZES, help='dictionary page size limits in bytes, exceeding one falls back to PLAIN (default: 1048576)')
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform', help='frequency of distinct values (default: uniform)')
+    parser.add_argument('--compression', type=str.upper, default='SNAPPY', help='compression codec (default: SNAPPY)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--out-dir', default='output', help='output directory, files are written into its dictionaries subdirectory (default: output)')
+    args = parser.parse_args(argv)
+
+    for length in args.fixed_lengths:
+        if length < 1 or 256 ** length < max(args.cardinalities):
+            parser.error(f'--fixed-lengths {length} cannot hold {max(args.cardinalities)} distinct values')
+
+    directory = os.path.join(args.out_dir, 'dictionaries')
+    os.makedirs(directory, exist_ok=True)
+
+    files = []
+    for cardinality in args.cardinalities:
+        files.extend(write_sweep(
+            directory,
+            cardinality,
+            args.rows,
+            args.row_group_size,
+            args.seed,
+            args.distribution,
+            tuple(args.value_lengths),
+            tuple(args.fixed_lengths),
+            tuple(args.dictionary_page_sizes),
+            compression=args.compression,
+        ))
+        print(f'cardinality {cardinality}: {len(args.dictionary_page_sizes) + 1} files written into {directory}')
+
+    path = write_manifest(os.path.join(directory, 'dictionaries.json'), {'distribution': args.distribution, 'files': files})
+    print(f'report written to {path}')
+
+
+if __name__ == '__main__':
+    main()
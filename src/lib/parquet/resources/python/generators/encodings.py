@@ -0,0 +1,135 @@
+"""Encoding matrix.
+
+Writes the same logical table once per encoding and data page version, every
+column that supports the encoding is written with it, remaining columns fall
+back to PLAIN. The manifest lists encodings pyarrow actually used for every
+column chunk, together with file sizes and pyarrow write and read times.
+
+PLAIN_DICTIONARY is written only by parquet format version 1.0, which coerces
+some logical types (for example nanosecond timestamps become microsecond ones),
+so every variant records its format version and columns read back with a
+different Arrow type.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators.manifest import write_manifest
+from generators.writer import write_batches
+
+# names from Flow\Parquet\ParquetFile\Encodings mapped to physical types pyarrow can write them for,
+# BIT_PACKED is deprecated and not supported by pyarrow
+ENCODINGS = {
+    'PLAIN': ('BOOLEAN', 'INT32', 'INT64', 'INT96', 'FLOAT', 'DOUBLE', 'BYTE_ARRAY', 'FIXED_LEN_BYTE_ARRAY'),
+    'PLAIN_DICTIONARY': ('INT32', 'INT64', 'INT96', 'FLOAT', 'DOUBLE', 'BYTE_ARRAY', 'FIXED_LEN_BYTE_ARRAY'),
+    'RLE_DICTIONARY': ('INT32', 'INT64', 'INT96', 'FLOAT', 'DOUBLE', 'BYTE_ARRAY', 'FIXED_LEN_BYTE_ARRAY'),
+    'RLE': ('BOOLEAN',),
+    'DELTA_BINARY_PACKED': ('INT32', 'INT64'),
+    'DELTA_LENGTH_BYTE_ARRAY': ('BYTE_ARRAY',),
+    'DELTA_BYTE_ARRAY': ('BYTE_ARRAY', 'FIXED_LEN_BYTE_ARRAY'),
+    'BYTE_STREAM_SPLIT': ('INT32', 'INT64', 'FLOAT', 'DOUBLE', 'FIXED_LEN_BYTE_ARRAY'),
+}
+DATA_PAGE_VERSIONS = ('1.0', '2.0')
+
+
+@dataclass(frozen=True)
+class Variant:
+    encoding: str
+    data_page_version: str
+
+    @property
+    def label(self) -> str:
+        return f'{self.encoding.lower()}.v{self.data_page_version[0]}'
+
+    def columns(self, leaves: list[tuple[str, str]]) -> list[str]:
+        """Paths of leaf columns the encoding can be used for."""
+        return [path for path, physical_type in leaves if physical_type in ENCODINGS[self.encoding]]
+
+    def options(self, leaves: list[tuple[str, str]]) -> dict:
+        if self.encoding == 'PLAIN_DICTIONARY':
+            # pyarrow writes PLAIN_DICTIONARY instead of RLE_DICTIONARY only in files of format version 1.0
+            return {'use_dictionary': self.columns(leaves), 'version': '1.0', 'data_page_version': self.data_page_version}
+        if self.encoding == 'RLE_DICTIONARY':
+            return {'use_dictionary': self.columns(leaves), 'data_page_version': self.data_page_version}
+
+        return {
+            'use_dictionary': False,
+            'column_encoding': {path: self.encoding for path in self.columns(leaves)},
+            'data_page_version': self.data_page_version,
+        }
+
+
+VARIANTS = [Variant(encoding, version) for version in DATA_PAGE_VERSIONS for encoding in ENCODINGS]
+
+
+def leaves(schema: pa.Schema) -> list[tuple[str, str]]:
+    """Path and physical type of every leaf column the schema is written as."""
+    buffer = pa.BufferOutputStream()
+    pq.write_table(schema.empty_table(), buffer)
+    parquet_schema = pq.read_metadata(pa.BufferReader(buffer.getvalue())).schema
+
+    return [(parquet_schema.column(index).path, parquet_schema.column(index).physical_type) for index in range(len(parquet_schema))]
+
+
+def chunk_encodings(metadata: pq.FileMetaData) -> dict[str, list[str]]:
+    """Encodings of every leaf column, collected from all its column chunks."""
+    encodings = {}
+    for row_group in range(metadata.num_row_groups):
+        for index in range(metadata.num_columns):
+            chunk = metadata.row_group(row_group).column(index)
+            used = encodings.setdefault(chunk.path_in_schema, [])
+            used.extend(encoding for encoding in chunk.encodings if encoding not in used)
+
+    return encodings
+
+
+def coerced_types(schema: pa.Schema, written: pa.Schema) -> dict[str, dict[str, str]]:
+    """Top level columns whose type changed when they were written, with the original and the written type."""
+    return {
+        field.name: {'type': str(field.type), 'written_as': str(written.field(field.name).type)}
+        for field in schema
+        if not written.field(field.name).type.equals(field.type)
+    }
+
+
+def write_matrix(name: str, schema: pa.Schema, batches: Iterable[pa.RecordBatch | pa.Table], out_dir: str, variants: list[Variant] = VARIANTS, **options) -> str:
+    """Write batches once per variant with at least one applicable column into <out_dir>/encodings, returns path of the manifest."""
+    batches = list(batches)
+    directory = os.path.join(out_dir, 'encodings')
+    os.makedirs(directory, exist_ok=True)
+    columns = leaves(schema)
+
+    results = []
+    for variant in variants:
+        if not variant.columns(columns):
+            continue
+
+        path = os.path.join(directory, f'{name}.{variant.label}.parquet')
+
+        started = time.perf_counter()
+        rows = write_batches(path, schema, batches, **options, **variant.options(columns))
+        write_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        pq.read_table(path, use_threads=False)
+        read_seconds = time.perf_counter() - started
+
+        file = pq.ParquetFile(path)
+        results.append({
+            'encoding': variant.encoding,
+            'data_page_version': variant.data_page_version,
+            'format_version': file.metadata.format_version,
+            'coerced_types': coerced_types(schema, file.schema_arrow),
+            'file': os.path.basename(path),
+            'rows': rows,
+            'bytes': os.path.getsize(path),
+            'write_seconds': round(write_seconds, 6),
+            'read_seconds': round(read_seconds, 6),
+            'columns': chunk_encodings(file.metadata),
+        })
+
+    return write_manifest(os.path.join(directory, f'{name}.encodings.json'), {'dataset': name, 'variants': results})
@@ -0,0 +1,143 @@
+"""Encryption matrix.
+
+Writes the same logical table once unencrypted and once per parquet modular
+encryption algorithm (AES_GCM_V1, AES_GCM_CTR_V1) with encrypted and plaintext
+footer, and reports file sizes together with pyarrow write and single
+threaded read times of every variant relative to the unencrypted twin.
+
+Selected columns are encrypted with their own column key, all columns are
+encrypted with the footer key when none are selected. Data keys are wrapped by
+an in-memory KMS client holding fixed master keys, so files can be decrypted by
+anyone who knows them, which is the point of test fixtures. Data keys and
+nonces are random, encrypted files are not byte for byte reproducible.
+"""
+import base64
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.parquet.encryption as pe
+
+from generators.encodings import leaves
+from generators.manifest import best_of, write_manifest
+from generators.writer import write_batches
+
+FOOTER_KEY = 'footer_key'
+COLUMN_KEY = 'column_key'
+# 128 bit master keys, hex encoded so the PHP side can use the same ones
+MASTER_KEYS = {
+    FOOTER_KEY: bytes.fromhex('000102030405060708090a0b0c0d0e0f'),
+    COLUMN_KEY: bytes.fromhex('101112131415161718191a1b1c1d1e1f'),
+}
+# Flow\Parquet\Thrift\AesGcmV1 and AesGcmCtrV1
+ALGORITHMS = ('AES_GCM_V1', 'AES_GCM_CTR_V1')
+
+
+class InMemoryKmsClient(pe.KmsClient):
+    """Wraps data keys by XOR with master keys held in memory, not secure, meant for fixtures only."""
+
+    def __init__(self, config: pe.KmsConnectionConfig):
+        super().__init__()
+
+    def wrap_key(self, key_bytes: bytes, master_key_identifier: str) -> str:
+        return base64.b64encode(xor(key_bytes, MASTER_KEYS[master_key_identifier])).decode()
+
+    def unwrap_key(self, wrapped_key: str, master_key_identifier: str) -> bytes:
+        return xor(base64.b64decode(wrapped_key), MASTER_KEYS[master_key_identifier])
+
+
+def xor(data: bytes, key: bytes) -> bytes:
+    return bytes(byte ^ key[index % len(key)] for index, byte in enumerate(data))
+
+
+@dataclass(frozen=True)
+class Variant:
+    algorithm: str
+    plaintext_footer: bool
+
+    @property
+    def label(self) -> str:
+        return f'{self.algorithm.lower()}.{"plaintext" if self.plaintext_footer else "encrypted"}-footer'
+
+    def configuration(self, columns: Iterable[str] = ()) -> pe.EncryptionConfiguration:
+        columns = list(columns)
+        keys = {'column_keys': {COLUMN_KEY: columns}} if columns else {'uniform_encryption': True}
+
+        return pe.EncryptionConfiguration(footer_key=FOOTER_KEY, encryption_algorithm=self.algorithm, plaintext_footer=self.plaintext_footer, **keys)
+
+
+VARIANTS = [Variant(algorithm, plaintext_footer) for algorithm in ALGORITHMS for plaintext_footer in (False, True)]
+
+
+def validate_columns(schema: pa.Schema, columns: Iterable[str]) -> None:
+    """Raise ValueError unless every column is a leaf column path of the schema or a parent of leaf columns."""
+    paths = [path for path, _ in leaves(schema)]
+    for column in columns:
+        if not any(path == column or path.startswith(f'{column}.') for path in paths):
+            raise ValueError(f'Encrypted column "{column}" is not in the schema, columns: {", ".join(paths)}')
+
+
+def crypto_factory() -> pe.CryptoFactory:
+    return pe.CryptoFactory(InMemoryKmsClient)
+
+
+def encryption_properties(variant: Variant, columns: Iterable[str] = ()):
+    return crypto_factory().file_encryption_properties(pe.KmsConnectionConfig(), variant.configuration(columns))
+
+
+def decryption_properties():
+    return crypto_factory().file_decryption_properties(pe.KmsConnectionConfig(), pe.DecryptionConfiguration())
+
+
+def write_matrix(
+    name: str,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch | pa.Table],
+    out_dir: str,
+    columns: Iterable[str] = (),
+    variants: list[Variant] = VARIANTS,
+    repeat: int = 3,
+    **options,
+) -> str:
+    """Write batches unencrypted and once per variant into <out_dir>/encryption, returns path of the manifest."""
+    batches = list(batches)
+    columns = list(columns)
+    directory = os.path.join(out_dir, 'encryption')
+    os.makedirs(directory, exist_ok=True)
+
+    results = []
+    for variant in [None, *variants]:
+        path = os.path.join(directory, f'{name}.{variant.label if variant else "unencrypted"}.parquet')
+        properties = {'encryption_properties': encryption_properties(variant, columns)} if variant else {}
+        read = {'decryption_properties': decryption_properties()} if variant else {}
+
+        started = time.perf_counter()
+        rows = write_batches(path, schema, batches, **options, **properties)
+        write_seconds = time.perf_counter() - started
+
+        result = {
+            'algorithm': variant.algorithm if variant else None,
+            'plaintext_footer': variant.plaintext_footer if variant else None,
+            'file': os.path.basename(path),
+            'rows': rows,
+            'bytes': os.path.getsize(path),
+            'write_seconds': round(write_seconds, 6),
+        }
+        try:
+            result['read_seconds'] = best_of(repeat, lambda: pq.read_table(path, use_threads=False, **read))
+            result['read_overhead'] = round(result['read_seconds'] / results[0]['read_seconds'], 3) if variant else 1.0
+        except OSError as error:
+            # pyarrow fails to read column keys with plaintext footers of AES_GCM_CTR_V1 files
+            result['read_error'] = str(error)
+
+        results.append(result)
+
+    return write_manifest(os.path.join(directory, f'{name}.encryption.json'), {
+        'dataset': name,
+        'encrypted_columns': columns or 'all',
+        'master_keys': {key: value.hex() for key, value in MASTER_KEYS.items()},
+        'variants': results,
+    })
@@ -0,0 +1,83 @@
+"""Page size and row group size sweep.
+
+Writes the same logical table once per combination of data page size and row
+group size and reports number of row groups and data pages, footer size, file
+size together with pyarrow write and single threaded read times, so page and
+row group granularity of the PHP writer can be tuned against a reference.
+
+pyarrow row groups are limited by number of rows, not bytes, the report lists
+their mean compressed and uncompressed size instead.
+"""
+import os
+import time
+from typing import Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators import thrift
+from generators.manifest import best_of, write_manifest
+from generators.writer import footer_size, row_groups, write_batches
+
+DEFAULT_PAGE_SIZES = (8 * 1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024)
+DEFAULT_ROW_GROUP_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def data_pages(path: str) -> int:
+    """Number of data pages of all column chunks."""
+    return sum(
+        count
+        for row_group in thrift.footer(path)[4]
+        for chunk in row_group[1]
+        for page_type, encodings in thrift.encoding_stats(chunk).items() if page_type.startswith('DATA_PAGE')
+        for count in encodings.values()
+    )
+
+
+def write_sweep(
+    name: str,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch | pa.Table],
+    out_dir: str,
+    page_sizes: Iterable[int] = DEFAULT_PAGE_SIZES,
+    row_group_sizes: Iterable[int] = DEFAULT_ROW_GROUP_SIZES,
+    repeat: int = 3,
+    **options,
+) -> str:
+    """Write the whole dataset once per page size and row group size into <out_dir>/granularity, returns path of the manifest."""
+    table = pa.concat_tables(item if isinstance(item, pa.Table) else pa.Table.from_batches([item]) for item in batches)
+    directory = os.path.join(out_dir, 'granularity')
+    os.makedirs(directory, exist_ok=True)
+
+    results = []
+    for row_group_size in row_group_sizes:
+        for page_size in page_sizes:
+            path = os.path.join(directory, f'{name}.page-{page_size}.row-group-{row_group_size}.parquet')
+            variant = {**options, 'data_page_size': page_size}
+            if variant.get('max_rows_per_page') is None:
+                # pyarrow closes pages after 20000 rows by default, pages are limited by their size only
+                variant['max_rows_per_page'] = row_group_size
+
+            started = time.perf_counter()
+            rows = write_batches(path, schema, (table.slice(start, size) for start, size in row_groups(table.num_rows, row_group_size)), **variant)
+            write_seconds = time.perf_counter() - started
+
+            metadata = pq.read_metadata(path)
+            groups = [metadata.row_group(index) for index in range(metadata.num_row_groups)]
+
+            results.append({
+                'page_size': page_size,
+                'row_group_size': row_group_size,
+                'file': os.path.basename(path),
+                'rows': rows,
+                'row_groups': metadata.num_row_groups,
+                'mean_row_group_bytes': round(sum(group.total_byte_size for group in groups) / max(len(groups), 1)),
+                'mean_row_group_compressed_bytes': round(sum(group.column(index).total_compressed_size for group in groups for index in range(group.num_columns)) / max(len(groups), 1)),
+                'data_pages': data_pages(path),
+                'footer_bytes': footer_size(path),
+                'bytes': os.path.getsize(path),
+                'write_seconds': round(write_seconds, 6),
+                'read_seconds': best_of(repeat, lambda: pq.read_table(path, use_threads=False)),
+            })
+
+    return write_manifest(os.path.join(directory, f'{name}.granularity.json'), {'dataset': name, 'read_repeat': repeat, 'variants': results})
@@ -0,0 +1,160 @@
+"""Row layouts for statistics based row group pruning.
+
+Writes the same rows several times, each time in a different order, so the
+effect of row group min/max statistics on pruning can be measured:
+ - random: rows shuffled, statistics of every row group span the whole domain
+ - sorted: rows sorted by a single key, declared as sorting column
+ - clustered: rows grouped into time buckets, random order inside a bucket
+ - zorder: rows ordered by a Z-order curve over two columns, both keep
+   reasonably narrow row group ranges
+
+Only the sorted layout is a lexicographic order of columns, other layouts
+declare no sorting columns. Keys default to the first numeric and the first
+timestamp top level column of the dataset, zorder uses both of them.
+"""
+import os
+from typing import Iterable
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from generators import predicates
+from generators.manifest import write_manifest
+from generators.writer import row_groups, write_batches
+
+LAYOUTS = ('random', 'sorted', 'clustered', 'zorder')
+
+DEFAULT_BUCKET_SECONDS = 3600
+
+
+def keys(schema: pa.Schema, sort_key: str | None = None, time_key: str | None = None, zorder_keys: tuple[str, str] | None = None) -> tuple[str, str, tuple[str, str]]:
+    """Sort key, time key and zorder keys with defaults derived from the schema, raises ValueError when the schema has no suitable columns."""
+    primitive = [field for field in schema if not pa.types.is_nested(field.type)]
+    numeric = [field.name for field in primitive if pa.types.is_integer(field.type) or pa.types.is_floating(field.type) or pa.types.is_decimal(field.type)]
+    # timestamps first, dates are a fallback of the time key
+    temporal = [field.name for field in primitive if pa.types.is_timestamp(field.type)] + [field.name for field in primitive if pa.types.is_date(field.type)]
+
+    sort_key = sort_key or next(iter(numeric), None)
+    time_key = time_key or next(iter(temporal), None)
+    if sort_key is None or time_key is None:
+        raise ValueError(f'layouts need a numeric and a timestamp top level column, there is no {"numeric" if sort_key is None else "timestamp"} one')
+
+    zorder_keys = tuple(zorder_keys or (sort_key, time_key))
+    for key in (sort_key, *zorder_keys):
+        if key not in [field.name for field in primitive]:
+            raise ValueError(f'layout key "{key}" is not a top level primitive column, columns: {", ".join(field.name for field in primitive)}')
+    if time_key not in temporal:
+        raise ValueError(f'time key "{time_key}" is not a top level timestamp or date column, columns: {", ".join(temporal) or "none"}')
+
+    return sort_key, time_key, zorder_keys
+
+
+def ranks(values: pa.ChunkedArray) -> np.ndarray:
+    """Zero based position of every value in ascending order."""
+    return pc.rank(values, sort_keys='ascending', tiebreaker='first').to_numpy().astype(np.uint64) - 1
+
+
+def spread_bits(values: np.ndarray) -> np.ndarray:
+    """Move lower 32 bits of every value to even bit positions."""
+    values = values & np.uint64(0xFFFFFFFF)
+    for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF), (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333), (1, 0x5555555555555555)):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+
+    return values
+
+
+def order(table: pa.Table, layout: str, rng: np.random.Generator, sort_key: str, time_key: str, zorder_keys: tuple[str, str], bucket_seconds: int) -> tuple[np.ndarray, list[pq.SortingColumn]]:
+    """Row indices of the layout together with sorting columns it declares."""
+    if layout == 'random':
+        return rng.permutation(table.num_rows), []
+
+    if layout == 'sorted':
+        indices = pc.sort_indices(table, sort_keys=[(sort_key, 'ascending')]).to_numpy()
+
+        return indices, list(pq.SortingColumn.from_ordering(table.schema, [(sort_key, 'ascending')]))
+
+    if layout == 'clustered':
+        shuffled = rng.permutation(table.num_rows)
+        buckets = pc.floor_temporal(table.column(time_key).take(shuffled), multiple=bucket_seconds, unit='second')
+
+        # sorting is stable, rows of a bucket keep their random order
+        return shuffled[pc.sort_indices(buckets).to_numpy()], []
+
+    if layout == 'zorder':
+        first, second = (ranks(table.column(key)) for key in zorder_keys)
+
+        return np.argsort(spread_bits(first) | (spread_bits(second) << np.uint64(1)), kind='stable'), []
+
+    raise ValueError(f'Unknown layout "{layout}", expected one of: {", ".join(LAYOUTS)}')
+
+
+def statistics(path: str, columns: list[str]) -> dict[str, list[list]]:
+    """Min and max of given columns in every row group."""
+    metadata = pq.read_metadata(path)
+    leaves = [metadata.schema.column(index).path for index in range(metadata.num_columns)]
+
+    result = {}
+    for column in columns:
+        index = leaves.index(column)
+        result[column] = []
+        for row_group in range(metadata.num_row_groups):
+            chunk = metadata.row_group(row_group).column(index)
+            result[column].append([chunk.statistics.min, chunk.statistics.max] if chunk.is_stats_set and chunk.statistics.has_min_max else None)
+
+    return result
+
+
+def write_layouts(
+    name: str,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch | pa.Table],
+    out_dir: str,
+    row_group_size: int,
+    seed: int,
+    layouts: Iterable[str] = LAYOUTS,
+    sort_key: str | None = None,
+    time_key: str | None = None,
+    zorder_keys: tuple[str, str] | None = None,
+    bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+    conditions: list[predicates.Predicate] = (),
+    **options,
+) -> str:
+    """Write the whole dataset once per layout into <out_dir>/layouts, returns path of the manifest."""
+    sort_key, time_key, zorder_keys = keys(schema, sort_key, time_key, zorder_keys)
+    table = pa.concat_tables(item if isinstance(item, pa.Table) else pa.Table.from_batches([item]) for item in batches)
+    directory = os.path.join(out_dir, 'layouts')
+    os.makedirs(directory, exist_ok=True)
+    columns = list(dict.fromkeys([sort_key, time_key, *zorder_keys]))
+
+    results = []
+    for layout in layouts:
+        indices, sorting_columns = order(table, layout, np.random.default_rng(seed), sort_key, time_key, zorder_keys, bucket_seconds)
+        ordered = table.take(indices)
+        path = os.path.join(directory, f'{name}.{layout}.parquet')
+
+        rows = write_batches(path, schema, (ordered.slice(start, size) for start, size in row_groups(ordered.num_rows, row_group_size)), sorting_columns=sorting_columns, **options)
+        metadata = pq.read_metadata(path)
+
+        result = {
+            'layout': layout,
+            'file': os.path.basename(path),
+            'rows': rows,
+            'row_groups': metadata.num_row_groups,
+            'bytes': os.path.getsize(path),
+            'sorting_columns': [
+                {'column': metadata.schema.column(column.column_index).path, 'descending': column.descending, 'nulls_first': column.nulls_first}
+                for column in sorting_columns
+            ],
+            'statistics': statistics(path, columns),
+        }
+        if conditions:
+            oracle = predicates.oracle(path, list(conditions))
+            result['row_groups_skipped_by_statistics'] = {
+                condition['predicate']: sum(row_group['skip_by_statistics'] for row_group in condition['row_groups']) for condition in oracle['predicates']
+            }
+
+        results.append(result)
+
+    return write_manifest(os.path.join(directory, f'{name}.layouts.json'), {'dataset': name, 'row_group_size': row_group_size, 'layouts': results})
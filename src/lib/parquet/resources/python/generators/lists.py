@@ -1,53 +1,11 @@
-import pandas as pd
-import random
-import os
+import numpy as np
 import pyarrow as pa
-import pyarrow.parquet as pq
 
-# Number of rows to generate
-n_rows = 100
+from generators import columns, nested
+from generators.nulls import DEFAULT_NULLS, NullPolicy
 
-# Functions to generate the data
-def generate_list_nested():
-    return [
-        [
-            [
-                random.randint(1, 10) for _ in range(random.randint(1, 3))
-            ] for _ in range(random.randint(1, 3))
-        ] for _ in range(random.randint(1, 3))
-    ]
-
-def generate_struct():
-    return {'id': random.randint(1, 100), 'name': 'name_' + str(random.randint(1, 100))}
-
-def generate_list_of_structs():
-    return [generate_struct() for _ in range(random.randint(1, 5))]
-
-
-# Columns
-list_col = pd.Series([[random.randint(1, 10) for _ in range(3)] for _ in range(n_rows)], dtype='object')
-list_nullable_col = pd.Series([[random.randint(1, 10) for _ in range(3)] if i % 2 == 0 else None for i in range(n_rows)], dtype='object')
-list_mixed_types_col = pd.Series([
-    [
-        {'int': i, 'string': None, 'bool': None},
-        {'int': None, 'string': "string_" + str(i), 'bool': None},
-        {'int': None, 'string': None, 'bool': bool(i % 2)},
-        {'int': None, 'string': None, 'bool': None}
-    ] for i in range(n_rows)
-], dtype='object')
-list_nested_col = pd.Series([generate_list_nested() for _ in range(n_rows)], dtype='object')
-list_of_structs_col = pd.Series([generate_list_of_structs() for _ in range(n_rows)], dtype='object')
-list_of_structs_nullable_col = pd.Series([generate_list_of_structs() if i % 2 == 0 else None for i in range(n_rows)], dtype='object')
-
-# Creating the DataFrame with only the new column
-df_nested_list = pd.DataFrame({
-    'list': list_col,
-    'list_nullable': list_nullable_col,
-    'list_mixed_types': list_mixed_types_col,
-    'list_nested': list_nested_col,
-    'list_of_structs': list_of_structs_col,
-    'list_of_structs_nullable': list_of_structs_nullable_col
-})
+# Default number of rows to generate
+n_rows = 100
 
 # Types
 struct_type = pa.struct([
@@ -76,22 +34,55 @@ schema = pa.schema([
     ('list_of_structs_nullable', list_of_structs_type)
 ])
 
-parquet_file = 'output/lists.parquet'
-# Create a PyArrow Table
-table = pa.Table.from_pandas(df_nested_list, schema=schema)
+# Functions to generate the data
+def generate_list(rng, n_rows, valid=None):
+    counts = nested.fixed_counts(n_rows, 3, valid)
+
+    return nested.list_of(list_type, counts, columns.integers(rng, int(counts.sum()), 1, 10), valid)
+
+def generate_list_mixed_types(rows):
+    # every row holds 4 structs, each one with a single field set: int, string, bool and none of them
+    counts = nested.fixed_counts(len(rows), 4)
+    row = np.repeat(rows, 4)
+    position = nested.positions(counts)
+
+    return nested.list_of(list_mixed_type, counts, nested.struct_of(list_mixed_type.value_type, [
+        columns.fixed_width(pa.int32(), row.astype(np.int32), position == 0),
+        columns.prefixed_strings('string_', row, position == 1),
+        columns.fixed_width(pa.bool_(), row % 2 == 1, position == 2),
+    ]))
+
+def generate_list_nested(rng, n_rows):
+    outer = nested.counts(rng, n_rows, 1, 3)
+    middle = nested.counts(rng, int(outer.sum()), 1, 3)
+    inner = nested.counts(rng, int(middle.sum()), 1, 3)
+    values = columns.integers(rng, int(inner.sum()), 1, 10)
+
+    return nested.list_of(
+        list_nested_type,
+        outer,
+        nested.list_of(list_nested_type.value_type, middle, nested.list_of(list_nested_type.value_type.value_type, inner, values)),
+    )
+
+def generate_list_of_structs(rng, n_rows, valid=None):
+    counts = nested.counts(rng, n_rows, 1, 5, valid)
+    size = int(counts.sum())
 
-# Check if the file exists and remove it
-if os.path.exists(parquet_file):
-    os.remove(parquet_file)
+    return nested.list_of(list_of_structs_type, counts, nested.struct_of(struct_type, [
+        columns.integers(rng, size, 1, 100),
+        columns.prefixed_strings('name_', rng.integers(1, 101, size)),
+    ]), valid)
 
-# Write the PyArrow Table to a Parquet file
-with pq.ParquetWriter(parquet_file, schema, compression='SNAPPY') as writer:
-    writer.write_table(table)
 
-pd.set_option('display.max_columns', None)  # Show all columns
-pd.set_option('display.max_rows', None)     # Show all rows
-pd.set_option('display.width', None)        # Auto-detect the width for displaying
-pd.set_option('display.max_colwidth', None) # Show complete text in each cell
+def generate(n_rows: int, rng: np.random.Generator, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> pa.RecordBatch:
+    rows = columns.row_numbers(n_rows, start)
+    valid = {name: nulls.valid(name, rng, n_rows, start) for name in ('list_nullable', 'list_of_structs_nullable')}
 
-# Show the first few rows of the DataFrame for verification
-print(df_nested_list.head(10))
+    return pa.RecordBatch.from_arrays([
+        generate_list(rng, n_rows),
+        generate_list(rng, n_rows, valid['list_nullable']),
+        generate_list_mixed_types(rows),
+        generate_list_nested(rng, n_rows),
+        generate_list_of_structs(rng, n_rows),
+        generate_list_of_structs(rng, n_rows, valid['list_of_structs_nullable']),
+    ], schema=schema)
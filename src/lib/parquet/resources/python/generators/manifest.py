@@ -0,0 +1,34 @@
+"""Machine readable reports written next to generated files."""
+import json
+import os
+import time
+from typing import Any, Callable
+
+from generators.writer import unlink_existing
+
+
+def write_manifest(path: str, data: Any) -> str:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    unlink_existing(path)
+
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=2, default=str)
+        file.write('\n')
+
+    return path
+
+
+def read_manifest(path: str) -> Any:
+    with open(path) as file:
+        return json.load(file)
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    """Fastest of repeated calls in seconds, rounded like every timing of reports."""
+    seconds = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        seconds = min(seconds, time.perf_counter() - started)
+
+    return round(seconds, 6)
@@ -1,119 +1,12 @@
-import pandas as pd
-import random
-import os
+import numpy as np
 import pyarrow as pa
-import pyarrow.parquet as pq
-import sys
 
-pd.set_option('display.max_columns', None)  # Show all columns
-pd.set_option('display.max_rows', None)     # Show all rows
-pd.set_option('display.width', None)        # Auto-detect the width for displaying
-pd.set_option('display.max_colwidth', None) # Show complete text in each cell
+from generators import columns, nested
+from generators.nulls import DEFAULT_NULLS, NullPolicy
 
-# Number of rows to generate
+# Default number of rows to generate
 n_rows = 100
 
-# Functions to generate the data
-def generate_map_of_maps():
-    return {
-        f'outer_key_{i}': {
-            f'inner_key_{j}': random.randint(1, 10)
-            for j in range(random.randint(1, 3))
-        }
-        for i in range(random.randint(1, 3))
-    }
-
-def generate_map_complex_nested_list():
-    return [
-        [
-            {
-                'int': random.randint(1, 10),
-                'string': f'string_{i}_{j}'
-            }
-            for j in range(random.randint(1, 3))
-        ]
-        for i in range(random.randint(1, 3))
-    ]
-
-def generate_map_of_lists():
-    return {f'key_{i}': [random.randint(1, 10) for _ in range(random.randint(1, 3))] for i in range(random.randint(1, 3))}
-
-def generate_map_of_complex_lists():
-    return {
-        f'key_{i}': [
-            {
-                'int': random.randint(1, 10),
-                'string': f'string_{i}_{j}',
-                'bool': bool(random.getrandbits(1))
-            }
-            for j in range(random.randint(1, 3))
-        ]
-        for i in range(random.randint(1, 3))
-    }
-
-def generate_map_of_list_of_map_of_lists():
-    return {
-        f'key_{i}': [
-            {
-                f'string_{i}_{j}_{k}': [random.randint(1, 10) for _ in range(random.randint(1, 3))]
-                for k in range(random.randint(1, 3))
-            }
-            for j in range(random.randint(1, 3))
-        ]
-        for i in range(random.randint(1, 3))
-    }
-
-def generate_map_of_structs():
-    map_of_structs_data = []
-    for i in range(n_rows):
-        # Generating a map where each value is a struct with an Int32 and a String field
-        map_of_structs_value = {
-            f'key_{j}': {
-                'int_field': j,
-                'string_field': f'string_{j}'
-            } for j in range(3)
-        }
-        map_of_structs_data.append(map_of_structs_value)
-    return map_of_structs_data
-
-def generate_map_of_struct_of_structs(n_rows):
-    map_of_struct_of_structs_data = []  # List to hold all the data
-    for i in range(n_rows):
-        map_of_struct_of_structs_value = {
-            f'key_{j}': {
-                'struct': {
-                    'nested_struct': {
-                        'int': random.randint(1, 100),
-                        'string': f'string_{j}'
-                    }
-                }
-            } for j in range(3)  # Creating 3 key-value pairs in each map
-        }
-        map_of_struct_of_structs_data.append(map_of_struct_of_structs_value)
-    return map_of_struct_of_structs_data
-
-# Columns
-map_col = [{"key_" + str(i): i} for i in range(n_rows)]
-map_nullable_col = pd.Series([{"key_" + str(i): i} if i % 2 == 0 else None for i in range(n_rows)], dtype='object')
-map_of_maps_col = pd.Series([generate_map_of_maps() for _ in range(n_rows)], dtype='object')
-map_of_lists_col = pd.Series([generate_map_of_lists() for _ in range(n_rows)], dtype='object')
-map_of_complex_lists_col = pd.Series([generate_map_of_complex_lists() for _ in range(n_rows)], dtype='object')
-map_of_list_of_map_of_lists_col = pd.Series([generate_map_of_list_of_map_of_lists() for _ in range(n_rows)], dtype='object')
-map_of_structs_col = generate_map_of_structs()
-map_of_struct_of_structs_col = generate_map_of_struct_of_structs(n_rows)
-
-# Creating the DataFrame with only the new column
-df_nested_list = pd.DataFrame({
-    'map': map_col,
-    'map_nullable': map_nullable_col,
-    'map_of_maps': map_of_maps_col,
-    'map_of_lists': map_of_lists_col,
-    'map_of_complex_lists': map_of_complex_lists_col,
-    'map_of_list_of_map_of_lists': map_of_list_of_map_of_lists_col,
-    'map_of_structs': map_of_structs_col,
-    'map_of_struct_of_structs': map_of_struct_of_structs_col
-})
-
 # Types
 map_type = pa.map_(pa.string(), pa.int32())
 map_of_maps_type = pa.map_(
@@ -177,17 +70,119 @@ schema = pa.schema([
     ('map_of_struct_of_structs', map_of_struct_of_structs_type),
 ])
 
-parquet_file = 'output/maps.parquet'
-# Create a PyArrow Table
-table = pa.Table.from_pandas(df_nested_list, schema=schema)
 
-# Check if the file exists and remove it
-if os.path.exists(parquet_file):
-    os.remove(parquet_file)
+# Functions to generate the data
+def generate_map(rows, valid=None):
+    counts = nested.fixed_counts(len(rows), 1, valid)
+    row = rows[counts > 0]
+
+    return nested.map_of(map_type, counts, columns.prefixed_strings('key_', row), columns.fixed_width(pa.int32(), row.astype(np.int32)), valid)
+
+def generate_map_of_maps(rng, n_rows):
+    outer = nested.counts(rng, n_rows, 1, 3)
+    inner = nested.counts(rng, int(outer.sum()), 1, 3)
+
+    return nested.map_of(
+        map_of_maps_type,
+        outer,
+        nested.labels('outer_key_', nested.positions(outer)),
+        nested.map_of(map_of_maps_type.item_type, inner, nested.labels('inner_key_', nested.positions(inner)), columns.integers(rng, int(inner.sum()), 1, 10)),
+    )
+
+def generate_map_of_lists(rng, n_rows):
+    entries = nested.counts(rng, n_rows, 1, 3)
+    elements = nested.counts(rng, int(entries.sum()), 1, 3)
+
+    return nested.map_of(
+        map_of_lists_type,
+        entries,
+        nested.labels('key_', nested.positions(entries)),
+        nested.list_of(map_of_lists_type.item_type, elements, columns.integers(rng, int(elements.sum()), 1, 10)),
+    )
+
+def generate_map_of_complex_lists(rng, n_rows):
+    entries = nested.counts(rng, n_rows, 1, 3)
+    elements = nested.counts(rng, int(entries.sum()), 1, 3)
+    size = int(elements.sum())
+
+    return nested.map_of(
+        map_of_complex_lists_type,
+        entries,
+        nested.labels('key_', nested.positions(entries)),
+        nested.list_of(map_of_complex_lists_type.item_type, elements, nested.struct_of(map_of_complex_lists_element_type, [
+            columns.integers(rng, size, 1, 10),
+            nested.labels('string_', nested.positions(entries)[nested.parents(elements)], nested.positions(elements)),
+            columns.booleans(rng, size),
+        ])),
+    )
+
+def generate_map_of_list_of_map_of_lists(rng, n_rows):
+    entries = nested.counts(rng, n_rows, 1, 3)
+    maps = nested.counts(rng, int(entries.sum()), 1, 3)
+    inner_entries = nested.counts(rng, int(maps.sum()), 1, 3)
+    elements = nested.counts(rng, int(inner_entries.sum()), 1, 3)
+
+    # key of every inner map entry is made of positions of its ancestors: string_<entry>_<map>_<inner entry>
+    map_entry = nested.parents(inner_entries)
+    key = nested.labels(
+        'string_',
+        nested.positions(entries)[nested.parents(maps)][map_entry],
+        nested.positions(maps)[map_entry],
+        nested.positions(inner_entries),
+    )
+
+    return nested.map_of(
+        map_of_list_of_map_of_lists_type,
+        entries,
+        nested.labels('key_', nested.positions(entries)),
+        nested.list_of(map_of_list_of_map_of_lists_inner_list_type, maps, nested.map_of(
+            map_of_list_of_map_of_lists_inner_list_map_type,
+            inner_entries,
+            key,
+            nested.list_of(map_of_list_of_map_of_lists_inner_list_map_type.item_type, elements, columns.integers(rng, int(elements.sum()), 1, 10)),
+        )),
+    )
+
+def generate_map_of_structs(n_rows):
+    # Generating a map where each value is a struct with an Int32 and a String field
+    entries = nested.fixed_counts(n_rows, 3)
+    position = nested.positions(entries)
+
+    return nested.map_of(map_of_structs_type, entries, nested.labels('key_', position), nested.struct_of(map_of_structs_struct, [
+        columns.fixed_width(pa.int32(), position.astype(np.int32)),
+        nested.labels('string_', position),
+    ]))
+
+def generate_map_of_struct_of_structs(rng, n_rows):
+    # Creating 3 key-value pairs in each map
+    entries = nested.fixed_counts(n_rows, 3)
+    position = nested.positions(entries)
+
+    nested_struct = nested.struct_of(map_of_struct_of_structs_struct_struct_struct_type, [
+        columns.integers(rng, len(position), 1, 100),
+        nested.labels('string_', position),
+    ])
+
+    return nested.map_of(
+        map_of_struct_of_structs_type,
+        entries,
+        nested.labels('key_', position),
+        nested.struct_of(map_of_struct_of_structs_struct_type, [
+            nested.struct_of(map_of_struct_of_structs_struct_struct_type, [nested_struct]),
+        ]),
+    )
+
 
-# Write the PyArrow Table to a Parquet file
-with pq.ParquetWriter(parquet_file, schema, compression='SNAPPY') as writer:
-    writer.write_table(table)
+def generate(n_rows: int, rng: np.random.Generator, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> pa.RecordBatch:
+    rows = columns.row_numbers(n_rows, start)
 
-# Show the first few rows of the DataFrame for verification
-print(df_nested_list.head(1))
+    return pa.RecordBatch.from_arrays([
+        generate_map(rows),
+        generate_map(rows, nulls.valid('map_nullable', rng, n_rows, start)),
+        generate_map_of_maps(rng, n_rows),
+        generate_map_of_lists(rng, n_rows),
+        generate_map_of_complex_lists(rng, n_rows),
+        generate_map_of_list_of_map_of_lists(rng, n_rows),
+        generate_map_of_structs(n_rows),
+        generate_map_of_struct_of_structs(rng, n_rows),
+    ], schema=schema)
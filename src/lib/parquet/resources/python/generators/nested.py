@@ -0,0 +1,67 @@
+"""Vectorized nested column builders.
+
+List, map and struct arrays are assembled straight from offsets computed with
+NumPy, child arrays and validity bitmaps, instead of converting nested Python
+objects row by row.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def offsets(counts: np.ndarray) -> np.ndarray:
+    """List offsets of consecutive groups of given sizes."""
+    result = np.zeros(len(counts) + 1, dtype=np.int32)
+    np.cumsum(counts, out=result[1:])
+
+    return result
+
+
+def counts(rng: np.random.Generator, n_rows: int, low: int, high: int, valid: np.ndarray | None = None) -> np.ndarray:
+    """Random number of elements between low and high (inclusive) for every row, null rows have no elements."""
+    result = rng.integers(low, high + 1, n_rows)
+
+    return result if valid is None else np.where(valid, result, 0)
+
+
+def fixed_counts(n_rows: int, count: int, valid: np.ndarray | None = None) -> np.ndarray:
+    result = np.full(n_rows, count, dtype=np.int64)
+
+    return result if valid is None else np.where(valid, result, 0)
+
+
+def parents(counts: np.ndarray) -> np.ndarray:
+    """Index of parent row of every element."""
+    return np.repeat(np.arange(len(counts)), counts)
+
+
+def positions(counts: np.ndarray) -> np.ndarray:
+    """Position of every element within its parent row."""
+    return np.arange(int(counts.sum())) - np.repeat(offsets(counts)[:-1], counts)
+
+
+def null_mask(valid: np.ndarray | None) -> pa.Array | None:
+    return None if valid is None else pa.array(~valid)
+
+
+def labels(prefix: str, *numbers: np.ndarray) -> pa.Array:
+    """Strings like 'string_1_2' made of prefix and numbers separated with underscores."""
+    parts = [prefix]
+    for index, number in enumerate(numbers):
+        if index:
+            parts.append('_')
+        parts.append(pc.cast(pa.array(number), pa.string()))
+
+    return pc.binary_join_element_wise(*parts, '')
+
+
+def list_of(data_type: pa.ListType, counts: np.ndarray, values: pa.Array, valid: np.ndarray | None = None) -> pa.ListArray:
+    return pa.ListArray.from_arrays(pa.array(offsets(counts)), values, type=data_type, mask=null_mask(valid))
+
+
+def map_of(data_type: pa.MapType, counts: np.ndarray, keys: pa.Array, items: pa.Array, valid: np.ndarray | None = None) -> pa.MapArray:
+    return pa.MapArray.from_arrays(pa.array(offsets(counts)), keys, items, type=data_type, mask=null_mask(valid))
+
+
+def struct_of(data_type: pa.StructType, arrays: list[pa.Array], valid: np.ndarray | None = None) -> pa.StructArray:
+    return pa.StructArray.from_arrays(arrays, fields=list(data_type), mask=null_mask(valid))
@@ -0,0 +1,175 @@
+"""Nesting depth sweep.
+
+Writes columns made of list, map and struct levels repeated to any depth, for
+example list<list<...<int64>>> or struct<map<list<struct<...>>>>, and reports
+max repetition and definition levels of leaf columns next to file sizes and
+write and read times.
+
+Number of elements of every list and map follows a Poisson distribution with
+a configurable mean per level, structs have a configurable number of fields
+(fan-out) and every level is nullable with a configurable null pattern.
+
+Examples:
+    python -m generators.nesting
+    python -m generators.nesting --pattern struct map list --depths 3 6 9 --elements 2 --struct-width 2 --nulls bernoulli:0.2
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators import columns, nested
+from generators.datasets import DEFAULT_SEED
+from generators.manifest import write_manifest
+from generators.nulls import Nulls
+from generators.writer import row_groups, write_batches
+
+LEVELS = ('list', 'map', 'struct')
+LEAVES = {'int64': pa.int64(), 'string': pa.string()}
+DEFAULT_DEPTHS = (1, 2, 4, 8, 16)
+
+
+def levels(pattern: tuple[str, ...], depth: int) -> tuple[str, ...]:
+    """Pattern repeated up to depth levels, outermost first."""
+    return tuple(pattern[index % len(pattern)] for index in range(depth))
+
+
+def nested_type(shape: tuple[str, ...], leaf: pa.DataType, struct_width: int) -> pa.DataType:
+    if not shape:
+        return leaf
+
+    child = nested_type(shape[1:], leaf, struct_width)
+    if shape[0] == 'list':
+        return pa.list_(child)
+    if shape[0] == 'map':
+        return pa.map_(pa.int32(), child)
+
+    return pa.struct([pa.field(f'f{index}', child) for index in range(struct_width)])
+
+
+def build(data_type: pa.DataType, n_rows: int, rng: np.random.Generator, elements: tuple[float, ...], nulls: Nulls, level: int = 0) -> pa.Array:
+    """Array of n_rows values of a nested type, every level nullable."""
+    valid = nulls.valid(rng, n_rows)
+
+    if pa.types.is_map(data_type) or pa.types.is_list(data_type):
+        counts = np.where(valid, rng.poisson(elements[min(level, len(elements) - 1)], n_rows), 0)
+        size = int(counts.sum())
+
+        if pa.types.is_map(data_type):
+            items = build(data_type.item_type, size, rng, elements, nulls, level + 1)
+            keys = columns.fixed_width(pa.int32(), nested.positions(counts).astype(np.int32))
+
+            return nested.map_of(data_type, counts, keys, items, valid)
+
+        return nested.list_of(data_type, counts, build(data_type.value_type, size, rng, elements, nulls, level + 1), valid)
+
+    if pa.types.is_struct(data_type):
+        return nested.struct_of(data_type, [build(field.type, n_rows, rng, elements, nulls, level + 1) for field in data_type], valid)
+
+    if pa.types.is_string(data_type):
+        return columns.prefixed_strings('value_', rng.integers(0, 1_000_000, n_rows), valid)
+
+    return columns.integers(rng, n_rows, 0, 1_000_000, valid).cast(data_type)
+
+
+def leaf_levels(metadata: pq.FileMetaData) -> dict:
+    """Max repetition and definition levels and number of values of the deepest leaf column."""
+    index = max(range(metadata.num_columns), key=lambda index: metadata.schema.column(index).max_definition_level)
+    column = metadata.schema.column(index)
+
+    return {
+        'leaf_columns': metadata.num_columns,
+        'path': column.path,
+        'max_repetition_level': column.max_repetition_level,
+        'max_definition_level': column.max_definition_level,
+        'leaf_values': sum(metadata.row_group(row_group).column(index).num_values for row_group in range(metadata.num_row_groups)),
+    }
+
+
+def write_depth(
+    path: str,
+    shape: tuple[str, ...],
+    n_rows: int,
+    row_group_size: int,
+    seed: int,
+    elements: tuple[float, ...],
+    struct_width: int,
+    nulls: Nulls,
+    leaf: pa.DataType,
+    **options,
+) -> dict:
+    schema = pa.schema([('nested', nested_type(shape, leaf, struct_width))])
+    rng = np.random.default_rng(seed)
+    source = (pa.RecordBatch.from_arrays([build(schema.field(0).type, size, rng, elements, nulls)], schema=schema) for _, size in row_groups(n_rows, row_group_size))
+
+    started = time.perf_counter()
+    rows = write_batches(path, schema, source, **options)
+    write_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pq.read_table(path, use_threads=False)
+    read_seconds = time.perf_counter() - started
+
+    return {
+        'file': os.path.basename(path),
+        'depth': len(shape),
+        'type': str(schema.field(0).type),
+        'rows': rows,
+        **leaf_levels(pq.read_metadata(path)),
+        'bytes': os.path.getsize(path),
+        'write_seconds': round(write_seconds, 6),
+        'read_seconds': round(read_seconds, 6),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.nesting', description='Write nested columns of growing depth and report their levels.')
+    parser.add_argument('--pattern', nargs='+', choices=LEVELS, default=['list'], help='levels repeated from the outermost one down to the depth (default: list)')
+    parser.add_argument('--depths', type=int, nargs='+', default=DEFAULT_DEPTHS, help=f'number of nested levels of every file (default: {" ".join(map(str, DEFAULT_DEPTHS))})')
+    parser.add_argument('--elements', type=float, nargs='+', default=[1.5], help='mean number of elements of lists and maps per level, the last one is used for deeper levels (default: 1.5)')
+    parser.add_argument('--struct-width', type=int, default=1, help='number of fields of every struct (default: 1)')
+    parser.add_argument('--nulls', type=Nulls.parse, default=Nulls('bernoulli', 0.05), help='null pattern of every level (default: bernoulli:0.05)')
+    parser.add_argument('--leaf', choices=LEAVES, default='int64', help='type of innermost values (default: int64)')
+    parser.add_argument('--rows', type=int, default=10_000, help='number of rows (default: 10000)')
+    parser.add_argument('--row-group-size', type=int, default=10_000, help='rows per row group (default: 10000)')
+    parser.add_argument('--compression', type=str.upper, default='SNAPPY', help='compression codec (default: SNAPPY)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--out-dir', default='output', help='output directory, files are written into its nesting subdirectory (default: output)')
+    args = parser.parse_args(argv)
+
+    directory = os.path.join(args.out_dir, 'nesting')
+    os.makedirs(directory, exist_ok=True)
+
+    files = []
+    for depth in args.depths:
+        shape = levels(tuple(args.pattern), depth)
+        path = os.path.join(directory, f'{"-".join(args.pattern)}-{depth}.parquet')
+        files.append(write_depth(
+            path,
+            shape,
+            args.rows,
+            args.row_group_size,
+            args.seed,
+            tuple(args.elements),
+            args.struct_width,
+            args.nulls,
+            LEAVES[args.leaf],
+            compression=args.compression,
+        ))
+        print(f'{path}: depth {depth}, max definition level {files[-1]["max_definition_level"]}, {files[-1]["leaf_values"]} leaf values')
+
+    path = write_manifest(os.path.join(directory, 'nesting.json'), {
+        'pattern': args.pattern,
+        'elements': args.elements,
+        'struct_width': args.struct_width,
+        'nulls': str(args.nulls),
+        'files': files,
+    })
+    print(f'report written to {path}')
+
+
+if __name__ == '__main__':
+    main()
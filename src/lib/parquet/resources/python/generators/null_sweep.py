@@ -0,0 +1,47 @@
+"""Null density sweep.
+
+Every column holds the same int64 sequence with a different null pattern:
+Bernoulli nulls and runs of nulls of several mean lengths, at null ratios from
+0 to 100%, plus the alternating pattern. Definition levels of the columns range
+from a single RLE run to bit packed noise.
+"""
+import numpy as np
+import pyarrow as pa
+
+from generators import columns
+from generators.nulls import DEFAULT_NULLS, NullPolicy, Nulls
+
+# Default number of rows to generate
+n_rows = 100000
+
+RATIOS = (0.0, 0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999, 1.0)
+RUN_LENGTHS = (8, 1000)
+
+
+def label(nulls: Nulls) -> str:
+    """Column name of a pattern, e.g. bernoulli_0_250 or runs_1000_0_010."""
+    if nulls.kind == 'alternating':
+        return nulls.kind
+    if nulls.kind == 'bernoulli':
+        return f'bernoulli_{nulls.ratio:.3f}'.replace('.', '_')
+
+    return f'runs_{nulls.run_length:g}_{nulls.ratio:.3f}'.replace('.', '_')
+
+
+PATTERNS = {
+    label(nulls): nulls for nulls in [
+        Nulls('alternating'),
+        *[Nulls('bernoulli', ratio) for ratio in RATIOS],
+        *[Nulls('runs', ratio, length) for length in RUN_LENGTHS for ratio in RATIOS],
+    ]
+}
+
+schema = pa.schema([(name, pa.int64()) for name in PATTERNS])
+
+
+def generate(n_rows: int, rng: np.random.Generator, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> pa.RecordBatch:
+    """Every column follows its own pattern, unless the null policy overrides it by column name."""
+    return pa.RecordBatch.from_arrays([
+        columns.int64_sequence(n_rows, start, nulls.valid(name, rng, n_rows, start, fallback=pattern))
+        for name, pattern in PATTERNS.items()
+    ], schema=schema)
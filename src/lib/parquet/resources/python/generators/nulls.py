@@ -0,0 +1,115 @@
+"""Null patterns of nullable columns.
+
+A pattern is written as "<kind>[:<ratio>[:<run length>]]":
+ - alternating: values on even rows, nulls on odd rows (default, ratio ignored)
+ - bernoulli:<ratio>: every row is null independently with given probability
+ - runs:<ratio>:<run length>: nulls come in runs of geometrically distributed
+   length with given mean, separated by runs of values, so the overall share of
+   nulls matches the ratio
+
+Patterns are chosen for all nullable columns at once and can be overridden for
+single columns by name, nested fields are named by their path, for example
+"struct_flat.string_nullable".
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+import pyarrow as pa
+
+KINDS = ('alternating', 'bernoulli', 'runs')
+
+
+@dataclass(frozen=True)
+class Nulls:
+    kind: str = 'alternating'
+    ratio: float = 0.5
+    run_length: float = 8.0
+
+    @classmethod
+    def parse(cls, pattern: str) -> 'Nulls':
+        kind, *parameters = pattern.split(':')
+        if kind not in KINDS or len(parameters) > 2:
+            raise ValueError(f'Null pattern "{pattern}" must look like "<kind>[:<ratio>[:<run length>]]", kinds: {", ".join(KINDS)}')
+
+        nulls = cls(kind, *map(float, parameters))
+        if not 0.0 <= nulls.ratio <= 1.0 or nulls.run_length < 1.0:
+            raise ValueError(f'Null pattern "{pattern}" needs ratio between 0 and 1 and run length of at least 1')
+
+        return nulls
+
+    def __str__(self) -> str:
+        if self.kind == 'alternating':
+            return self.kind
+        if self.kind == 'bernoulli':
+            return f'{self.kind}:{self.ratio:g}'
+
+        return f'{self.kind}:{self.ratio:g}:{self.run_length:g}'
+
+    def valid(self, rng: np.random.Generator, n_rows: int, start: int = 0) -> np.ndarray:
+        """Mask of rows holding a value."""
+        if self.kind == 'alternating':
+            return np.arange(start, start + n_rows) % 2 == 0
+        if self.ratio <= 0.0:
+            return np.ones(n_rows, dtype=bool)
+        if self.ratio >= 1.0:
+            return np.zeros(n_rows, dtype=bool)
+        if self.kind == 'bernoulli':
+            return rng.random(n_rows) >= self.ratio
+
+        return self.runs(rng, n_rows)
+
+    def runs(self, rng: np.random.Generator, n_rows: int) -> np.ndarray:
+        # mean length of value runs giving the requested share of nulls, when it would be shorter than
+        # a single row, null runs get longer instead, so the share of nulls is kept
+        null_length = max(self.run_length, self.ratio / (1.0 - self.ratio))
+        value_length = null_length * (1.0 - self.ratio) / self.ratio
+        n_runs = int(n_rows / (null_length + value_length)) + 16
+
+        while True:
+            lengths = np.empty(n_runs * 2, dtype=np.int64)
+            lengths[0::2] = rng.geometric(1.0 / value_length, n_runs)
+            lengths[1::2] = rng.geometric(1.0 / null_length, n_runs)
+
+            # random phase, so row groups do not all start with a run of values
+            offset = int(rng.integers(0, lengths[0] + lengths[1]))
+            if lengths.sum() >= n_rows + offset:
+                break
+            n_runs *= 2
+
+        return np.repeat(np.tile([True, False], n_runs), lengths)[offset:offset + n_rows]
+
+
+@dataclass(frozen=True)
+class NullPolicy:
+    default: Nulls = Nulls()
+    columns: dict[str, Nulls] = field(default_factory=dict)
+
+    def valid(self, column: str, rng: np.random.Generator, n_rows: int, start: int = 0, fallback: Nulls | None = None) -> np.ndarray:
+        """Mask of rows holding a value of the column, column override first, then fallback of the dataset, then default."""
+        return (self.columns.get(column) or fallback or self.default).valid(rng, n_rows, start)
+
+    def __str__(self) -> str:
+        return ','.join([str(self.default), *(f'{column}={nulls}' for column, nulls in sorted(self.columns.items()))])
+
+
+DEFAULT_NULLS = NullPolicy()
+
+
+def field_paths(fields: pa.Schema | pa.StructType, parent: str = '') -> list[str]:
+    """Names of overridable columns: every field, nested struct fields named by their path."""
+    paths = []
+    for child in fields:
+        path = f'{parent}{child.name}'
+        paths.append(path)
+        if pa.types.is_struct(child.type):
+            paths.extend(field_paths(child.type, f'{path}.'))
+
+    return paths
+
+
+def parse_override(override: str) -> tuple[str, Nulls]:
+    column, found, pattern = override.partition('=')
+    if not found:
+        raise ValueError(f'Column null pattern "{override}" must look like "<column>=<pattern>"')
+
+    return column, Nulls.parse(pattern)
@@ -1,44 +1,16 @@
-import pandas as pd
-import pyarrow as pa
-import pyarrow.parquet as pq
-from faker import Faker
-import uuid
 from datetime import datetime
-import random
-
-# Initialize Faker
-fake = Faker()
-
-# Number of rows you want in your Parquet file
-num_rows = 100000
-
-# Generate data
-order_ids = [str(uuid.uuid4()) for _ in range(num_rows)]
-total_prices = [round(random.uniform(50.0, 200.0), 2) for _ in range(num_rows)]
-discounts = [round(random.uniform(0.0, 50.0), 2) for _ in range(num_rows)]
-created_at = [datetime.now() for _ in range(num_rows)]
-updated_at = [datetime.now() for _ in range(num_rows)]
 
-customers = [{'customer_id': str(uuid.uuid4()), 'first_name': fake.first_name(), 'last_name': fake.last_name(), 'email': fake.email()} for _ in range(num_rows)]
-
-addresses = [{'address_id': str(uuid.uuid4()), 'street': fake.street_address(), 'city': fake.city(), 'state': fake.state(), 'zip': fake.zipcode(), 'country': fake.country()} for _ in range(num_rows)]
+import numpy as np
+import pyarrow as pa
 
-order_lines = [[{'order_line_id': str(uuid.uuid4()), 'product_id': str(uuid.uuid4()), 'quantity': random.randint(1, 10), 'price': round(random.uniform(1.0, 50.0), 2)} for _ in range(random.randint(1, 5))] for _ in range(num_rows)]
+from generators import columns, nested, text
+from generators.nulls import DEFAULT_NULLS, NullPolicy
 
-notes = [[{'note_id': str(uuid.uuid4()), 'note_text': fake.text()} for _ in range(random.randint(1, 3))] for _ in range(num_rows)]
+# Default number of rows you want in your Parquet file
+n_rows = 100000
 
-# Create a DataFrame
-df = pd.DataFrame({
-    'order_id': order_ids,
-    'total_price': total_prices,
-    'discount': discounts,
-    'created_at': created_at,
-    'updated_at': updated_at,
-    'customer': customers,
-    'address': addresses,
-    'order_lines': order_lines,
-    'notes': notes
-})
+# Orders are created one second apart starting from a fixed moment, so the same seed always gives the same values
+started_at = datetime(2024, 1, 1)
 
 # Define schema
 schema = pa.schema([
@@ -77,8 +49,52 @@ schema = pa.schema([
     ))
 ])
 
-# Convert DataFrame to PyArrow Table
-table = pa.table(df, schema=schema)
 
-# Write out as Parquet file with Snappy compression
-pq.write_table(table, 'output/orders.parquet', compression='SNAPPY')
+def prices(rng: np.random.Generator, n_rows: int, low: float, high: float) -> pa.Array:
+    return columns.fixed_width(pa.float32(), np.round(rng.uniform(low, high, n_rows), 2).astype(np.float32))
+
+
+def struct(field: str, arrays: list[pa.Array]) -> pa.StructArray:
+    return nested.struct_of(schema.field(field).type, arrays)
+
+
+def list_of_structs(field: str, counts: np.ndarray, arrays: list[pa.Array]) -> pa.ListArray:
+    data_type = schema.field(field).type
+
+    return nested.list_of(data_type, counts, nested.struct_of(data_type.value_type, arrays))
+
+
+def generate(n_rows: int, rng: np.random.Generator, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> pa.RecordBatch:
+    """Generate a single batch of orders, none of the columns is nullable."""
+    created_at = columns.timestamps(n_rows, started_at, start, step_seconds=1)
+    first_names = text.first_names(rng, n_rows)
+    last_names = text.last_names(rng, n_rows)
+    order_lines = rng.integers(1, 6, n_rows)
+    notes = rng.integers(1, 4, n_rows)
+
+    return pa.RecordBatch.from_arrays([
+        columns.uuids(rng, n_rows),
+        prices(rng, n_rows, 50.0, 200.0),
+        prices(rng, n_rows, 0.0, 50.0),
+        created_at,
+        created_at,
+        struct('customer', [columns.uuids(rng, n_rows), first_names, last_names, text.emails(rng, first_names, last_names)]),
+        struct('address', [
+            columns.uuids(rng, n_rows),
+            text.street_addresses(rng, n_rows),
+            text.cities(rng, n_rows),
+            text.states(rng, n_rows),
+            text.zipcodes(rng, n_rows),
+            text.countries(rng, n_rows),
+        ]),
+        list_of_structs('order_lines', order_lines, [
+            columns.uuids(rng, int(order_lines.sum())),
+            columns.uuids(rng, int(order_lines.sum())),
+            columns.fixed_width(pa.int32(), rng.integers(1, 11, int(order_lines.sum()), dtype=np.int32)),
+            prices(rng, int(order_lines.sum()), 1.0, 50.0),
+        ]),
+        list_of_structs('notes', notes, [
+            columns.uuids(rng, int(notes.sum())),
+            text.paragraphs(rng, int(notes.sum())),
+        ]),
+    ], schema=schema)
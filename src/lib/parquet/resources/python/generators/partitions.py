@@ -0,0 +1,164 @@
+"""Hive partitioned datasets.
+
+Writes a dataset as a directory tree of <key>=<value> partitions, for example
+orders/date=2024-01-01/country=Poland/part-00000.parquet, with a configurable
+number of files per partition and rows per file, and a manifest listing rows
+and files of every partition.
+
+Partition keys are written as "[<name>=]<column>[:<transform>]", nested
+columns are named by their path and timestamps can be truncated to a year,
+month, date or hour, for example "date=created_at:date" or "address.country".
+Partition columns stay in the files, as derived keys can't be restored from
+directory names alone. The whole dataset is kept in memory while it is split
+into partitions.
+"""
+import os
+import shutil
+from dataclasses import dataclass
+from typing import Iterable
+from urllib.parse import quote
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from generators.manifest import write_manifest
+from generators.writer import row_groups, write_batches
+
+# strftime formats of timestamp transforms, no ":" so values are valid directory names everywhere
+TRANSFORMS = {'year': '%Y', 'month': '%Y-%m', 'date': '%Y-%m-%d', 'hour': '%Y-%m-%d-%H'}
+DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+@dataclass(frozen=True)
+class PartitionKey:
+    name: str
+    column: str
+    transform: str | None = None
+
+    @classmethod
+    def parse(cls, key: str) -> 'PartitionKey':
+        name, found, definition = key.rpartition('=')
+        column, _, transform = definition.partition(':')
+        if transform and transform not in TRANSFORMS:
+            raise ValueError(f'Partition key "{key}" must look like "[<name>=]<column>[:<transform>]", transforms: {", ".join(TRANSFORMS)}')
+
+        return cls(name if found else transform or column.split('.')[-1], column, transform or None)
+
+    def __str__(self) -> str:
+        return f'{self.name}={self.column}' + (f':{self.transform}' if self.transform else '')
+
+    def validate(self, schema: pa.Schema) -> None:
+        """Raise ValueError unless the column is a primitive column or struct field of the schema and transforms apply to a timestamp."""
+        top, *path = self.column.split('.')
+        data_type = schema.field(top).type if schema.get_field_index(top) >= 0 else None
+        for name in path:
+            data_type = data_type.field(name).type if data_type is not None and pa.types.is_struct(data_type) and data_type.get_field_index(name) >= 0 else None
+
+        if data_type is None:
+            raise ValueError(f'Partition column "{self.column}" does not exist, nested struct fields are named by their path')
+        if pa.types.is_nested(data_type):
+            raise ValueError(f'Partition column "{self.column}" is {data_type}, partition keys have to be primitive columns')
+        if self.transform and not pa.types.is_timestamp(data_type):
+            raise ValueError(f'Partition transform "{self.transform}" of "{self.column}" needs a timestamp column, got {data_type}')
+
+    def values(self, table: pa.Table) -> pa.Array:
+        """Partition value of every row as a string."""
+        top, *path = self.column.split('.')
+        values = table.column(top).combine_chunks()
+        if path:
+            values = pc.struct_field(values, path)
+
+        values = pc.strftime(values, format=TRANSFORMS[self.transform]) if self.transform else pc.cast(values, pa.string())
+
+        return pc.fill_null(values, DEFAULT_PARTITION)
+
+
+def escape(value: str) -> str:
+    """Escape characters that are not allowed in directory names, like Hive does."""
+    return quote(value, safe=' ')
+
+
+def partition_rows(table: pa.Table, keys: list[PartitionKey]) -> list[tuple[tuple[str, ...], np.ndarray]]:
+    """Values of partition keys and indices of rows of every partition, ordered by values."""
+    names = [f'key_{index}' for index in range(len(keys))]
+    grouped = (
+        pa.table([*[key.values(table) for key in keys], pa.array(np.arange(table.num_rows))], names=[*names, 'row'])
+        .group_by(names, use_threads=False)
+        .aggregate([('row', 'list')])
+        .sort_by([(name, 'ascending') for name in names])
+    )
+
+    return [
+        (tuple(grouped.column(name)[index].as_py() for name in names), grouped.column('row_list')[index].values.to_numpy())
+        for index in range(grouped.num_rows)
+    ]
+
+
+def file_sizes(n_rows: int, files_per_partition: int, max_rows_per_file: int | None) -> list[int]:
+    """Rows of every file of a partition, split evenly into files, files longer than max_rows_per_file are split further."""
+    files = min(files_per_partition, n_rows)
+    size, remainder = divmod(n_rows, files)
+
+    return [
+        length
+        for index in range(files)
+        for _, length in row_groups(size + (index < remainder), max_rows_per_file or size + 1)
+    ]
+
+
+def partitioned_paths(out_dir: str, name: str) -> tuple[str, str]:
+    """Directory of the partitioned dataset and its manifest."""
+    return os.path.join(out_dir, 'partitioned', name), os.path.join(out_dir, 'partitioned', f'{name}.partitions.json')
+
+
+def remove_partitioned(out_dir: str, name: str) -> None:
+    """Remove a previously written dataset, files of other partition keys would end up in the new one."""
+    directory, manifest = partitioned_paths(out_dir, name)
+    shutil.rmtree(directory, ignore_errors=True)
+    if os.path.exists(manifest):
+        os.remove(manifest)
+
+
+def write_partitioned(
+    name: str,
+    schema: pa.Schema,
+    batches: Iterable[pa.RecordBatch | pa.Table],
+    out_dir: str,
+    keys: list[PartitionKey],
+    row_group_size: int,
+    files_per_partition: int = 1,
+    max_rows_per_file: int | None = None,
+    **options,
+) -> str:
+    """Write the whole dataset into <out_dir>/partitioned/<name>, returns path of the manifest."""
+    table = pa.concat_tables(item if isinstance(item, pa.Table) else pa.Table.from_batches([item]) for item in batches)
+    directory, manifest = partitioned_paths(out_dir, name)
+    remove_partitioned(out_dir, name)
+
+    partitions = []
+    for values, rows in partition_rows(table, keys):
+        partition = os.path.join(*[f'{key.name}={escape(value)}' for key, value in zip(keys, values)])
+        os.makedirs(os.path.join(directory, partition), exist_ok=True)
+        rows = table.take(rows)
+
+        files = []
+        start = 0
+        for index, size in enumerate(file_sizes(rows.num_rows, files_per_partition, max_rows_per_file)):
+            path = os.path.join(directory, partition, f'part-{index:05d}.parquet')
+            part = rows.slice(start, size)
+            write_batches(path, schema, (part.slice(offset, length) for offset, length in row_groups(size, row_group_size)), **options)
+            files.append({'file': os.path.join(partition, os.path.basename(path)), 'rows': size, 'bytes': os.path.getsize(path)})
+            start += size
+
+        partitions.append({'partition': partition, 'values': dict(zip([key.name for key in keys], values)), 'rows': rows.num_rows, 'files': files})
+
+    return write_manifest(manifest, {
+        'dataset': name,
+        'partition_by': [str(key) for key in keys],
+        'files_per_partition': files_per_partition,
+        'max_rows_per_file': max_rows_per_file,
+        'rows': table.num_rows,
+        'files': sum(len(partition['files']) for partition in partitions),
+        'partitions': partitions,
+    })
@@ -0,0 +1,174 @@
+"""Predicate pushdown oracle.
+
+For every predicate, row group and data page (pages come from the offset index,
+so the file has to be written with a page index) the manifest stores number of
+matching rows and min/max of the column, together with what a reader is
+expected to skip:
+ - skip: no row matches, the ideal outcome
+ - skip_by_statistics: min/max statistics exclude the predicate, a reader using
+   row group statistics or the column index must skip it
+ - skip_by_bloom_filter: equality predicate on a column with a bloom filter and
+   no row matches, a reader using bloom filters skips it unless it hits a false
+   positive (at most the configured FPP)
+
+Predicates are "<column> <operator> <value>" strings on top level primitive
+columns, values are parsed as JSON when possible and cast to the column type.
+
+Examples:
+    python -m generators.predicates output/primitives.parquet --predicate "int64 < 1000" --predicate "string == string_42"
+"""
+import argparse
+import json
+import operator
+import os
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from generators import thrift
+from generators.manifest import write_manifest
+
+OPERATORS = {
+    '==': ('equal', operator.eq),
+    '!=': ('not_equal', operator.ne),
+    '<': ('less', operator.lt),
+    '<=': ('less_equal', operator.le),
+    '>': ('greater', operator.gt),
+    '>=': ('greater_equal', operator.ge),
+}
+
+
+@dataclass(frozen=True)
+class Predicate:
+    column: str
+    operator: str
+    value: Any
+
+    @classmethod
+    def parse(cls, predicate: str) -> 'Predicate':
+        # two character operators first, so "<=" is not taken for "<"
+        for symbol in sorted(OPERATORS, key=len, reverse=True):
+            column, found, value = predicate.partition(f' {symbol} ')
+            if found:
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    pass
+
+                return cls(column.strip(), symbol, value)
+
+        raise ValueError(f'Predicate "{predicate}" must look like "<column> <operator> <value>", operators: {", ".join(OPERATORS)}')
+
+    def __str__(self) -> str:
+        return f'{self.column} {self.operator} {self.value}'
+
+    def validate(self, schema: pa.Schema) -> None:
+        """Raise ValueError unless the column is a top level primitive column of the schema and the value can be cast to its type."""
+        index = schema.get_field_index(self.column)
+        if index < 0 or pa.types.is_nested(schema.field(index).type):
+            raise ValueError(f'Predicate column "{self.column}" is not a top level primitive column, columns: {", ".join(field.name for field in schema if not pa.types.is_nested(field.type))}')
+
+        try:
+            self.scalar(schema.field(index).type)
+        except (pa.ArrowException, TypeError) as error:
+            raise ValueError(f'Predicate value {self.value!r} can not be cast to {schema.field(index).type} of "{self.column}": {error}') from error
+
+    def scalar(self, data_type: pa.DataType) -> pa.Scalar:
+        return pa.scalar(self.value).cast(data_type)
+
+    def matching(self, values: pa.Array | pa.ChunkedArray) -> int:
+        function = OPERATORS[self.operator][0]
+
+        return pc.sum(pc.fill_null(pc.call_function(function, [values, self.scalar(values.type)]), False)).as_py() or 0
+
+    def excluded(self, minimum: Any, maximum: Any, value: Any) -> bool:
+        """Whether no value between minimum and maximum can match, all null ranges never match."""
+        if minimum is None:
+            return True
+
+        if self.operator == '==':
+            return value < minimum or value > maximum
+        if self.operator == '!=':
+            return minimum == maximum == value
+        if self.operator in ('<', '<='):
+            return not OPERATORS[self.operator][1](minimum, value)
+
+        return not OPERATORS[self.operator][1](maximum, value)
+
+
+def evaluate(predicate: Predicate, values: pa.Array | pa.ChunkedArray, bloom_filter: bool) -> dict:
+    """Matching rows, statistics and expected skips of a range of values."""
+    statistics = pc.min_max(values)
+    minimum, maximum = statistics['min'].as_py(), statistics['max'].as_py()
+    matching = predicate.matching(values)
+
+    result = {
+        'rows': len(values),
+        'matching_rows': matching,
+        'min': minimum,
+        'max': maximum,
+        'skip': matching == 0,
+        'skip_by_statistics': predicate.excluded(minimum, maximum, predicate.scalar(values.type).as_py()),
+    }
+    if bloom_filter and predicate.operator == '==':
+        result['skip_by_bloom_filter'] = matching == 0
+
+    return result
+
+
+def oracle(path: str, predicates: list[Predicate]) -> dict:
+    file = pq.ParquetFile(path)
+    metadata = thrift.footer(path)
+    # from the schema, files without row groups have no column chunks
+    leaves = [file.schema.column(index).path for index in range(len(file.schema))]
+
+    results = []
+    for predicate in predicates:
+        predicate.validate(file.schema_arrow)
+
+        index = leaves.index(predicate.column)
+        row_groups = []
+        for row_group in range(file.num_row_groups):
+            chunk = metadata[4][row_group][1][index]
+            bloom_filter = 14 in chunk[3]
+            values = file.read_row_group(row_group, columns=[predicate.column]).column(0)
+            result = {'index': row_group, **evaluate(predicate, values, bloom_filter)}
+
+            locations = thrift.offset_index(path, chunk)
+            if locations is not None:
+                boundaries = [location['first_row_index'] for location in locations] + [len(values)]
+                result['pages'] = [
+                    {'first_row': start, **evaluate(predicate, values.slice(start, end - start), bloom_filter=False)}
+                    for start, end in zip(boundaries, boundaries[1:])
+                ]
+
+            row_groups.append(result)
+
+        results.append({'predicate': str(predicate), 'column': predicate.column, 'operator': predicate.operator, 'value': predicate.value, 'row_groups': row_groups})
+
+    return {'file': os.path.basename(path), 'rows': file.metadata.num_rows, 'predicates': results}
+
+
+def oracle_path(path: str) -> str:
+    return f'{os.path.splitext(path)[0]}.predicates.json'
+
+
+def write_oracle(path: str, predicates: list[Predicate]) -> str:
+    return write_manifest(oracle_path(path), oracle(path, predicates))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.predicates', description='Write expected row group and page skips of predicates on parquet files.')
+    parser.add_argument('paths', nargs='+', help='parquet files')
+    parser.add_argument('--predicate', dest='predicates', action='append', type=Predicate.parse, required=True, help='"<column> <operator> <value>", can be repeated')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        print(f'{path}: predicate oracle written to {write_oracle(path, args.predicates)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Multi-process dataset generation.
+
+Row range is split into shards aligned to row groups. Each shard is seeded from
+its position, so the output only depends on the seed and row group size, never
+on the number of workers.
+"""
+import math
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from glob import glob
+from typing import Iterable, Iterator
+
+import pyarrow as pa
+
+from generators.datasets import DEFAULT_SEED, batches, dataset, resolve_seed
+from generators.nulls import DEFAULT_NULLS, NullPolicy
+from generators.writer import row_groups, write_batches
+
+
+def split(n_rows: int, n_shards: int, row_group_size: int) -> list[tuple[int, int]]:
+    """Split rows into at most n_shards contiguous (first row, number of rows) ranges aligned to row groups."""
+    if n_shards <= 0:
+        raise ValueError(f'Number of shards must be greater than 0, got {n_shards}')
+
+    groups_per_shard = math.ceil(math.ceil(n_rows / row_group_size) / n_shards)
+
+    return list(row_groups(n_rows, max(groups_per_shard, 1) * row_group_size))
+
+
+def generate_row_group(name: str, start: int, n_rows: int, row_group_size: int, seed: int, nulls: NullPolicy) -> pa.RecordBatch | pa.Table:
+    return next(batches(name, n_rows, row_group_size, seed, start, nulls))
+
+
+def write_shard(name: str, path: str, start: int, n_rows: int, row_group_size: int, seed: int, nulls: NullPolicy, options: dict) -> int:
+    return write_batches(path, dataset(name).schema, batches(name, n_rows, row_group_size, seed, start, nulls), **options)
+
+
+def in_order(executor: Executor, tasks: Iterable[tuple], window: int) -> Iterator:
+    """Yield results in submission order, keeping at most window tasks in flight to bound memory."""
+    pending: deque[Future] = deque()
+
+    for task in tasks:
+        pending.append(executor.submit(*task))
+
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def parallel_batches(name: str, n_rows: int, row_group_size: int, workers: int, seed: int | None = DEFAULT_SEED, nulls: NullPolicy = DEFAULT_NULLS) -> Iterator[pa.RecordBatch | pa.Table]:
+    """Generate row groups in worker processes, yielded in order."""
+    seed = resolve_seed(seed)
+    tasks = ((generate_row_group, name, start, size, row_group_size, seed, nulls) for start, size in row_groups(n_rows, row_group_size))
+
+    with ProcessPoolExecutor(workers) as executor:
+        yield from in_order(executor, tasks, workers * 2)
+
+
+def write_merged(name: str, path: str, n_rows: int, row_group_size: int, workers: int, seed: int | None = DEFAULT_SEED, nulls: NullPolicy = DEFAULT_NULLS, **options) -> int:
+    """Generate row groups in worker processes and write them in order to a single file."""
+    return write_batches(path, dataset(name).schema, parallel_batches(name, n_rows, row_group_size, workers, seed, nulls), **options)
+
+
+def remove_files(name: str, out_dir: str) -> None:
+    """Remove shards of a previous run and their sidecars, a run with more shards would leave extra files behind."""
+    for path in glob(os.path.join(out_dir, f'{name}-[0-9][0-9][0-9][0-9][0-9].*')):
+        os.remove(path)
+
+
+def write_files(name: str, out_dir: str, n_rows: int, row_group_size: int, n_shards: int, workers: int, seed: int | None = DEFAULT_SEED, nulls: NullPolicy = DEFAULT_NULLS, **options) -> list[str]:
+    """Generate every shard into its own <name>-<shard>.parquet file, returns written paths."""
+    seed = resolve_seed(seed)
+    shards = split(n_rows, n_shards, row_group_size)
+    paths = [os.path.join(out_dir, f'{name}-{index:05d}.parquet') for index in range(len(shards))]
+    remove_files(name, out_dir)
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [
+            executor.submit(write_shard, name, path, start, size, row_group_size, seed, nulls, options)
+            for path, (start, size) in zip(paths, shards)
+        ]
+
+        for future in futures:
+            future.result()
+
+    return paths
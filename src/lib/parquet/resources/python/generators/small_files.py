@@ -0,0 +1,140 @@
+"""Small files storm.
+
+Writes a dataset as thousands up to millions of tiny parquet files sharing one
+schema, a few rows each, the way streaming and over partitioned upstream jobs
+do, and measures pyarrow per file costs paid before any row is read: opening a
+file and decoding its footer, building the Arrow schema and reading the whole
+file. Files are spread over subdirectories of 1000 files, so directories stay
+listable.
+
+Examples:
+    python -m generators.small_files
+    python -m generators.small_files --dataset orders --files 1000000 --rows-per-file 5 --workers 8 --sample 100000
+"""
+import argparse
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from generators.datasets import DATASETS, DEFAULT_SEED, batches, dataset, resolve_seed
+from generators.manifest import write_manifest
+from generators.writer import row_groups, write_batches
+
+FILES_PER_DIRECTORY = 1000
+MEASUREMENTS = {
+    'metadata': pq.read_metadata,
+    'schema': lambda path: pq.ParquetFile(path).schema_arrow,
+    'table': partial(pq.read_table, use_threads=False),
+}
+
+
+def file_path(directory: str, index: int) -> str:
+    return os.path.join(directory, f'{index // FILES_PER_DIRECTORY:05d}', f'part-{index:07d}.parquet')
+
+
+def write_directory(name: str, directory: str, first: int, n_files: int, rows_per_file: int, seed: int, options: dict) -> int:
+    """Write n_files files starting with file number first, returns number of written bytes."""
+    schema = dataset(name).schema
+    os.makedirs(os.path.dirname(file_path(directory, first)), exist_ok=True)
+
+    written = 0
+    for offset, batch in enumerate(batches(name, n_files * rows_per_file, rows_per_file, seed, first * rows_per_file)):
+        path = file_path(directory, first + offset)
+        write_batches(path, schema, [batch], **options)
+        written += os.path.getsize(path)
+
+    return written
+
+
+def write_files(name: str, directory: str, n_files: int, rows_per_file: int, seed: int, workers: int = 1, **options) -> int:
+    """Write every rows_per_file rows of the dataset into its own file, returns number of written bytes.
+
+    Every worker generates and writes whole subdirectories, files only depend on
+    the seed, never on the number of workers.
+    """
+    seed = resolve_seed(seed)
+    tasks = [(first, count) for first, count in row_groups(n_files, FILES_PER_DIRECTORY)]
+    write = partial(write_directory, name, directory, rows_per_file=rows_per_file, seed=seed, options=options)
+
+    if workers <= 1:
+        return sum(write(first, count) for first, count in tasks)
+
+    with ProcessPoolExecutor(workers) as executor:
+        return sum(executor.map(write, *zip(*tasks)))
+
+
+def percentiles(seconds: list[float]) -> dict:
+    """Mean and percentiles of per file times in microseconds."""
+    micros = np.array(seconds) * 1_000_000
+
+    return {
+        'mean_us': round(float(micros.mean()), 1),
+        'p50_us': round(float(np.percentile(micros, 50)), 1),
+        'p99_us': round(float(np.percentile(micros, 99)), 1),
+        'max_us': round(float(micros.max()), 1),
+        'total_seconds': round(float(micros.sum()) / 1_000_000, 6),
+    }
+
+
+def measure(paths: list[str]) -> dict:
+    """Per file times of every measurement, the files are read once before, so they come from the page cache."""
+    for path in paths:
+        MEASUREMENTS['metadata'](path)
+
+    results = {}
+    for measurement, function in MEASUREMENTS.items():
+        seconds = []
+        for path in paths:
+            started = time.perf_counter()
+            function(path)
+            seconds.append(time.perf_counter() - started)
+        results[measurement] = percentiles(seconds)
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.small_files', description='Write many tiny parquet files and measure per file open and footer costs.')
+    parser.add_argument('--dataset', choices=DATASETS, default='primitives', help='dataset every file holds a slice of (default: primitives)')
+    parser.add_argument('--files', type=int, default=10_000, help='number of files (default: 10000)')
+    parser.add_argument('--rows-per-file', type=int, default=10, help='rows of every file (default: 10)')
+    parser.add_argument('--sample', type=int, help='number of evenly spread files measured (default: all)')
+    parser.add_argument('--compression', type=str.upper, default='SNAPPY', help='compression codec (default: SNAPPY)')
+    parser.add_argument('--workers', type=int, default=1, help='number of processes generating and writing files (default: 1)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--out-dir', default='output', help='output directory, files are written into its small_files/<dataset> subdirectory (default: output)')
+    args = parser.parse_args(argv)
+
+    directory = os.path.join(args.out_dir, 'small_files', args.dataset)
+    # files of a previous run with more files would stay behind
+    shutil.rmtree(directory, ignore_errors=True)
+
+    started = time.perf_counter()
+    written = write_files(args.dataset, directory, args.files, args.rows_per_file, args.seed, args.workers, compression=args.compression)
+    write_seconds = time.perf_counter() - started
+    print(f'{args.files} files of {args.rows_per_file} rows written into {directory} in {write_seconds:.2f}s')
+
+    sample = [file_path(directory, int(index)) for index in np.unique(np.linspace(0, args.files - 1, min(args.sample or args.files, args.files)).astype(int))]
+    metadata = pq.read_metadata(file_path(directory, 0))
+
+    path = write_manifest(os.path.join(args.out_dir, 'small_files', f'{args.dataset}.small_files.json'), {
+        'dataset': args.dataset,
+        'files': args.files,
+        'rows_per_file': args.rows_per_file,
+        'files_per_directory': FILES_PER_DIRECTORY,
+        'bytes': written,
+        'footer_bytes': metadata.serialized_size,
+        'write_seconds': round(write_seconds, 6),
+        'measured_files': len(sample),
+        'per_file': measure(sample),
+    })
+    print(f'baseline written to {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Metadata snapshots of parquet files with size regression tracking.
+
+A snapshot lists every row group and column chunk of a file with its
+encodings, pages per type and encoding (read from page headers), compressed
+and uncompressed bytes, dictionary page bytes and presence of statistics and
+page indexes. Snapshots of all given files are compared with a stored
+baseline, growth of file, footer and column chunk bytes or of page counts above
+a threshold and lost encodings, statistics or indexes are reported as
+regressions and make the command fail.
+
+Examples:
+    python -m generators.snapshot output/*.parquet --update
+    python -m generators.snapshot output/*.parquet --max-bytes-growth 0.01 --max-pages-growth 0
+"""
+import argparse
+import os
+from glob import glob
+
+import pyarrow.parquet as pq
+
+from generators import thrift
+from generators.compare import chunk_report, column_path
+from generators.manifest import read_manifest, write_manifest
+from generators.writer import footer_size
+
+DEFAULT_BASELINE = 'output/snapshot_baseline.json'
+DEFAULT_MAX_BYTES_GROWTH = 0.05
+DEFAULT_MAX_PAGES_GROWTH = 0.1
+
+# features a column chunk must not lose
+FLAGS = ('column_index', 'offset_index', 'bloom_filter')
+
+
+def snapshot(path: str) -> dict:
+    footer = thrift.footer(path)
+    metadata = pq.read_metadata(path)
+
+    return {
+        'file': path,
+        'rows': metadata.num_rows,
+        'bytes': os.path.getsize(path),
+        'footer_bytes': footer_size(path),
+        'row_groups': [
+            {
+                'rows': row_group[3],
+                'bytes': row_group[2],
+                'columns': {column_path(chunk): chunk_report(path, chunk) for chunk in row_group[1]},
+            }
+            for row_group in footer[4]
+        ],
+    }
+
+
+def grown(baseline: int, current: int, threshold: float) -> bool:
+    return current > baseline * (1.0 + threshold)
+
+
+def diff(baseline: dict, current: dict, max_bytes_growth: float = DEFAULT_MAX_BYTES_GROWTH, max_pages_growth: float = DEFAULT_MAX_PAGES_GROWTH) -> list[dict]:
+    """Regressions of a file snapshot against its baseline."""
+    regressions = []
+
+    def regression(metric: str, before, after, row_group: int | None = None, column: str | None = None) -> None:
+        regressions.append({'file': current['file'], 'row_group': row_group, 'column': column, 'metric': metric, 'baseline': before, 'current': after})
+
+    for metric in ('bytes', 'footer_bytes'):
+        if grown(baseline[metric], current[metric], max_bytes_growth):
+            regression(metric, baseline[metric], current[metric])
+    if len(baseline['row_groups']) != len(current['row_groups']):
+        regression('row_groups', len(baseline['row_groups']), len(current['row_groups']))
+
+    for index, (before, after) in enumerate(zip(baseline['row_groups'], current['row_groups'])):
+        if set(before['columns']) != set(after['columns']):
+            regression('columns', sorted(before['columns']), sorted(after['columns']), index)
+
+        for column in before['columns'].keys() & after['columns'].keys():
+            old, new = before['columns'][column], after['columns'][column]
+            for metric in ('compressed_bytes', 'uncompressed_bytes', 'dictionary_page_bytes'):
+                if grown(old[metric], new[metric], max_bytes_growth):
+                    regression(metric, old[metric], new[metric], index, column)
+            if grown(old['data_pages'], new['data_pages'], max_pages_growth):
+                regression('data_pages', old['data_pages'], new['data_pages'], index, column)
+            if set(old['encodings']) != set(new['encodings']):
+                regression('encodings', old['encodings'], new['encodings'], index, column)
+            for metric in [f'statistics.{key}' for key, present in old['statistics'].items() if present and not new['statistics'][key]]:
+                regression(metric, True, False, index, column)
+            for metric in [flag for flag in FLAGS if old[flag] and not new[flag]]:
+                regression(metric, True, False, index, column)
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.snapshot', description='Compare metadata snapshots of parquet files with a stored baseline.')
+    parser.add_argument('paths', nargs='*', help='parquet files to inspect (default: output/*.parquet)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help=f'baseline file (default: {DEFAULT_BASELINE})')
+    parser.add_argument('--update', action='store_true', help='store snapshots as the new baseline instead of comparing them, the baseline is created when missing')
+    parser.add_argument('--max-bytes-growth', type=float, default=DEFAULT_MAX_BYTES_GROWTH, help=f'allowed relative growth of file, footer and column chunk bytes (default: {DEFAULT_MAX_BYTES_GROWTH})')
+    parser.add_argument('--max-pages-growth', type=float, default=DEFAULT_MAX_PAGES_GROWTH, help=f'allowed relative growth of number of data pages of column chunks (default: {DEFAULT_MAX_PAGES_GROWTH})')
+    args = parser.parse_args(argv)
+
+    snapshots = [snapshot(path) for path in args.paths or sorted(glob('output/*.parquet'))]
+
+    if args.update or not os.path.exists(args.baseline):
+        write_manifest(args.baseline, {'files': snapshots})
+        print(f'baseline of {len(snapshots)} files written to {args.baseline}')
+        return
+
+    baseline = {item['file']: item for item in read_manifest(args.baseline)['files']}
+    regressions = []
+    for current in snapshots:
+        if current['file'] not in baseline:
+            print(f'{current["file"]}: not in baseline, skipped')
+            continue
+        regressions.extend(diff(baseline[current['file']], current, args.max_bytes_growth, args.max_pages_growth))
+
+    for item in regressions:
+        location = ''.join([f' row group {item["row_group"]}' if item['row_group'] is not None else '', f' column {item["column"]}' if item['column'] else ''])
+        print(f'{item["file"]}{location}: {item["metric"]} {item["baseline"]} -> {item["current"]}')
+
+    if regressions:
+        parser.exit(1, f'{len(regressions)} regressions against {args.baseline}\n')
+
+    print(f'{len(snapshots)} files match {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
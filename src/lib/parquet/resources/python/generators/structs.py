@@ -1,278 +1,11 @@
-import pandas as pd
-import random
-import os
+import numpy as np
 import pyarrow as pa
-import json
-import pyarrow.parquet as pq
-import sys
 
-# Number of rows to generate
-n_rows = 100
+from generators import columns, nested
+from generators.nulls import DEFAULT_NULLS, NullPolicy
 
-# Functions to generate the data
-def generate_struct_flat():
-    struct_flat_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        string_nullable_value = f'string_{i}' if i % 2 == 0 else None
-        int_value = i
-        int_nullable_value = i if i % 2 == 0 else None
-        bool_value = i % 2 == 0
-        bool_nullable_value = i % 2 == 0 if i % 2 == 0 else None
-        list_of_ints_value = [random.randint(1, 10) for _ in range(3)]
-        list_of_strings_value = [f'str_{j}' for j in range(3)]
-        map_of_string_int_value = {f'key_{j}': j for j in range(3)}
-        map_of_int_int_value = {j: j for j in range(3)}
-
-        struct_flat_element = {
-            'string': string_value,
-            'string_nullable': string_nullable_value,
-            'int': int_value,
-            'int_nullable': int_nullable_value,
-            'bool': bool_value,
-            'bool_nullable': bool_nullable_value,
-            'list_of_ints': list_of_ints_value,
-            'list_of_strings': list_of_strings_value,
-            'map_of_string_int': map_of_string_int_value,
-            'map_of_int_int': map_of_int_int_value
-        }
-
-        struct_flat_data.append(struct_flat_element)
-
-    return struct_flat_data
-
-def generate_struct_flat_nullable():
-    struct_flat_data = []
-    for i in range(n_rows):
-        if i % 2 != 0:
-            struct_flat_data.append(None)
-            continue
-
-        string_value = f'string_{i}'
-        string_nullable_value = f'string_{i}' if i % 2 == 0 else None
-        int_value = i
-        int_nullable_value = i if i % 2 == 0 else None
-        bool_value = i % 2 == 0
-        bool_nullable_value = i % 2 == 0 if i % 2 == 0 else None
-        list_of_ints_value = [random.randint(1, 10) for _ in range(3)]
-        list_of_strings_value = [f'str_{j}' for j in range(3)]
-        map_of_string_int_value = {f'key_{j}': j for j in range(3)}
-        map_of_int_int_value = {j: j for j in range(3)}
-
-        struct_flat_element = {
-            'string': string_value,
-            'string_nullable': string_nullable_value,
-            'int': int_value,
-            'int_nullable': int_nullable_value,
-            'bool': bool_value,
-            'bool_nullable': bool_nullable_value,
-            'list_of_ints': list_of_ints_value,
-            'list_of_strings': list_of_strings_value,
-            'map_of_string_int': map_of_string_int_value,
-            'map_of_int_int': map_of_int_int_value
-        }
-
-        struct_flat_data.append(struct_flat_element)
-
-    return struct_flat_data
-
-def generate_struct_nested():
-    struct_nested_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        int_value = i
-        list_of_ints_value = [random.randint(1, 10) for _ in range(3)]
-        map_of_string_int_value = {f'key_{j}': j for j in range(3)}
-
-        struct_element = {
-            'int': int_value,
-            'list_of_ints': list_of_ints_value,
-            'map_of_string_int': map_of_string_int_value
-        }
-
-        struct_nested_element = {
-            'string': string_value,
-            'struct_flat': struct_element
-        }
-
-        struct_nested_data.append(struct_nested_element)
-
-    return struct_nested_data
-
-def generate_struct_nested_with_list_of_lists():
-    struct_nested_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        int_value = i
-        # Generating list of lists of integers
-        list_of_list_of_ints_value = [[random.randint(1, 10) for _ in range(random.randint(1, 3))] for _ in range(random.randint(1, 3))]
-
-        struct_element = {
-            'int': int_value,
-            'list_of_list_of_ints': list_of_list_of_ints_value
-        }
-
-        struct_nested_element = {
-            'string': string_value,
-            'struct': struct_element
-        }
-
-        struct_nested_data.append(struct_nested_element)
-
-    return struct_nested_data
-
-def generate_struct_nested_with_list_of_maps():
-    struct_nested_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        int_value = i
-        list_of_map_of_string_int_value = [{f'key_{k}': random.randint(1, 10) for k in range(3)} for _ in range(3)]
-
-        struct_element = {
-            'int': int_value,
-            'list_of_map_of_string_int': list_of_map_of_string_int_value
-        }
-
-        struct_nested_element = {
-            'string': string_value,
-            'struct': struct_element
-        }
-
-        struct_nested_data.append(struct_nested_element)
-
-    return struct_nested_data
-
-def generate_struct_nested_with_map_of_list_of_ints():
-    struct_nested_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        int_value = i
-        map_of_int_list_of_string_value = {j: [f'str_{k}' for k in range(3)] for j in range(3)}
-
-        struct_element = {
-            'int': int_value,
-            'map_of_int_list_of_string': map_of_int_list_of_string_value
-        }
-
-        struct_nested_element = {
-            'string': string_value,
-            'struct': struct_element
-        }
-
-        struct_nested_data.append(struct_nested_element)
-
-    return struct_nested_data
-
-def generate_struct_nested_with_map_of_string_map_of_string_string():
-    struct_nested_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-        int_value = i
-
-        map_of_string_map_of_string_string_value = {
-            f'outer_key_{j}': {f'inner_key_{k}': f'inner_value_{k}' for k in range(3)}
-            for j in range(3)
-        }
-
-        struct_element = {
-            'int': int_value,
-            'map_of_string_map_of_string_string': map_of_string_map_of_string_string_value
-        }
-
-        struct_nested_element = {
-            'string': string_value,
-            'struct': struct_element
-        }
-
-        struct_nested_data.append(struct_nested_element)
-
-    return struct_nested_data
-
-def generate_struct_with_list_and_map_of_structs():
-    struct_data = []
-    for i in range(n_rows):
-        string_value = f'string_{i}'
-
-        list_of_structs_value = [{
-            'int': j,
-            'list': [random.randint(1, 10) for _ in range(3)]
-        } for j in range(3)]
-
-        map_of_string_structs_value = {
-            f'key_{j}': {
-                'int': j,
-                'list': [random.randint(1, 10) for _ in range(3)]
-            } for j in range(3)
-        }
-
-        struct_nested = {
-            'int': i,
-            'list_of_structs': list_of_structs_value,
-            'map_of_string_structs': map_of_string_structs_value
-        }
-
-        struct_element = {
-            'string': string_value,
-            'struct': struct_nested
-        }
-
-        struct_data.append(struct_element)
-
-    return struct_data
-
-def generate_struct_deeply_nested():
-    struct_deeply_nested_data = []
-    for i in range(n_rows):
-        json_value = json.dumps({"key": "value"})
-        struct_4 = {
-            'string': f'string_{i}',
-            'json': json_value
-        }
-        struct_3 = {
-            'float': random.uniform(0.0, 1.0),
-            'struct_4': struct_4
-        }
-        struct_2 = {
-            'bool': bool(i % 2),
-            'struct_3': struct_3
-        }
-        struct_1 = {
-            'string': f'string_{i}',
-            'struct_2': struct_2
-        }
-        struct_0 = {
-            'int': i,
-            'struct_1': struct_1
-        }
-        struct_deeply_nested = {
-            'struct_0': struct_0
-        }
-        struct_deeply_nested_data.append(struct_deeply_nested)
-    return struct_deeply_nested_data
-
-# Columns
-struct_flat_col = generate_struct_flat()
-struct_flat_nullable_col = generate_struct_flat_nullable()
-struct_nested_col = generate_struct_nested()
-struct_nested_with_list_of_lists_col = generate_struct_nested_with_list_of_lists()
-struct_nested_with_list_of_maps_col = generate_struct_nested_with_list_of_maps()
-struct_nested_with_map_of_list_of_ints_col = generate_struct_nested_with_map_of_list_of_ints()
-struct_nested_with_map_of_string_map_of_string_string_col = generate_struct_nested_with_map_of_string_map_of_string_string()
-struct_with_list_and_map_of_structs_col = generate_struct_with_list_and_map_of_structs()
-struct_deeply_nested_col = generate_struct_deeply_nested()
-
-# Creating the DataFrame with only the new column
-df_nested_list = pd.DataFrame({
-    'struct_flat': struct_flat_col,
-    'struct_flat_nullable': struct_flat_nullable_col,
-    'struct_nested': struct_nested_col,
-    'struct_nested_with_list_of_lists': struct_nested_with_list_of_lists_col,
-    'struct_nested_with_list_of_maps': struct_nested_with_list_of_maps_col,
-    'struct_nested_with_map_of_list_of_ints': struct_nested_with_map_of_list_of_ints_col,
-    'struct_nested_with_map_of_string_map_of_string_string': struct_nested_with_map_of_string_map_of_string_string_col,
-    'struct_with_list_and_map_of_structs': struct_with_list_and_map_of_structs_col,
-    'struct_deeply_nested': struct_deeply_nested_col
-})
+# Default number of rows to generate
+n_rows = 100
 
 # Types
 list_of_ints_type = pa.list_(pa.int32())
@@ -409,23 +142,163 @@ schema = pa.schema([
     ('struct_deeply_nested', struct_deeply_nested_type),
 ])
 
-parquet_file = 'output/structs.parquet'
-
-# Create a PyArrow Table
-table = pa.Table.from_pandas(df_nested_list, schema=schema)
 
-# Check if the file exists and remove it
-if os.path.exists(parquet_file):
-    os.remove(parquet_file)
-
-# Write the PyArrow Table to a Parquet file
-with pq.ParquetWriter(parquet_file, schema, compression='SNAPPY') as writer:
-    writer.write_table(table)
-
-pd.set_option('display.max_columns', None)  # Show all columns
-pd.set_option('display.max_rows', None)     # Show all rows
-pd.set_option('display.width', None)        # Auto-detect the width for displaying
-pd.set_option('display.max_colwidth', None) # Show complete text in each cell
-
-# Show the first few rows of the DataFrame for verification
-print(df_nested_list.head(10))
+# Functions to generate the data
+def generate_list_of_ints(rng, n_rows, data_type=list_of_ints_type):
+    counts = nested.fixed_counts(n_rows, 3)
+
+    return nested.list_of(data_type, counts, columns.integers(rng, int(counts.sum()), 1, 10))
+
+def generate_list_of_strings(n_rows, data_type=list_of_strings_type):
+    counts = nested.fixed_counts(n_rows, 3)
+
+    return nested.list_of(data_type, counts, nested.labels('str_', nested.positions(counts)))
+
+def generate_map_of_string_int(n_rows, data_type=map_of_string_int_type):
+    counts = nested.fixed_counts(n_rows, 3)
+    position = nested.positions(counts)
+
+    return nested.map_of(data_type, counts, nested.labels('key_', position), columns.fixed_width(pa.int32(), position.astype(np.int32)))
+
+def generate_map_of_int_int(n_rows):
+    counts = nested.fixed_counts(n_rows, 3)
+    position = columns.fixed_width(pa.int32(), nested.positions(counts).astype(np.int32))
+
+    return nested.map_of(map_of_int_int_type, counts, position, position)
+
+def generate_struct_flat(rng, rows, name, nulls, start, valid=None):
+    n_rows = len(rows)
+    even = rows % 2 == 0
+    nullable = {field: nulls.valid(f'{name}.{field}', rng, n_rows, start) for field in ('string_nullable', 'int_nullable', 'bool_nullable')}
+
+    return nested.struct_of(struct_flat_type, [
+        columns.prefixed_strings('string_', rows),
+        columns.prefixed_strings('string_', rows, nullable['string_nullable']),
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        columns.fixed_width(pa.int32(), rows.astype(np.int32), nullable['int_nullable']),
+        columns.fixed_width(pa.bool_(), even),
+        columns.fixed_width(pa.bool_(), even, nullable['bool_nullable']),
+        generate_list_of_ints(rng, n_rows),
+        generate_list_of_strings(n_rows),
+        generate_map_of_string_int(n_rows),
+        generate_map_of_int_int(n_rows),
+    ], valid)
+
+def generate_struct_with_string(data_type, rows, struct):
+    return nested.struct_of(data_type, [columns.prefixed_strings('string_', rows), struct])
+
+def generate_struct_nested(rng, rows):
+    n_rows = len(rows)
+
+    return generate_struct_with_string(struct_nested_type, rows, nested.struct_of(struct_nested_struct_flat_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        generate_list_of_ints(rng, n_rows),
+        generate_map_of_string_int(n_rows),
+    ]))
+
+def generate_struct_nested_with_list_of_lists(rng, rows):
+    # Generating list of lists of integers
+    outer = nested.counts(rng, len(rows), 1, 3)
+    inner = nested.counts(rng, int(outer.sum()), 1, 3)
+    list_of_list_of_ints = nested.list_of(
+        list_of_list_of_ints_type,
+        outer,
+        nested.list_of(list_of_ints_type, inner, columns.integers(rng, int(inner.sum()), 1, 10)),
+    )
+
+    return generate_struct_with_string(struct_nested_with_list_of_lists_type, rows, nested.struct_of(struct_nested_with_list_of_lists_struct_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        list_of_list_of_ints,
+    ]))
+
+def generate_struct_nested_with_list_of_maps(rng, rows):
+    counts = nested.fixed_counts(len(rows), 3)
+    entries = nested.fixed_counts(int(counts.sum()), 3)
+    list_of_map_of_string_int = nested.list_of(
+        list_of_map_of_string_int_type,
+        counts,
+        nested.map_of(list_of_map_of_string_int_type.value_type, entries, nested.labels('key_', nested.positions(entries)), columns.integers(rng, int(entries.sum()), 1, 10)),
+    )
+
+    return generate_struct_with_string(struct_nested_with_list_of_maps_type, rows, nested.struct_of(struct_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        list_of_map_of_string_int,
+    ]))
+
+def generate_struct_nested_with_map_of_list_of_ints(rows):
+    entries = nested.fixed_counts(len(rows), 3)
+    map_of_int_list_of_string_value = nested.map_of(
+        map_of_int_list_of_string,
+        entries,
+        columns.fixed_width(pa.int32(), nested.positions(entries).astype(np.int32)),
+        generate_list_of_strings(int(entries.sum()), map_of_int_list_of_string.item_type),
+    )
+
+    return generate_struct_with_string(struct_nested_with_map_of_list_of_ints_type, rows, nested.struct_of(struct_nested_with_map_of_list_of_ints_struct_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        map_of_int_list_of_string_value,
+    ]))
+
+def generate_struct_nested_with_map_of_string_map_of_string_string(rows):
+    outer = nested.fixed_counts(len(rows), 3)
+    inner = nested.fixed_counts(int(outer.sum()), 3)
+    map_of_string_map_of_string_string_value = nested.map_of(
+        map_string_map_of_string_string_type,
+        outer,
+        nested.labels('outer_key_', nested.positions(outer)),
+        nested.map_of(map_of_string_string_type, inner, nested.labels('inner_key_', nested.positions(inner)), nested.labels('inner_value_', nested.positions(inner))),
+    )
+
+    return generate_struct_with_string(struct_nested_with_map_of_string_map_of_string_string_type, rows, nested.struct_of(struct_nested_with_map_of_string_map_of_string_string_struct_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        map_of_string_map_of_string_string_value,
+    ]))
+
+def generate_struct_with_int_and_list_of_ints(rng, counts):
+    return nested.struct_of(struct_with_int_and_list_of_ints_type, [
+        columns.fixed_width(pa.int32(), nested.positions(counts).astype(np.int32)),
+        generate_list_of_ints(rng, int(counts.sum()), struct_with_int_and_list_of_ints_type.field('list').type),
+    ])
+
+def generate_struct_with_list_and_map_of_structs(rng, rows):
+    counts = nested.fixed_counts(len(rows), 3)
+
+    return generate_struct_with_string(struct_with_list_and_map_of_structs_type, rows, nested.struct_of(struct_with_list_and_map_of_structs_struct_type, [
+        columns.fixed_width(pa.int32(), rows.astype(np.int32)),
+        nested.list_of(struct_with_list_and_map_of_structs_list_of_structs_type, counts, generate_struct_with_int_and_list_of_ints(rng, counts)),
+        nested.map_of(
+            struct_with_list_and_map_of_structs_map_of_string_structs_type,
+            counts,
+            nested.labels('key_', nested.positions(counts)),
+            generate_struct_with_int_and_list_of_ints(rng, counts),
+        ),
+    ]))
+
+def generate_struct_deeply_nested(rng, rows):
+    n_rows = len(rows)
+    struct_4 = nested.struct_of(struct_4_type, [
+        columns.prefixed_strings('string_', rows),
+        pa.array(np.full(n_rows, '{"key": "value"}'), pa.string()),
+    ])
+    struct_3 = nested.struct_of(struct_3_type, [columns.floats(rng, n_rows, 0.0, 1.0), struct_4])
+    struct_2 = nested.struct_of(struct_2_type, [columns.fixed_width(pa.bool_(), rows % 2 == 1), struct_3])
+    struct_1 = nested.struct_of(struct_1_type, [columns.prefixed_strings('string_', rows), struct_2])
+    struct_0 = nested.struct_of(struct_0_type, [columns.fixed_width(pa.int32(), rows.astype(np.int32)), struct_1])
+
+    return nested.struct_of(struct_deeply_nested_type, [struct_0])
+
+
+def generate(n_rows: int, rng: np.random.Generator, start: int = 0, nulls: NullPolicy = DEFAULT_NULLS) -> pa.RecordBatch:
+    rows = columns.row_numbers(n_rows, start)
+
+    return pa.RecordBatch.from_arrays([
+        generate_struct_flat(rng, rows, 'struct_flat', nulls, start),
+        generate_struct_flat(rng, rows, 'struct_flat_nullable', nulls, start, nulls.valid('struct_flat_nullable', rng, n_rows, start)),
+        generate_struct_nested(rng, rows),
+        generate_struct_nested_with_list_of_lists(rng, rows),
+        generate_struct_nested_with_list_of_maps(rng, rows),
+        generate_struct_nested_with_map_of_list_of_ints(rows),
+        generate_struct_nested_with_map_of_string_map_of_string_string(rows),
+        generate_struct_with_list_and_map_of_structs(rng, rows),
+        generate_struct_deeply_nested(rng, rows),
+    ], schema=schema)
@@ -0,0 +1,52 @@
+"""Memory mapped source tables shared by variant writers.
+
+Codec, encoding, encryption, page size, layout and partition variants write the
+same rows many times. Rows are generated once, streamed into an uncompressed
+Arrow IPC file, one record batch per row group, and every variant reads them
+back through a memory map without copying, so resident memory is bounded by
+the page cache instead of a copy per variant and repeated runs skip generation.
+
+Files are stored in <cache-dir>/tables under a hash of the generators source
+code, generation parameters and library versions, like cached parquet files.
+"""
+import os
+from typing import Callable, Iterable
+
+import pyarrow as pa
+
+from generators import cache
+
+
+def table_path(cache_dir: str, parameters: dict) -> str:
+    return os.path.join(cache_dir, 'tables', f'{cache.cache_key(parameters)}.arrow')
+
+
+def write_table(path: str, schema: pa.Schema, batches: Iterable[pa.RecordBatch | pa.Table]) -> None:
+    """Stream batches into an Arrow IPC file, every batch stays a single record batch."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    staging = f'{path}.{os.getpid()}.tmp'
+
+    try:
+        with pa.OSFile(staging, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch if isinstance(batch, pa.RecordBatch) else batch.combine_chunks().to_batches()[0])
+        os.replace(staging, path)
+    finally:
+        if os.path.exists(staging):
+            os.remove(staging)
+
+
+def read_table(path: str) -> pa.Table:
+    """Zero copy view of an Arrow IPC file, buffers point into the memory map."""
+    return pa.ipc.open_file(pa.memory_map(path)).read_all()
+
+
+def cached_batches(path: str, schema: pa.Schema, produce: Callable[[], Iterable[pa.RecordBatch | pa.Table]], refresh: bool = False) -> list[pa.RecordBatch]:
+    """Record batches of the table stored in path, generated by produce first when missing or refreshed."""
+    if refresh or not os.path.exists(path):
+        write_table(path, schema, produce())
+    else:
+        # modification time orders cache entries for pruning
+        os.utime(path)
+
+    return read_table(path).to_batches()
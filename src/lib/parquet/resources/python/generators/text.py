@@ -0,0 +1,219 @@
+"""Synthetic realistic text.
+
+Replacement for Faker that samples vocabulary pools with vectorized index
+arrays. Values are assembled with Arrow compute kernels and single pool picks
+can be kept dictionary encoded, no Python string is created per value.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from generators.columns import validity_bitmap
+from generators.nested import offsets
+
+FIRST_NAMES = pa.array([
+    'James', 'Mary', 'Robert', 'Patricia', 'John', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+    'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Christopher', 'Karen',
+    'Charles', 'Lisa', 'Daniel', 'Nancy', 'Matthew', 'Betty', 'Anthony', 'Sandra', 'Mark', 'Margaret',
+    'Donald', 'Ashley', 'Steven', 'Kimberly', 'Andrew', 'Emily', 'Paul', 'Donna', 'Joshua', 'Michelle',
+    'Kenneth', 'Carol', 'Kevin', 'Amanda', 'Brian', 'Melissa', 'George', 'Deborah', 'Timothy', 'Stephanie',
+    'Ronald', 'Dorothy', 'Jason', 'Rebecca', 'Edward', 'Sharon', 'Jeffrey', 'Laura', 'Ryan', 'Cynthia',
+    'Jacob', 'Amy', 'Gary', 'Kathleen', 'Nicholas', 'Angela', 'Eric', 'Shirley', 'Jonathan', 'Brenda',
+    'Stephen', 'Emma', 'Larry', 'Anna', 'Justin', 'Pamela', 'Scott', 'Nicole', 'Brandon', 'Samantha',
+    'Benjamin', 'Katherine', 'Samuel', 'Christine', 'Gregory', 'Helen', 'Alexander', 'Debra', 'Patrick', 'Rachel',
+    'Frank', 'Carolyn', 'Raymond', 'Janet', 'Jack', 'Maria', 'Dennis', 'Catherine', 'Jerry', 'Heather',
+], pa.string())
+
+LAST_NAMES = pa.array([
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin',
+    'Lee', 'Perez', 'Thompson', 'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez', 'Lewis', 'Robinson',
+    'Walker', 'Young', 'Allen', 'King', 'Wright', 'Scott', 'Torres', 'Nguyen', 'Hill', 'Flores',
+    'Green', 'Adams', 'Nelson', 'Baker', 'Hall', 'Rivera', 'Campbell', 'Mitchell', 'Carter', 'Roberts',
+    'Gomez', 'Phillips', 'Evans', 'Turner', 'Diaz', 'Parker', 'Cruz', 'Edwards', 'Collins', 'Reyes',
+    'Stewart', 'Morris', 'Morales', 'Murphy', 'Cook', 'Rogers', 'Gutierrez', 'Ortiz', 'Morgan', 'Cooper',
+    'Peterson', 'Bailey', 'Reed', 'Kelly', 'Howard', 'Ramos', 'Kim', 'Cox', 'Ward', 'Richardson',
+    'Watson', 'Brooks', 'Chavez', 'Wood', 'James', 'Bennett', 'Gray', 'Mendoza', 'Ruiz', 'Hughes',
+    'Price', 'Alvarez', 'Castillo', 'Sanders', 'Patel', 'Myers', 'Long', 'Ross', 'Foster', 'Jimenez',
+], pa.string())
+
+EMAIL_DOMAINS = pa.array(['example.com', 'example.org', 'example.net'], pa.string())
+
+STREET_SUFFIXES = pa.array([
+    'Street', 'Avenue', 'Road', 'Lane', 'Drive', 'Court', 'Place', 'Boulevard', 'Way', 'Terrace',
+    'Circle', 'Trail', 'Parkway', 'Square', 'Ridge', 'Crossing', 'Hollow', 'Meadows', 'Park', 'Heights',
+], pa.string())
+
+CITY_SUFFIXES = pa.array([
+    'ville', 'town', 'burgh', 'borough', 'side', 'view', 'port', 'mouth', 'haven', 'field',
+    'land', 'shire', 'furt', 'berg', 'chester', 'stad', 'bury', 'fort', 'ton',
+], pa.string())
+
+STATES = pa.array([
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia',
+    'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland',
+    'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey',
+    'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
+    'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming',
+], pa.string())
+
+COUNTRIES = pa.array([
+    'Argentina', 'Australia', 'Austria', 'Belgium', 'Brazil', 'Bulgaria', 'Canada', 'Chile', 'China', 'Colombia',
+    'Croatia', 'Czech Republic', 'Denmark', 'Egypt', 'Estonia', 'Finland', 'France', 'Germany', 'Greece', 'Hungary',
+    'Iceland', 'India', 'Indonesia', 'Ireland', 'Israel', 'Italy', 'Japan', 'Kenya', 'Latvia', 'Lithuania',
+    'Luxembourg', 'Malaysia', 'Mexico', 'Morocco', 'Netherlands', 'New Zealand', 'Nigeria', 'Norway', 'Peru', 'Philippines',
+    'Poland', 'Portugal', 'Romania', 'Saudi Arabia', 'Singapore', 'Slovakia', 'Slovenia', 'South Africa', 'South Korea', 'Spain',
+    'Sweden', 'Switzerland', 'Thailand', 'Turkey', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States of America', 'Uruguay', 'Vietnam',
+], pa.string())
+
+WORDS = pa.array([
+    'able', 'about', 'account', 'across', 'action', 'activity', 'actually', 'address', 'after', 'again',
+    'against', 'agency', 'agree', 'almost', 'along', 'already', 'always', 'analysis', 'animal', 'another',
+    'answer', 'anything', 'area', 'argue', 'around', 'article', 'artist', 'attention', 'author', 'available',
+    'back', 'beat', 'beautiful', 'because', 'become', 'before', 'behind', 'believe', 'benefit', 'better',
+    'between', 'beyond', 'bill', 'blue', 'board', 'body', 'book', 'both', 'break', 'bring',
+    'budget', 'build', 'business', 'call', 'camera', 'capital', 'card', 'care', 'career', 'carry',
+    'case', 'catch', 'cause', 'center', 'central', 'century', 'certain', 'chance', 'change', 'choice',
+    'citizen', 'city', 'class', 'clear', 'close', 'color', 'common', 'company', 'concern', 'consider',
+    'control', 'cost', 'country', 'course', 'court', 'cover', 'create', 'culture', 'current', 'customer',
+    'data', 'deal', 'decade', 'decide', 'deep', 'defense', 'degree', 'describe', 'design', 'detail',
+    'develop', 'difference', 'difficult', 'direction', 'discover', 'discuss', 'doctor', 'door', 'down', 'draw',
+    'dream', 'drive', 'during', 'early', 'economy', 'effect', 'effort', 'either', 'election', 'employee',
+    'energy', 'enjoy', 'enough', 'entire', 'environment', 'evening', 'event', 'everyone', 'evidence', 'exactly',
+    'example', 'expect', 'experience', 'expert', 'explain', 'face', 'fact', 'factor', 'family', 'federal',
+    'field', 'figure', 'final', 'financial', 'find', 'fine', 'finish', 'first', 'fish', 'floor',
+    'focus', 'follow', 'force', 'foreign', 'forget', 'form', 'forward', 'free', 'friend', 'front',
+    'full', 'future', 'garden', 'general', 'give', 'glass', 'goal', 'good', 'government', 'great',
+    'green', 'ground', 'group', 'grow', 'growth', 'guess', 'happen', 'happy', 'hard', 'health',
+    'hear', 'heart', 'heavy', 'help', 'here', 'herself', 'high', 'history', 'hold', 'home',
+    'hope', 'hospital', 'hotel', 'hour', 'house', 'however', 'huge', 'human', 'idea', 'identify',
+    'image', 'imagine', 'impact', 'important', 'improve', 'include', 'increase', 'indeed', 'industry', 'information',
+    'inside', 'instead', 'interest', 'interview', 'investment', 'issue', 'itself', 'join', 'just', 'keep',
+    'kind', 'kitchen', 'know', 'knowledge', 'land', 'language', 'large', 'last', 'late', 'later',
+    'laugh', 'lawyer', 'lead', 'leader', 'learn', 'least', 'leave', 'left', 'legal', 'less',
+    'letter', 'level', 'life', 'light', 'likely', 'line', 'list', 'listen', 'little', 'live',
+    'local', 'long', 'look', 'lose', 'loss', 'machine', 'magazine', 'main', 'maintain', 'major',
+    'manage', 'market', 'material', 'matter', 'maybe', 'measure', 'media', 'medical', 'meet', 'meeting',
+    'member', 'memory', 'mention', 'message', 'method', 'middle', 'might', 'million', 'mind', 'minute',
+    'miss', 'mission', 'model', 'modern', 'moment', 'money', 'month', 'morning', 'most', 'mother',
+    'move', 'movement', 'much', 'music', 'myself', 'name', 'nation', 'natural', 'nature', 'near',
+    'nearly', 'necessary', 'need', 'network', 'never', 'news', 'newspaper', 'next', 'nice', 'night',
+    'none', 'note', 'nothing', 'notice', 'number', 'occur', 'offer', 'office', 'officer', 'official',
+    'often', 'once', 'only', 'onto', 'open', 'operation', 'option', 'order', 'organization', 'other',
+    'outside', 'over', 'owner', 'page', 'pain', 'painting', 'paper', 'parent', 'part', 'particular',
+    'partner', 'party', 'pass', 'past', 'patient', 'pattern', 'pay', 'peace', 'people', 'perform',
+    'perhaps', 'period', 'person', 'phone', 'physical', 'pick', 'picture', 'piece', 'place', 'plan',
+    'plant', 'play', 'player', 'point', 'police', 'policy', 'political', 'poor', 'popular', 'population',
+    'position', 'positive', 'possible', 'power', 'practice', 'prepare', 'present', 'president', 'pressure', 'pretty',
+    'prevent', 'price', 'private', 'probably', 'problem', 'process', 'produce', 'product', 'professional', 'professor',
+    'program', 'project', 'property', 'protect', 'prove', 'provide', 'public', 'pull', 'purpose', 'push',
+    'quality', 'question', 'quickly', 'quite', 'race', 'radio', 'raise', 'range', 'rate', 'rather',
+    'reach', 'read', 'ready', 'real', 'reality', 'realize', 'really', 'reason', 'receive', 'recent',
+    'recognize', 'record', 'reduce', 'reflect', 'region', 'relate', 'remain', 'remember', 'remove', 'report',
+    'represent', 'require', 'research', 'resource', 'respond', 'response', 'rest', 'result', 'return', 'reveal',
+    'rich', 'right', 'rise', 'risk', 'road', 'rock', 'role', 'room', 'rule', 'safe',
+    'same', 'save', 'scene', 'school', 'science', 'score', 'season', 'seat', 'second', 'section',
+    'security', 'seek', 'seem', 'sell', 'send', 'senior', 'sense', 'series', 'serious', 'serve',
+    'service', 'seven', 'several', 'shake', 'share', 'short', 'should', 'shoulder', 'show', 'side',
+    'sign', 'significant', 'similar', 'simple', 'simply', 'since', 'sing', 'single', 'sister', 'site',
+    'situation', 'size', 'skill', 'small', 'smile', 'social', 'society', 'soldier', 'some', 'someone',
+    'something', 'sometimes', 'song', 'soon', 'sort', 'sound', 'source', 'south', 'space', 'speak',
+    'special', 'specific', 'speech', 'spend', 'sport', 'spring', 'staff', 'stage', 'stand', 'standard',
+    'star', 'start', 'state', 'statement', 'station', 'stay', 'step', 'still', 'stock', 'stop',
+    'store', 'story', 'strategy', 'street', 'strong', 'structure', 'student', 'study', 'stuff', 'style',
+    'subject', 'success', 'successful', 'such', 'suddenly', 'suffer', 'suggest', 'summer', 'support', 'sure',
+    'surface', 'system', 'table', 'take', 'talk', 'task', 'teach', 'teacher', 'team', 'technology',
+    'television', 'tell', 'tend', 'term', 'test', 'than', 'thank', 'their', 'them', 'themselves',
+    'then', 'theory', 'there', 'these', 'they', 'thing', 'think', 'third', 'this', 'those',
+    'though', 'thought', 'thousand', 'threat', 'three', 'through', 'throughout', 'throw', 'thus', 'time',
+    'today', 'together', 'tonight', 'total', 'tough', 'toward', 'town', 'trade', 'traditional', 'training',
+    'travel', 'treat', 'treatment', 'tree', 'trial', 'trip', 'trouble', 'true', 'truth', 'turn',
+    'type', 'under', 'understand', 'unit', 'until', 'upon', 'usually', 'value', 'various', 'very',
+    'victim', 'view', 'violence', 'visit', 'voice', 'vote', 'wait', 'walk', 'wall', 'want',
+    'watch', 'water', 'weapon', 'wear', 'week', 'weight', 'well', 'west', 'western', 'what',
+    'whatever', 'when', 'where', 'whether', 'which', 'while', 'white', 'whole', 'whom', 'whose',
+    'wide', 'wife', 'will', 'wind', 'window', 'wish', 'with', 'within', 'without', 'woman',
+    'wonder', 'word', 'work', 'worker', 'world', 'worry', 'would', 'write', 'writer', 'wrong',
+    'yard', 'yeah', 'year', 'young', 'yourself',
+], pa.string())
+
+
+def pick(rng: np.random.Generator, pool: pa.Array, n_rows: int, valid: np.ndarray | None = None) -> pa.DictionaryArray:
+    """Values drawn uniformly from pool, dictionary encoded with the pool as dictionary."""
+    indices = rng.integers(0, len(pool), n_rows, dtype=np.int32)
+
+    return pa.DictionaryArray.from_buffers(
+        pa.dictionary(pa.int32(), pool.type),
+        n_rows,
+        [validity_bitmap(valid), pa.py_buffer(indices)],
+        pool,
+    )
+
+
+def sample(rng: np.random.Generator, pool: pa.Array, n_rows: int) -> pa.Array:
+    """Values drawn uniformly from pool as plain strings."""
+    return pick(rng, pool, n_rows).dictionary_decode()
+
+
+def digits(rng: np.random.Generator, n_rows: int, width: int, low: int = 0) -> pa.Array:
+    """Random numbers of up to width digits, left padded with zeros."""
+    numbers = pc.cast(pa.array(rng.integers(low, 10 ** width, n_rows)), pa.string())
+
+    return pc.utf8_lpad(numbers, width=width, padding='0')
+
+
+def first_names(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    return sample(rng, FIRST_NAMES, n_rows)
+
+
+def last_names(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    return sample(rng, LAST_NAMES, n_rows)
+
+
+def emails(rng: np.random.Generator, first_names: pa.Array, last_names: pa.Array) -> pa.Array:
+    """Addresses like john.smith42@example.com built from given names."""
+    n_rows = len(first_names)
+    user = pc.binary_join_element_wise(first_names, '.', last_names, digits(rng, n_rows, 2), '@', sample(rng, EMAIL_DOMAINS, n_rows), '')
+
+    return pc.utf8_lower(user)
+
+
+def street_addresses(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    """Addresses like '8288 Ronald Street'."""
+    building = pc.cast(pa.array(rng.integers(1, 100_000, n_rows)), pa.string())
+    name = pc.if_else(pa.array(rng.random(n_rows) < 0.5), first_names(rng, n_rows), last_names(rng, n_rows))
+
+    return pc.binary_join_element_wise(building, name, sample(rng, STREET_SUFFIXES, n_rows), ' ')
+
+
+def cities(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    """Cities like 'Bergshire' made of a name and a common suffix."""
+    return pc.binary_join_element_wise(last_names(rng, n_rows), sample(rng, CITY_SUFFIXES, n_rows), '')
+
+
+def states(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    return sample(rng, STATES, n_rows)
+
+
+def zipcodes(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    return digits(rng, n_rows, 5, low=501)
+
+
+def countries(rng: np.random.Generator, n_rows: int) -> pa.Array:
+    return sample(rng, COUNTRIES, n_rows)
+
+
+def sentences(rng: np.random.Generator, n_rows: int, min_words: int = 4, max_words: int = 12) -> pa.Array:
+    """Capitalized sentences of random words ending with a period."""
+    counts = rng.integers(min_words, max_words + 1, n_rows)
+    words = pa.ListArray.from_arrays(pa.array(offsets(counts)), sample(rng, WORDS, int(counts.sum())))
+
+    return pc.utf8_capitalize(pc.binary_join_element_wise(pc.binary_join(words, ' '), '.', ''))
+
+
+def paragraphs(rng: np.random.Generator, n_rows: int, min_sentences: int = 1, max_sentences: int = 4) -> pa.Array:
+    """Paragraphs of a few sentences, similar to Faker text()."""
+    counts = rng.integers(min_sentences, max_sentences + 1, n_rows)
+    paragraph = pa.ListArray.from_arrays(pa.array(offsets(counts)), sentences(rng, int(counts.sum())))
+
+    return pc.binary_join(paragraph, ' ')
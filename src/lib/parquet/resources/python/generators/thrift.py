@@ -0,0 +1,218 @@
+"""Minimal reader of Thrift compact protocol structures stored in parquet files.
+
+pyarrow does not expose page indexes or offsets of index structures, so the
+footer and page indexes are decoded here into dictionaries keyed by Thrift
+field ids, see parquet.thrift for their meaning.
+"""
+import struct
+from typing import Any
+
+MAGIC = b'PAR1'
+
+# compact protocol types
+BOOLEAN_TRUE = 1
+BOOLEAN_FALSE = 2
+BYTE = 3
+I16 = 4
+I32 = 5
+I64 = 6
+DOUBLE = 7
+BINARY = 8
+LIST = 9
+SET = 10
+MAP = 11
+STRUCT = 12
+
+# Flow\Parquet\ParquetFile\Encodings
+ENCODINGS = {
+    0: 'PLAIN',
+    2: 'PLAIN_DICTIONARY',
+    3: 'RLE',
+    4: 'BIT_PACKED',
+    5: 'DELTA_BINARY_PACKED',
+    6: 'DELTA_LENGTH_BYTE_ARRAY',
+    7: 'DELTA_BYTE_ARRAY',
+    8: 'RLE_DICTIONARY',
+    9: 'BYTE_STREAM_SPLIT',
+}
+PAGE_TYPES = {0: 'DATA_PAGE', 1: 'INDEX_PAGE', 2: 'DICTIONARY_PAGE', 3: 'DATA_PAGE_V2'}
+# Flow\Parquet\ParquetFile\Compressions
+CODECS = {0: 'UNCOMPRESSED', 1: 'SNAPPY', 2: 'GZIP', 3: 'LZO', 4: 'BROTLI', 5: 'LZ4', 6: 'ZSTD', 7: 'LZ4_RAW'}
+
+
+class Reader:
+    def __init__(self, data: bytes, position: int = 0):
+        self.data = data
+        self.position = position
+
+    def byte(self) -> int:
+        value = self.data[self.position]
+        self.position += 1
+
+        return value
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self.byte()
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        value = self.varint()
+
+        return (value >> 1) ^ -(value & 1)
+
+    def binary(self) -> bytes:
+        size = self.varint()
+        value = self.data[self.position:self.position + size]
+        self.position += size
+
+        return value
+
+    def value(self, kind: int) -> Any:
+        if kind == BOOLEAN_TRUE:
+            return True
+        if kind == BOOLEAN_FALSE:
+            return False
+        if kind == BYTE:
+            return struct.unpack('b', bytes([self.byte()]))[0]
+        if kind in (I16, I32, I64):
+            return self.zigzag()
+        if kind == DOUBLE:
+            value = struct.unpack_from('<d', self.data, self.position)[0]
+            self.position += 8
+            return value
+        if kind == BINARY:
+            return self.binary()
+        if kind in (LIST, SET):
+            return self.list()
+        if kind == MAP:
+            return self.map()
+        if kind == STRUCT:
+            return self.struct()
+
+        raise ValueError(f'Unsupported compact protocol type {kind} at position {self.position}')
+
+    def element(self, kind: int) -> Any:
+        # booleans inside collections are stored as a single byte
+        if kind in (BOOLEAN_TRUE, BOOLEAN_FALSE):
+            return self.byte() == BOOLEAN_TRUE
+
+        return self.value(kind)
+
+    def list(self) -> list:
+        header = self.byte()
+        size = header >> 4
+        if size == 15:
+            size = self.varint()
+
+        return [self.element(header & 0x0F) for _ in range(size)]
+
+    def map(self) -> dict:
+        size = self.varint()
+        if not size:
+            return {}
+
+        types = self.byte()
+
+        return {self.element(types >> 4): self.element(types & 0x0F) for _ in range(size)}
+
+    def struct(self) -> dict[int, Any]:
+        fields = {}
+        field_id = 0
+        while True:
+            header = self.byte()
+            if header == 0:
+                return fields
+
+            delta = header >> 4
+            field_id = field_id + delta if delta else self.zigzag()
+            fields[field_id] = self.value(header & 0x0F)
+
+
+def decode(data: bytes) -> dict[int, Any]:
+    return Reader(data).struct()
+
+
+def footer(path: str) -> dict[int, Any]:
+    """Decoded FileMetaData of a parquet file."""
+    with open(path, 'rb') as file:
+        file.seek(-8, 2)
+        tail = file.read(8)
+        if tail[4:] != MAGIC:
+            raise ValueError(f'{path} is not a parquet file or its footer is encrypted')
+
+        size = struct.unpack('<i', tail[:4])[0]
+        file.seek(-8 - size, 2)
+
+        return decode(file.read(size))
+
+
+def encoding_stats(column_chunk: dict[int, Any]) -> dict[str, dict[str, int]]:
+    """Number of pages of every page type and encoding of a decoded ColumnChunk."""
+    stats = {}
+    for page in column_chunk[3].get(13, []):
+        pages = stats.setdefault(PAGE_TYPES.get(page[1], str(page[1])), {})
+        pages[ENCODINGS.get(page[2], str(page[2]))] = page[3]
+
+    return stats
+
+
+def pages(path: str, column_chunk: dict[int, Any]) -> list[dict[str, Any]]:
+    """Type, encoding and sizes of every page of a decoded ColumnChunk, read from page headers."""
+    metadata = column_chunk[3]
+    start = min(metadata[9], metadata.get(11, metadata[9]))
+    with open(path, 'rb') as file:
+        file.seek(start)
+        reader = Reader(file.read(metadata[7]))
+
+    result = []
+    while reader.position < len(reader.data):
+        header = reader.struct()
+        reader.position += header[3]
+        # encoding is stored in the header of the page type: DataPageHeader, DictionaryPageHeader or DataPageHeaderV2
+        encoding = (header.get(5) or {}).get(2, (header.get(7) or {}).get(2, (header.get(8) or {}).get(4)))
+        result.append({
+            'type': PAGE_TYPES.get(header[1], str(header[1])),
+            'encoding': ENCODINGS.get(encoding, str(encoding)),
+            'uncompressed_page_size': header[2],
+            'compressed_page_size': header[3],
+        })
+
+    return result
+
+
+def read_at(path: str, offset: int, length: int) -> dict[int, Any]:
+    with open(path, 'rb') as file:
+        file.seek(offset)
+
+        return decode(file.read(length))
+
+
+def offset_index(path: str, column_chunk: dict[int, Any]) -> list[dict[str, int]] | None:
+    """Locations of data pages of a decoded ColumnChunk, None when the file has no offset index."""
+    if 4 not in column_chunk:
+        return None
+
+    locations = read_at(path, column_chunk[4], column_chunk[5])[1]
+
+    return [{'offset': location[1], 'compressed_page_size': location[2], 'first_row_index': location[3]} for location in locations]
+
+
+def column_index(path: str, column_chunk: dict[int, Any]) -> dict[str, Any] | None:
+    """Null pages, encoded min and max values, boundary order and null counts of a decoded ColumnChunk."""
+    if 6 not in column_chunk:
+        return None
+
+    index = read_at(path, column_chunk[6], column_chunk[7])
+
+    return {
+        'null_pages': index[1],
+        'min_values': index[2],
+        'max_values': index[3],
+        'boundary_order': index[4],
+        'null_counts': index.get(5),
+    }
@@ -0,0 +1,218 @@
+"""Cross format twins of parquet files.
+
+Writes the rows of a parquet file again as CSV, JSON Lines, XML and Arrow IPC
+(Feather v2), so extractors of every format can be compared on the same logical
+rows. Files are converted one row group at a time.
+
+Arrow IPC, JSON Lines and XML keep nesting: structs become objects or child
+elements, lists become arrays or repeated <item> elements and maps become
+objects or <entry> elements with <key> and <value>. CSV can't nest, structs are
+flattened into "<parent>.<child>" columns and lists and maps are written as
+JSON encoded cells. Nulls are empty CSV cells, JSON nulls and missing XML
+elements, temporal values are ISO 8601 strings with as many fraction digits as
+their unit in every text format and binary values are base64 encoded. JSON has
+no literals of non finite floats, they become "NaN", "Infinity" and "-Infinity"
+strings. Fields whose names are not valid XML names are written as <field>
+elements with a name attribute.
+
+Examples:
+    python -m generators.twins output/orders.parquet
+    python -m generators.twins output/*.parquet --format csv --format jsonl
+"""
+import argparse
+import base64
+import decimal
+import json
+import math
+import os
+import re
+from typing import Any, Iterable, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
+
+from generators.manifest import write_manifest
+from generators.writer import unlink_existing
+
+FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'xml': '.xml', 'arrow': '.arrow'}
+# letters, digits, "_", "-" and "." not starting with a digit, "-", "." or the reserved "xml" prefix
+XML_NAME = re.compile(r'(?!(?i:xml))[^\W\d][\w.-]*')
+
+
+def temporal_text(values: pa.Array) -> pa.Array:
+    """Temporal values, nested ones included, as ISO 8601 strings, other values are kept."""
+    data_type = values.type
+    if pa.types.is_timestamp(data_type):
+        # %S includes fraction digits of the unit
+        return pc.strftime(values, format='%Y-%m-%dT%H:%M:%S' + ('%z' if data_type.tz else ''))
+    if pa.types.is_date(data_type) or pa.types.is_time(data_type):
+        return pc.cast(values, pa.string())
+    if pa.types.is_struct(data_type):
+        children = [temporal_text(values.field(index)) for index in range(data_type.num_fields)]
+        return pa.StructArray.from_arrays(children, names=[field.name for field in data_type], mask=values.is_null())
+    if pa.types.is_map(data_type):
+        return pa.MapArray.from_arrays(values.offsets, temporal_text(values.keys), temporal_text(values.items), mask=values.is_null())
+    if pa.types.is_list(data_type):
+        return pa.ListArray.from_arrays(values.offsets, temporal_text(values.values), mask=values.is_null())
+
+    return values
+
+
+def has_temporal(data_type: pa.DataType) -> bool:
+    if pa.types.is_temporal(data_type):
+        return True
+
+    return any(has_temporal(data_type.field(index).type) for index in range(data_type.num_fields))
+
+
+def as_text(table: pa.Table) -> pa.Table:
+    """Table with temporal columns converted to strings, so every text format writes them the same way."""
+    return pa.table([
+        temporal_text(column.combine_chunks()) if has_temporal(column.type) else column
+        for column in table.columns
+    ], names=table.column_names)
+
+
+def scalar(value: Any) -> Any:
+    """JSON compatible form of values json can't encode."""
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+
+    raise TypeError(f'Value of type {type(value).__name__} is not JSON serializable')
+
+
+def finite(value: Any) -> Any:
+    """Value with non finite floats replaced by "NaN", "Infinity" and "-Infinity" strings."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return 'NaN' if math.isnan(value) else ('Infinity' if value > 0 else '-Infinity')
+    if isinstance(value, dict):
+        return {key: finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [finite(item) for item in value]
+
+    return value
+
+
+def to_json(value: Any) -> str:
+    try:
+        return json.dumps(value, default=scalar, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+    except ValueError:
+        return json.dumps(finite(value), default=scalar, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+
+
+def flatten(table: pa.Table) -> pa.Table:
+    """Structs flattened into <parent>.<child> columns, lists and maps encoded as JSON strings."""
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+
+    return pa.table([
+        pa.array([None if value is None else to_json(value) for value in column.to_pylist(maps_as_pydicts='strict')], pa.string())
+        if pa.types.is_list(column.type) or pa.types.is_map(column.type) else column
+        for column in table.columns
+    ], names=table.column_names)
+
+
+def xml_element(file: TextIO, name: str, value: Any, data_type: pa.DataType) -> None:
+    if value is None:
+        return
+
+    tag = name if XML_NAME.fullmatch(name) else 'field'
+    file.write(f'<{tag}>' if tag == name else f'<field name={quoteattr(name)}>')
+    if pa.types.is_struct(data_type):
+        for field in data_type:
+            xml_element(file, field.name, value[field.name], field.type)
+    elif pa.types.is_map(data_type):
+        for key, item in value:
+            file.write('<entry>')
+            xml_element(file, 'key', key, data_type.key_type)
+            xml_element(file, 'value', item, data_type.item_type)
+            file.write('</entry>')
+    elif pa.types.is_list(data_type):
+        for item in value:
+            xml_element(file, 'item', item, data_type.value_type)
+    elif isinstance(value, bool):
+        file.write('true' if value else 'false')
+    elif isinstance(value, float) and not math.isfinite(value):
+        # xs:double spelling
+        file.write('NaN' if math.isnan(value) else ('INF' if value > 0 else '-INF'))
+    else:
+        file.write(escape(str(value) if isinstance(value, (str, int, float)) else scalar(value)))
+    file.write(f'</{tag}>')
+
+
+def write_csv(path: str, schema: pa.Schema, tables: Iterable[pa.Table]) -> None:
+    writer = None
+    with open(path, 'wb') as file:
+        for table in tables:
+            flat = flatten(as_text(table))
+            writer = writer or csv.CSVWriter(file, flat.schema)
+            writer.write_table(flat)
+        if writer:
+            writer.close()
+
+
+def write_jsonl(path: str, schema: pa.Schema, tables: Iterable[pa.Table]) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        for table in tables:
+            for row in as_text(table).to_pylist(maps_as_pydicts='strict'):
+                file.write(to_json(row))
+                file.write('\n')
+
+
+def write_xml(path: str, schema: pa.Schema, tables: Iterable[pa.Table]) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n<rows>\n')
+        for table in tables:
+            table = as_text(table)
+            row_type = pa.struct(list(table.schema))
+            for row in table.to_pylist():
+                xml_element(file, 'row', row, row_type)
+                file.write('\n')
+        file.write('</rows>\n')
+
+
+def write_arrow(path: str, schema: pa.Schema, tables: Iterable[pa.Table]) -> None:
+    with pa.ipc.new_file(path, schema) as writer:
+        for table in tables:
+            writer.write_table(table)
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'xml': write_xml, 'arrow': write_arrow}
+
+
+def twin_path(path: str, name: str) -> str:
+    return os.path.splitext(path)[0] + FORMATS[name]
+
+
+def write_twins(path: str, formats: Iterable[str] = FORMATS) -> str:
+    """Write every format next to the parquet file and <file>.twins.json with their sizes, returns path of the manifest."""
+    file = pq.ParquetFile(path)
+    rows = file.metadata.num_rows
+    results = {'parquet': {'file': os.path.basename(path), 'bytes': os.path.getsize(path), 'bytes_per_row': round(os.path.getsize(path) / max(rows, 1), 2)}}
+
+    for name in formats:
+        twin = twin_path(path, name)
+        unlink_existing(twin)
+        WRITERS[name](twin, file.schema_arrow, (file.read_row_group(index, use_threads=False) for index in range(file.num_row_groups)))
+        results[name] = {'file': os.path.basename(twin), 'bytes': os.path.getsize(twin), 'bytes_per_row': round(os.path.getsize(twin) / max(rows, 1), 2)}
+
+    return write_manifest(os.path.splitext(path)[0] + '.twins.json', {'file': os.path.basename(path), 'rows': rows, 'formats': results})
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.twins', description='Write CSV, JSON Lines, XML and Arrow IPC twins of parquet files.')
+    parser.add_argument('paths', nargs='+', help='parquet files')
+    parser.add_argument('--format', dest='formats', action='append', choices=FORMATS, help='formats to write, can be repeated (default: all)')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        print(f'{path}: twins written, sizes in {write_twins(path, args.formats or FORMATS)}')
+
+
+if __name__ == '__main__':
+    main()
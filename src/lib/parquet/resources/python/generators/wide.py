@@ -0,0 +1,149 @@
+"""Wide schema files and footer cost report.
+
+Writes files with thousands of leaf columns of a configurable type mix,
+optionally grouped into nested structs, and reports footer size, footer parse
+time and projection read times of every file, so open latency and projection
+cost of the PHP reader can be compared as the schema grows.
+
+Examples:
+    python -m generators.wide
+    python -m generators.wide --columns 1000 20000 --types int64 string --nesting 2 --struct-width 10
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Callable, Iterator
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators import columns, nested
+from generators.datasets import DEFAULT_SEED
+from generators.manifest import best_of, write_manifest
+from generators.writer import footer_size, row_groups, write_batches
+
+started_at = datetime(2024, 1, 1)
+
+# leaf type name: (arrow type, values of n rows starting at given row)
+TYPES: dict[str, tuple[pa.DataType, Callable[[np.random.Generator, int, int, np.ndarray | None], pa.Array]]] = {
+    'int32': (pa.int32(), lambda rng, n_rows, start, valid: columns.integers(rng, n_rows, 0, 1_000_000, valid)),
+    'int64': (pa.int64(), lambda rng, n_rows, start, valid: columns.int64_sequence(n_rows, start, valid)),
+    'double': (pa.float64(), lambda rng, n_rows, start, valid: columns.doubles(rng, n_rows, 0.0, 1000.0, valid)),
+    'bool': (pa.bool_(), lambda rng, n_rows, start, valid: columns.booleans(rng, n_rows, valid)),
+    'string': (pa.string(), lambda rng, n_rows, start, valid: columns.sequence_strings(n_rows, start, valid=valid)),
+    'timestamp': (pa.timestamp('ns'), lambda rng, n_rows, start, valid: columns.timestamps(n_rows, started_at, start, valid=valid)),
+    'decimal': (pa.decimal128(10, 2), lambda rng, n_rows, start, valid: columns.decimals(rng, n_rows, 0.0, 1000.0, valid=valid)),
+}
+DEFAULT_COLUMNS = (1000, 5000, 10000, 20000)
+DEFAULT_TYPES = ('int64', 'double', 'string', 'bool', 'timestamp')
+PROJECTIONS = (1, 10, 100, 1000)
+
+
+def leaf_fields(n_columns: int, types: tuple[str, ...]) -> list[pa.Field]:
+    """Leaf columns cycle through types, every second column is nullable."""
+    return [pa.field(f'c{index:05d}_{types[index % len(types)]}', TYPES[types[index % len(types)]][0], nullable=bool(index % 2)) for index in range(n_columns)]
+
+
+def wide_schema(n_columns: int, types: tuple[str, ...], nesting: int = 0, struct_width: int = 10) -> pa.Schema:
+    """Schema of n_columns leaves, grouped into structs of struct_width fields nesting times."""
+    fields = leaf_fields(n_columns, types)
+    for level in range(nesting):
+        fields = [pa.field(f's{level}_{index:05d}', pa.struct(fields[offset:offset + struct_width])) for index, offset in enumerate(range(0, len(fields), struct_width))]
+
+    return pa.schema(fields)
+
+
+def build(field: pa.Field, leaves: Iterator[pa.Array]) -> pa.Array:
+    if pa.types.is_struct(field.type):
+        return nested.struct_of(field.type, [build(child, leaves) for child in field.type])
+
+    return next(leaves)
+
+
+def generate(schema: pa.Schema, types: tuple[str, ...], n_rows: int, rng: np.random.Generator, start: int = 0) -> pa.RecordBatch:
+    valid = columns.every_other(n_rows, start)
+    leaves = (
+        TYPES[types[index % len(types)]][1](rng, n_rows, start, valid if index % 2 else None)
+        for index in range(len(list(leaf_paths(schema))))
+    )
+
+    return pa.RecordBatch.from_arrays([build(field, leaves) for field in schema], schema=schema)
+
+
+def leaf_paths(schema: pa.Schema | pa.StructType, prefix: str = '') -> Iterator[str]:
+    for field in schema:
+        if pa.types.is_struct(field.type):
+            yield from leaf_paths(field.type, f'{prefix}{field.name}.')
+        else:
+            yield f'{prefix}{field.name}'
+
+
+def report(path: str, repeat: int) -> dict:
+    metadata = pq.read_metadata(path)
+    names = metadata.schema.to_arrow_schema().names
+
+    return {
+        'file': os.path.basename(path),
+        'bytes': os.path.getsize(path),
+        'footer_bytes': footer_size(path),
+        'rows': metadata.num_rows,
+        'row_groups': metadata.num_row_groups,
+        'leaf_columns': metadata.num_columns,
+        'top_level_columns': len(names),
+        'footer_parse_seconds': best_of(repeat, lambda: pq.read_metadata(path)),
+        'schema_parse_seconds': best_of(repeat, lambda: pq.read_schema(path)),
+        'projection_read_seconds': {
+            str(count): best_of(repeat, lambda: pq.read_table(path, columns=names[:count], use_threads=False))
+            for count in PROJECTIONS if count <= len(names)
+        },
+    }
+
+
+def write_wide(path: str, schema: pa.Schema, types: tuple[str, ...], n_rows: int, row_group_size: int, seed: int, **options) -> int:
+    rng = np.random.default_rng(seed)
+
+    return write_batches(path, schema, (generate(schema, types, size, rng, start) for start, size in row_groups(n_rows, row_group_size)), **options)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m generators.wide', description='Write wide schema parquet files and report their footer cost.')
+    parser.add_argument('--columns', type=int, nargs='+', default=DEFAULT_COLUMNS, help=f'number of leaf columns of every file (default: {" ".join(map(str, DEFAULT_COLUMNS))})')
+    parser.add_argument('--types', nargs='+', choices=TYPES, default=DEFAULT_TYPES, help=f'leaf types columns cycle through (default: {" ".join(DEFAULT_TYPES)})')
+    parser.add_argument('--nesting', type=int, default=0, help='number of struct levels leaves are grouped into (default: 0)')
+    parser.add_argument('--struct-width', type=int, default=10, help='number of fields of every struct (default: 10)')
+    parser.add_argument('--rows', type=int, default=1000, help='number of rows (default: 1000)')
+    parser.add_argument('--row-group-size', type=int, default=1000, help='rows per row group (default: 1000)')
+    parser.add_argument('--compression', type=str.upper, default='SNAPPY', help='compression codec (default: SNAPPY)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f'random seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements, the fastest one is reported (default: 5)')
+    parser.add_argument('--out-dir', default='output', help='output directory, files are written into its wide subdirectory (default: output)')
+    args = parser.parse_args(argv)
+
+    directory = os.path.join(args.out_dir, 'wide')
+    os.makedirs(directory, exist_ok=True)
+
+    files = []
+    for n_columns in args.columns:
+        schema = wide_schema(n_columns, tuple(args.types), args.nesting, args.struct_width)
+        path = os.path.join(directory, f'wide-{n_columns}.parquet')
+
+        started = time.perf_counter()
+        # without the serialized arrow schema the footer holds only thrift FileMetaData, like files written by PHP
+        write_wide(path, schema, tuple(args.types), args.rows, args.row_group_size, args.seed, compression=args.compression, store_schema=False)
+        files.append({**report(path, args.repeat), 'write_seconds': round(time.perf_counter() - started, 6)})
+        print(f'{path}: {n_columns} columns, footer {files[-1]["footer_bytes"]} bytes parsed in {files[-1]["footer_parse_seconds"]:.4f}s')
+
+    path = write_manifest(os.path.join(directory, 'wide.report.json'), {
+        'pyarrow': pa.__version__,
+        'types': args.types,
+        'nesting': args.nesting,
+        'struct_width': args.struct_width,
+        'files': files,
+    })
+    print(f'report written to {path}')
+
+
+if __name__ == '__main__':
+    main()
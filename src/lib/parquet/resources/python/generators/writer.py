@@ -0,0 +1,50 @@
+"""Streaming parquet writer.
+
+Datasets are produced one row group at a time and pushed through a single
+long-lived ParquetWriter, so peak memory depends on the row group size and not
+on the total number of rows.
+"""
+import os
+import struct
+from typing import Iterable, Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def row_groups(n_rows: int, row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[tuple[int, int]]:
+    """Yield (first row, number of rows) of every row group."""
+    if row_group_size <= 0:
+        raise ValueError(f'Row group size must be greater than 0, got {row_group_size}')
+
+    for start in range(0, n_rows, row_group_size):
+        yield start, min(row_group_size, n_rows - start)
+
+
+def unlink_existing(path: str) -> None:
+    """Remove path before it is written again, files restored from cache are hard links that must not be written in place."""
+    if os.path.lexists(path):
+        os.remove(path)
+
+
+def write_batches(path: str, schema: pa.Schema, batches: Iterable[pa.RecordBatch | pa.Table], **options) -> int:
+    """Write every batch as a separate row group, returns number of written rows."""
+    unlink_existing(path)
+
+    written = 0
+    with pq.ParquetWriter(path, schema, **options) as writer:
+        for batch in batches:
+            writer.write(batch, row_group_size=batch.num_rows)
+            written += batch.num_rows
+
+    return written
+
+
+def footer_size(path: str) -> int:
+    """Length of the serialized footer, stored right before the closing magic bytes."""
+    with open(path, 'rb') as file:
+        file.seek(-8, 2)
+
+        return struct.unpack('<i', file.read(4))[0]
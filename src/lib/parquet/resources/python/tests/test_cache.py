@@ -0,0 +1,60 @@
+import os
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from generators import cache
+from generators.writer import write_batches
+
+
+def produce(content: str, calls: list[str]):
+    def write(directory: str) -> None:
+        calls.append(directory)
+        with open(os.path.join(directory, 'file.txt'), 'w') as file:
+            file.write(content)
+
+    return write
+
+
+def test_fetch_produces_on_miss_and_restores_on_hit(tmp_path):
+    cache_dir, out_dir = str(tmp_path / 'cache'), str(tmp_path / 'out')
+    calls = []
+
+    assert cache.fetch(cache_dir, 'key', out_dir, produce('first', calls)) is False
+    assert cache.fetch(cache_dir, 'key', out_dir, produce('second', calls)) is True
+    assert len(calls) == 1
+
+    with open(os.path.join(out_dir, 'file.txt')) as file:
+        assert file.read() == 'first'
+
+
+def test_key_changes_with_parameters():
+    assert cache.cache_key({'rows': 10}) == cache.cache_key({'rows': 10})
+    assert cache.cache_key({'rows': 10}) != cache.cache_key({'rows': 11})
+
+
+def test_restored_files_are_not_modified_by_writers(tmp_path):
+    cache_dir, out_dir = str(tmp_path / 'cache'), str(tmp_path / 'out')
+    table = pa.table({'id': [1, 2, 3]})
+
+    cache.fetch(cache_dir, 'key', out_dir, lambda directory: write_batches(os.path.join(directory, 'data.parquet'), table.schema, [table]))
+    restored = os.path.join(out_dir, 'data.parquet')
+    assert os.path.samefile(restored, os.path.join(cache_dir, 'key', 'data.parquet'))
+
+    write_batches(restored, table.schema, [table.slice(0, 1)])
+
+    assert pq.read_table(restored).num_rows == 1
+    assert pq.read_table(os.path.join(cache_dir, 'key', 'data.parquet')).num_rows == 3
+
+
+def test_prune_removes_least_recently_used_entries(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    for age, key in enumerate(['new', 'used', 'old'], start=1):
+        cache.fetch(cache_dir, key, str(tmp_path / 'out'), produce(key * 100, []))
+        os.utime(os.path.join(cache_dir, key), (time.time() - age * 60, time.time() - age * 60))
+
+    cache.fetch(cache_dir, 'old', str(tmp_path / 'out'), produce('unused', []))
+
+    assert cache.prune(cache_dir, 700) == [os.path.join(cache_dir, 'used')]
+    assert sorted(os.listdir(cache_dir)) == ['new', 'old']
@@ -0,0 +1,61 @@
+import datetime
+import decimal
+import hashlib
+
+import pyarrow as pa
+import pytest
+
+from generators.checksums import canonical_type, canonical_value, digest_column, encode
+
+
+def digest(lines: list[bytes]) -> str:
+    return hashlib.sha256(b''.join(line + b'\n' for line in lines)).hexdigest()
+
+
+def digest_by_value(column: pa.Array) -> str:
+    data_type = canonical_type(column.type)
+
+    return hashlib.sha256(b''.join(encode(value, data_type) for value in column.cast(data_type).to_pylist())).hexdigest()
+
+
+@pytest.mark.parametrize('value, data_type, expected', [
+    ([], pa.map_(pa.string(), pa.int32()), {}),
+    ([('b', 1), ('a', 2)], pa.map_(pa.string(), pa.int32()), {'b': 1, 'a': 2}),
+    ([(1, [])], pa.map_(pa.int32(), pa.list_(pa.int32())), {'1': []}),
+    ([], pa.list_(pa.int32()), []),
+    ({'b': None, 'a': [1]}, pa.struct([('a', pa.list_(pa.int32())), ('b', pa.int32())]), {'a': [1], 'b': None}),
+    (datetime.datetime(2024, 1, 2, 3, 4, 5), pa.timestamp('us'), '2024-01-02T03:04:05.000000'),
+    (datetime.date(2024, 1, 2), pa.date32(), '2024-01-02'),
+    (datetime.time(0, 1, 2, 3), pa.time64('us'), 62_000_003),
+    (None, pa.map_(pa.string(), pa.int32()), None),
+])
+def test_canonical_value(value, data_type, expected):
+    assert canonical_value(value, data_type) == expected
+
+
+def test_decimals_are_exact():
+    column = pa.array([decimal.Decimal('12.50'), decimal.Decimal('0.10'), None], pa.decimal128(10, 2))
+
+    assert digest_column(column) == {'digest': digest([b'"12.50"', b'"0.10"', b'null']), 'nulls': 1}
+
+
+def test_empty_map_is_an_object():
+    column = pa.array([[]], pa.map_(pa.string(), pa.int32()))
+
+    assert digest_column(column)['digest'] == digest([b'{}'])
+
+
+@pytest.mark.parametrize('column', [
+    pa.array([1, None, -3], pa.int64()),
+    pa.array([True, None, False]),
+    pa.array(['plain', 'quote " and \\ backslash', 'zażółć /', None]),
+    pa.array(['new\nline', 'tab\t']),
+    pa.array([datetime.datetime(2024, 1, 2, 3, 4, 5, 6), None], pa.timestamp('ns')),
+    pa.array([datetime.datetime(2024, 1, 2, 3, 4, 5, 6)], pa.timestamp('ms', 'UTC')),
+    pa.array([datetime.date(2024, 1, 2), None]),
+    pa.array([datetime.time(1, 2, 3, 4), None], pa.time64('ns')),
+    pa.array([1.5, float('nan'), None]),
+    pa.chunked_array([[1, 2], [3]]),
+])
+def test_vectorized_digest_matches_value_by_value_encoding(column):
+    assert digest_column(column)['digest'] == digest_by_value(column)
@@ -0,0 +1,18 @@
+import numpy as np
+import pyarrow.compute as pc
+import pytest
+
+from generators.dictionaries import fixed, identifiers, strings
+
+
+@pytest.mark.parametrize('length', [2, 8, 16])
+def test_fixed_values_are_distinct(length):
+    ids = identifiers(np.random.default_rng(42), 100_000, 60_000, 'uniform')
+
+    assert pc.count_distinct(fixed(ids, length)).as_py() == 60_000
+    assert pc.count_distinct(strings(ids, length)).as_py() == 60_000
+
+
+def test_fixed_rejects_ids_that_do_not_fit():
+    with pytest.raises(ValueError):
+        fixed(np.arange(300), 1)
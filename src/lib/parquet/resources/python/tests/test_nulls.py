@@ -0,0 +1,93 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from generators.datasets import batches
+from generators.nulls import NullPolicy, Nulls, field_paths, parse_override
+
+
+def rng() -> np.random.Generator:
+    return np.random.default_rng(42)
+
+
+def run_lengths(valid: np.ndarray) -> np.ndarray:
+    """Lengths of runs of nulls."""
+    edges = np.flatnonzero(np.diff(np.concatenate([[1], valid.astype(np.int8), [1]])))
+
+    return edges[1::2] - edges[0::2]
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    ('alternating', Nulls('alternating')),
+    ('bernoulli:0.1', Nulls('bernoulli', 0.1)),
+    ('runs:0.25:100', Nulls('runs', 0.25, 100.0)),
+])
+def test_parse(pattern, expected):
+    assert Nulls.parse(pattern) == expected
+    assert str(Nulls.parse(pattern)) == pattern
+
+
+@pytest.mark.parametrize('pattern', ['sometimes', 'bernoulli:1.5', 'runs:0.5:0.5', 'runs:0.5:8:1'])
+def test_parse_invalid(pattern):
+    with pytest.raises(ValueError):
+        Nulls.parse(pattern)
+
+
+def test_alternating_nulls_depend_on_position():
+    assert Nulls().valid(rng(), 4).tolist() == [True, False, True, False]
+    assert Nulls().valid(rng(), 4, start=1).tolist() == [False, True, False, True]
+
+
+@pytest.mark.parametrize('kind', ['bernoulli', 'runs'])
+@pytest.mark.parametrize('ratio', [0.01, 0.5, 0.9])
+def test_share_of_nulls(kind, ratio):
+    valid = Nulls(kind, ratio).valid(rng(), 200_000)
+
+    assert len(valid) == 200_000
+    assert abs((1 - valid.mean()) - ratio) < 0.02
+
+
+@pytest.mark.parametrize('kind', ['bernoulli', 'runs'])
+def test_no_and_only_nulls(kind):
+    assert Nulls(kind, 0.0).valid(rng(), 100).all()
+    assert not Nulls(kind, 1.0).valid(rng(), 100).any()
+
+
+def test_runs_of_nulls():
+    valid = Nulls('runs', 0.5, 50.0).valid(rng(), 200_000)
+
+    assert 40 < run_lengths(valid).mean() < 60
+    assert run_lengths(Nulls('bernoulli', 0.5).valid(rng(), 200_000)).mean() < 3
+
+
+def test_column_override_comes_first():
+    policy = NullPolicy(Nulls('bernoulli', 0.0), dict([parse_override('a=bernoulli:1')]))
+
+    assert not policy.valid('a', rng(), 10).any()
+    assert policy.valid('b', rng(), 10).all()
+    assert not policy.valid('b', rng(), 10, fallback=Nulls('bernoulli', 1.0)).any()
+
+
+def test_nulls_are_placed_in_generated_columns():
+    policy = NullPolicy(Nulls('bernoulli', 0.0), {'int32_nullable': Nulls('bernoulli', 1.0), 'struct_flat.string_nullable': Nulls('bernoulli', 1.0)})
+    primitives = next(batches('primitives', 100, 100, nulls=policy))
+    structs = next(batches('structs', 100, 100, nulls=policy))
+
+    assert primitives.column('int32_nullable').null_count == 100
+    assert primitives.column('int64_nullable').null_count == 0
+    assert pc.struct_field(structs.column('struct_flat'), 'string_nullable').null_count == 100
+    assert pc.struct_field(structs.column('struct_flat'), 'int_nullable').null_count == 0
+
+
+def test_alternating_nulls_of_dataset_follow_row_position():
+    first, second = batches('primitives', 6, 3)
+
+    assert first.column('int32_nullable').is_valid().to_pylist() == [True, False, True]
+    assert second.column('int32_nullable').is_valid().to_pylist() == [False, True, False]
+
+
+def test_field_paths():
+    schema = pa.schema([('id', pa.int64()), ('address', pa.struct([('city', pa.string()), ('location', pa.struct([('lat', pa.float64())]))]))])
+
+    assert field_paths(schema) == ['id', 'address', 'address.city', 'address.location', 'address.location.lat']
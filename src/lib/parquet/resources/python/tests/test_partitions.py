@@ -0,0 +1,70 @@
+import datetime
+
+import pyarrow as pa
+import pytest
+
+from generators.partitions import DEFAULT_PARTITION, PartitionKey, escape, file_sizes
+
+SCHEMA = pa.schema([
+    ('created_at', pa.timestamp('us')),
+    ('total', pa.float64()),
+    ('tags', pa.list_(pa.string())),
+    ('address', pa.struct([('country', pa.string())])),
+])
+
+
+@pytest.mark.parametrize('key, expected', [
+    ('country', PartitionKey('country', 'country')),
+    ('address.country', PartitionKey('country', 'address.country')),
+    ('region=address.country', PartitionKey('region', 'address.country')),
+    ('created_at:date', PartitionKey('date', 'created_at', 'date')),
+    ('day=created_at:date', PartitionKey('day', 'created_at', 'date')),
+])
+def test_parse(key, expected):
+    assert PartitionKey.parse(key) == expected
+
+
+def test_parse_unknown_transform():
+    with pytest.raises(ValueError):
+        PartitionKey.parse('created_at:week')
+
+
+def test_str_round_trip():
+    key = PartitionKey.parse('day=created_at:date')
+
+    assert PartitionKey.parse(str(key)) == key
+
+
+@pytest.mark.parametrize('key', ['created_at', 'created_at:date', 'address.country', 'total'])
+def test_validate(key):
+    PartitionKey.parse(key).validate(SCHEMA)
+
+
+@pytest.mark.parametrize('key', ['missing', 'address.city', 'total.country', 'tags', 'address', 'total:date', 'address.country:year'])
+def test_validate_invalid(key):
+    with pytest.raises(ValueError):
+        PartitionKey.parse(key).validate(SCHEMA)
+
+
+def test_values():
+    table = pa.table({
+        'created_at': pa.array([datetime.datetime(2024, 1, 2, 3), None], pa.timestamp('us')),
+        'address': pa.array([{'country': 'Poland'}, {'country': None}]),
+    })
+
+    assert PartitionKey.parse('created_at:hour').values(table).to_pylist() == ['2024-01-02-03', DEFAULT_PARTITION]
+    assert PartitionKey.parse('address.country').values(table).to_pylist() == ['Poland', DEFAULT_PARTITION]
+
+
+def test_escape():
+    assert escape('a/b=c d') == 'a%2Fb%3Dc d'
+
+
+@pytest.mark.parametrize('n_rows, files_per_partition, max_rows_per_file, expected', [
+    (10, 1, None, [10]),
+    (10, 3, None, [4, 3, 3]),
+    (2, 3, None, [1, 1]),
+    (10, 2, 3, [3, 2, 3, 2]),
+])
+def test_file_sizes(n_rows, files_per_partition, max_rows_per_file, expected):
+    assert file_sizes(n_rows, files_per_partition, max_rows_per_file) == expected
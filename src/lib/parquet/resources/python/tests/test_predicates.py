@@ -0,0 +1,69 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from generators.predicates import Predicate, oracle
+
+SCHEMA = pa.schema([('id', pa.int64()), ('name', pa.string()), ('tags', pa.list_(pa.string()))])
+
+
+@pytest.mark.parametrize('predicate, expected', [
+    ('id < 10', Predicate('id', '<', 10)),
+    ('id <= 10', Predicate('id', '<=', 10)),
+    ('id >= -1.5', Predicate('id', '>=', -1.5)),
+    ('name == name_42', Predicate('name', '==', 'name_42')),
+    ('name != "a b"', Predicate('name', '!=', 'a b')),
+    ('created_at > 2024-01-01T00:00:00', Predicate('created_at', '>', '2024-01-01T00:00:00')),
+])
+def test_parse(predicate, expected):
+    assert Predicate.parse(predicate) == expected
+
+
+@pytest.mark.parametrize('predicate', ['id', 'id<10', 'id ~ 10'])
+def test_parse_invalid(predicate):
+    with pytest.raises(ValueError):
+        Predicate.parse(predicate)
+
+
+@pytest.mark.parametrize('predicate, minimum, maximum, excluded', [
+    ('id == 5', 1, 4, True),
+    ('id == 5', 1, 5, False),
+    ('id == 5', 6, 9, True),
+    ('id != 5', 5, 5, True),
+    ('id != 5', 4, 5, False),
+    ('id < 5', 5, 9, True),
+    ('id < 5', 4, 9, False),
+    ('id <= 5', 5, 9, False),
+    ('id > 5', 1, 5, True),
+    ('id >= 5', 1, 5, False),
+    ('id == 5', None, None, True),
+])
+def test_excluded(predicate, minimum, maximum, excluded):
+    predicate = Predicate.parse(predicate)
+
+    assert predicate.excluded(minimum, maximum, predicate.value) is excluded
+
+
+@pytest.mark.parametrize('predicate', ['missing == 1', 'tags == a', 'id == abc'])
+def test_validate(predicate):
+    with pytest.raises(ValueError):
+        Predicate.parse(predicate).validate(SCHEMA)
+
+
+def test_oracle(tmp_path):
+    path = str(tmp_path / 'file.parquet')
+    pq.write_table(pa.table({'id': pa.array(range(100), pa.int64())}), path, row_group_size=25, write_page_index=True, max_rows_per_page=10)
+
+    result = oracle(path, [Predicate.parse('id < 30')])['predicates'][0]
+
+    assert [row_group['matching_rows'] for row_group in result['row_groups']] == [25, 5, 0, 0]
+    assert [row_group['skip_by_statistics'] for row_group in result['row_groups']] == [False, False, True, True]
+    assert [page['first_row'] for page in result['row_groups'][1]['pages']] == [0, 10, 20]
+    assert [page['skip'] for page in result['row_groups'][1]['pages']] == [False, True, True]
+
+
+def test_oracle_of_file_without_row_groups(tmp_path):
+    path = str(tmp_path / 'file.parquet')
+    pq.ParquetWriter(path, SCHEMA).close()
+
+    assert oracle(path, [Predicate.parse('id < 30')])['predicates'][0]['row_groups'] == []
@@ -0,0 +1,57 @@
+import os
+from glob import glob
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from generators import shards
+from generators.datasets import batches, dataset
+from generators.writer import write_batches
+
+ROWS = 2_500
+ROW_GROUP_SIZE = 500
+
+
+def read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+@pytest.mark.parametrize('n_rows, n_shards, expected', [
+    (2_500, 2, [(0, 1_500), (1_500, 1_000)]),
+    (2_500, 5, [(0, 500), (500, 500), (1_000, 500), (1_500, 500), (2_000, 500)]),
+    (2_500, 10, [(0, 500), (500, 500), (1_000, 500), (1_500, 500), (2_000, 500)]),
+    (100, 3, [(0, 100)]),
+])
+def test_split_is_aligned_to_row_groups(n_rows, n_shards, expected):
+    assert shards.split(n_rows, n_shards, ROW_GROUP_SIZE) == expected
+
+
+@pytest.mark.parametrize('name', ['primitives', 'orders', 'maps'])
+def test_output_does_not_depend_on_number_of_workers(tmp_path, name):
+    single, merged = str(tmp_path / 'single.parquet'), str(tmp_path / 'merged.parquet')
+
+    write_batches(single, dataset(name).schema, batches(name, ROWS, ROW_GROUP_SIZE, seed=7))
+    shards.write_merged(name, merged, ROWS, ROW_GROUP_SIZE, workers=2, seed=7)
+
+    assert read(single) == read(merged)
+
+
+def test_shards_concatenate_to_merged_file(tmp_path):
+    merged = str(tmp_path / 'orders.parquet')
+    shards.write_merged('orders', merged, ROWS, ROW_GROUP_SIZE, workers=2, seed=7)
+
+    paths = shards.write_files('orders', str(tmp_path), ROWS, ROW_GROUP_SIZE, n_shards=3, workers=2, seed=7)
+
+    assert len(paths) == 3
+    assert pa.concat_tables(pq.read_table(path) for path in paths).equals(pq.read_table(merged))
+
+
+def test_shards_of_previous_run_are_removed(tmp_path):
+    shards.write_files('primitives', str(tmp_path), ROWS, ROW_GROUP_SIZE, n_shards=5, workers=1)
+    open(os.path.join(tmp_path, 'primitives-00004.checksums.json'), 'w').close()
+
+    paths = shards.write_files('primitives', str(tmp_path), ROWS, ROW_GROUP_SIZE, n_shards=2, workers=1)
+
+    assert sorted(glob(os.path.join(tmp_path, 'primitives-*'))) == sorted(paths)
@@ -0,0 +1,88 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from generators import thrift
+
+
+def write(path, **options) -> str:
+    table = pa.table({'id': pa.array(range(1000), pa.int64()), 'name': pa.array([f'name_{index % 10}' for index in range(1000)])})
+    pq.write_table(table, path, row_group_size=400, **options)
+
+    return str(path)
+
+
+def test_struct_of_every_compact_type():
+    data = bytes([
+        0x15, 0x05,  # field 1, i32 -3
+        0x28, 0x02, *b'ab',  # field 3, binary "ab"
+        0x19, 0x25, 0x02, 0x04,  # field 4, list of two i32: 1, 2
+        0x11,  # field 5, boolean true
+        0x05, 0x28, 0xAC, 0x02,  # field 20 with long form header, i32 150
+        0x1B, 0x01, 0x85, 0x01, *b'a', 0x04,  # field 21, map of one binary key "a" to i32 2
+        0x1C, 0x16, 0xE8, 0x07, 0x00,  # field 22, struct with field 1 i64 500
+        0x00,
+    ])
+
+    assert thrift.decode(data) == {1: -3, 3: b'ab', 4: [1, 2], 5: True, 20: 150, 21: {b'a': 2}, 22: {1: 500}}
+
+
+def test_list_of_booleans_and_long_list():
+    booleans = thrift.Reader(bytes([0x31, 0x01, 0x02, 0x01])).list()
+    long = thrift.Reader(bytes([0xF5, 0x10, *[0x02] * 16])).list()
+
+    assert booleans == [True, False, True]
+    assert long == [1] * 16
+
+
+def test_footer_matches_pyarrow_metadata(tmp_path):
+    path = write(tmp_path / 'file.parquet', compression='ZSTD')
+    metadata = pq.read_metadata(path)
+    footer = thrift.footer(path)
+
+    assert footer[3] == metadata.num_rows
+    assert [row_group[3] for row_group in footer[4]] == [metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)]
+    assert [b'.'.join(chunk[3][3]).decode() for chunk in footer[4][0][1]] == ['id', 'name']
+    assert {thrift.CODECS[chunk[3][4]] for row_group in footer[4] for chunk in row_group[1]} == {'ZSTD'}
+
+
+def test_footer_of_not_parquet_file(tmp_path):
+    path = tmp_path / 'file.parquet'
+    path.write_bytes(b'PAR1 not really a parquet file')
+
+    with pytest.raises(ValueError):
+        thrift.footer(str(path))
+
+
+@pytest.mark.parametrize('data_page_version, data_page', [('1.0', 'DATA_PAGE'), ('2.0', 'DATA_PAGE_V2')])
+def test_pages_are_read_from_page_headers(tmp_path, data_page_version, data_page):
+    path = write(tmp_path / 'file.parquet', data_page_version=data_page_version, write_page_index=True, max_rows_per_page=100)
+    chunk = thrift.footer(path)[4][0][1][1]
+
+    pages = thrift.pages(path, chunk)
+
+    assert pages[0]['type'] == 'DICTIONARY_PAGE'
+    assert pages[0]['encoding'] == 'PLAIN'
+    assert {page['type'] for page in pages[1:]} == {data_page}
+    assert {page['encoding'] for page in pages[1:]} == {'RLE_DICTIONARY'}
+    assert len(pages) - 1 == len(thrift.offset_index(path, chunk))
+
+
+def test_page_indexes(tmp_path):
+    path = write(tmp_path / 'file.parquet', write_page_index=True, max_rows_per_page=100)
+    chunk = thrift.footer(path)[4][0][1][0]
+
+    locations = thrift.offset_index(path, chunk)
+    index = thrift.column_index(path, chunk)
+
+    assert [location['first_row_index'] for location in locations] == [0, 100, 200, 300]
+    assert index['null_pages'] == [False] * 4
+    assert index['null_counts'] == [0] * 4
+
+
+def test_page_indexes_of_file_without_them(tmp_path):
+    path = write(tmp_path / 'file.parquet')
+    chunk = thrift.footer(path)[4][0][1][0]
+
+    assert thrift.offset_index(path, chunk) is None
+    assert thrift.column_index(path, chunk) is None